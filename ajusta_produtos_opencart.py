@@ -1,7 +1,64 @@
 # Importações
+import os
+import sqlite3
+import argparse
+from typing import Iterator, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from selenium import webdriver
 from libraries import opencart
+from libraries import opencart_http
+from libraries import opencart_db
+from libraries import planilhas
+from libraries import historico
+from libraries import desempenho
+from libraries import navegadores
+
+# Dados de acesso e planilha - ALTERE AQUI CONFORME NECESSÁRIO
+LOGIN_URL = "https://urldelogin.com"
+USERNAME = "ALTERE AQUI"
+PASSWORD = "ALTERE AQUI"
+PLANILHA = "ALTERE AQUI.xlsx"
+
+# Banco de dados da Opencart (modo banco) - ALTERE AQUI CONFORME NECESSÁRIO
+DB_HOST = "ALTERE AQUI"
+DB_USUARIO = "ALTERE AQUI"
+DB_SENHA = "ALTERE AQUI"
+DB_NOME = "ALTERE AQUI"
+
+# Coluna da planilha de cada campo do produto
+COLUNAS = {
+    'id': 'ID',
+    'meta_titulo': 'Meta titulo',
+    'meta_descricao': 'Meta Descrição',
+    'palavra_chave': 'Meta palavras chaves',
+    'produtos_relacionados': 'Produtos Relacionados',
+    'compre_junto': 'Compre Junto',
+    'p_fisica': 'pessoa fisica',
+    'p_juridica': 'pessoa juridica',
+    'p_revenda': 'pessoa juridica revenda',
+    'slug': 'Padrão',
+    'status': 'status',
+}
+
+
+# Produto da planilha
+class Produto(NamedTuple):
+    """Linha da planilha convertida uma única vez por `planilhas.criar_registros()`.
+    `linha` é a posição do produto na planilha, usada para gravar o status."""
+    linha: int
+    id: str
+    meta_titulo: str
+    meta_descricao: str
+    palavra_chave: str
+    produtos_relacionados: str
+    compre_junto: str
+    p_fisica: str
+    p_juridica: str
+    p_revenda: str
+    slug: str
+    status: str
+    dados: dict  # Dados que identificam o ajuste no histórico de operações
 
 # Função login
 def login(driver: webdriver.Chrome) -> str:
@@ -13,73 +70,258 @@ def login(driver: webdriver.Chrome) -> str:
     # Logando no Tiny
     try:
         url_product_opencart = opencart.login_opencart(
-            driver, login_url="https://urldelogin.com", username="ALTERE AQUI", password="ALTERE AQUI")
+            driver, login_url=LOGIN_URL, username=USERNAME, password=PASSWORD)
     except Exception as e:
         raise RuntimeError(f"Erro ao fazer login no Tiny - {e}") from e
     return url_product_opencart
 
 
-def setup() -> tuple[webdriver.Chrome, pd.DataFrame]:
+def setup(navegador: bool = True, planilha: bool = True) -> tuple[webdriver.Chrome | None, pd.DataFrame | None, str | None]:
     """Função de inicialização de váriavies fixa do código e organização.
 
+    Args:
+        navegador (bool, optional): Cria o navegador e faz o login. O modo HTTP não precisa
+        do navegador. Defaults to True.
+        planilha (bool, optional): Lê a planilha inteira. O modo navegador lê a planilha em lotes
+        com `ler_lotes()`, começando pelos primeiros produtos. Defaults to True.
+
     Returns:
-        tuple[webdriver.Chrome, pd.DataFrame]: Retorna todas as váriaves inicializadas e organizadas.
+        tuple[webdriver.Chrome | None, pd.DataFrame, str | None]: Retorna todas as váriaves inicializadas e organizadas.
     """
-    driver = webdriver.Chrome()
+    driver = navegadores.criar_navegador('opencart') if navegador else None
 
-    # Lendo a planilha dos produtos a serem excluídos
-    # ALTERE AQUI CONFORME NECESSÁRIO
-    produtos_df = pd.read_excel("ALTERE AQUI.xlsx")
-    if "status" not in produtos_df.columns:
-        produtos_df["status"] = '-'
+    # Lendo a planilha dos produtos e tratando os tipos de dados (em cache enquanto a planilha não mudar)
+    produtos_df = planilhas.ler_planilha(PLANILHA, tipos=str, padroes={'status': '-'}) if planilha else None
 
-    # Tratando os tipos de dados
-    produtos_df = produtos_df.astype(str)
-
-    url_product_opencart = login(driver)
+    url_product_opencart = login(driver) if navegador else None
 
     return driver, produtos_df, url_product_opencart
 
 
-def main():
+# Função ler lotes
+def ler_lotes() -> Iterator[pd.DataFrame]:
+    """Lê a planilha em lotes tratados, com os mesmos tipos do `setup()`.
+
+    Yields:
+        Iterator[pd.DataFrame]: Lotes da planilha
+    """
+    return planilhas.ler_planilha_em_lotes(PLANILHA, tipos=str, padroes={'status': '-'})
+
+
+# Função criar produtos
+def criar_produtos(df: pd.DataFrame) -> list[Produto]:
+    """Converte a planilha (ou um lote) nos produtos, junto com os dados que identificam o ajuste
+    de cada produto no histórico de operações (valor de cada coluna, sem a coluna `status`).
+
+    Args:
+        df (pd.DataFrame): Planilha ou lote dos produtos
+
+    Returns:
+        list[Produto]: Produtos da planilha
+    """
+    return planilhas.criar_registros(df, Produto, COLUNAS, dados=df.drop(columns='status').to_dict('records'))
+
+
+def main(modo: str = "navegador",
+         workers: int = 8,
+         dry_run: bool = False,
+         sqlite: str | None = None,
+         refazer: bool = False,
+         preenchimento: str = "rapido"):
     """Função principal
+
+    Args:
+        modo (str, optional): "navegador" edita pelo Selenium, "http" edita pelo painel
+        via HTTP, sem navegador, e "banco" grava direto no banco da Opencart. Defaults to "navegador".
+        workers (int, optional): Quantidade de produtos editados ao mesmo tempo no modo "http". Defaults to 8.
+        dry_run (bool, optional): No modo "banco", somente mostra as alterações. Defaults to False.
+        sqlite (str | None, optional): No modo "banco", usa um banco SQLite local ao invés do MySQL. Defaults to None.
+        refazer (bool, optional): Ignora o histórico de operações e ajusta novamente os produtos. Defaults to False.
+        preenchimento (str, optional): No modo "navegador", "rapido" preenche os campos de SEO de uma vez
+        pelo JavaScript e "teclado" digita campo a campo. Defaults to "rapido".
     """
-    driver, produtos_df, url_product_opencart = setup()
-
-    for i, row in produtos_df.iterrows():
-        product_id = row['ID']
-        meta_tittle = row['Meta titulo']
-        meta_descricao = row['Meta Descrição']
-        palavra_chave = row['Meta palavras chaves']
-        produtos_relacionados = row['Produtos Relacionados']
-        compre_junto = row['Compre Junto']
-        p_fisica = row['pessoa fisica']
-        p_juridica = row['pessoa juridica']
-        p_revenda = row['pessoa juridica revenda']
-        slug = row['Padrão']
-
-        print(F"ACESSNDO O PRODUTO: {meta_tittle}")
-        opencart.acessar_produto_opencart(
-            driver, url_product_opencart, product_id)
-        opencart.ajustar_zoom(driver)
-        print("ATUALIZANDO O META TITULO")
-        opencart.atualizar_meta_titulo(driver, meta_tittle)
-        print("ATUALIZANDO A META DESCRIÇÃO")
-        opencart.atualizar_descricao(driver, meta_descricao)
-        print("ATUALIZANDO AS PALAVRAS CHAVES")
-        opencart.atualziar_palavra_chave(driver, palavra_chave)
-        print("ATUALIZANDO OS PRODUTOS RELACIONADOS")
-        opencart.atualizar_produtos_relacionados(
-            driver, produtos_relacionados)
-        print("ATUALIZANDO OS PRODUTOS COMPRE JUNTO")
-        opencart.atualizar_compre_junto(driver, compre_junto)
-        print("ATUALIZANDO AS PROMOÇÕES")
-        opencart.atualizar_promocoes(
-            driver, p_fisica, p_juridica, p_revenda)
-        print("ATUALIZANDO O SLUG")
-        opencart.atualizar_slug(driver, slug)
-        print("SALVANDO AS ALTERAÇÕES")
-        opencart.salvar_altercoes(driver)
-
-
-main()
+    if modo == "http":
+        main_http(workers, refazer)
+        return
+    if modo == "banco":
+        main_banco(dry_run, sqlite, refazer)
+        return
+
+    driver, _, url_product_opencart = setup(planilha=False)
+    operacoes = historico.HistoricoOperacoes(refazer=refazer)
+
+    # Os produtos do primeiro lote já são ajustados enquanto o restante da planilha é lido
+    for lote in ler_lotes():
+        for produto in criar_produtos(lote):
+            product_id = produto.id
+            dados = produto.dados
+            if operacoes.ja_feito('opencart', product_id, 'ajustar_produto', dados):
+                print(f"PRODUTO JÁ AJUSTADO ANTERIORMENTE: {product_id}")
+                continue
+            desempenho.definir_sku(product_id)
+
+            meta_tittle = produto.meta_titulo
+            meta_descricao = produto.meta_descricao
+            palavra_chave = produto.palavra_chave
+            produtos_relacionados = produto.produtos_relacionados
+            compre_junto = produto.compre_junto
+            p_fisica = produto.p_fisica
+            p_juridica = produto.p_juridica
+            p_revenda = produto.p_revenda
+            slug = produto.slug
+
+            print(F"ACESSNDO O PRODUTO: {meta_tittle}")
+            opencart.acessar_produto_opencart(
+                driver, url_product_opencart, product_id)
+            if preenchimento == "rapido":
+                print("ATUALIZANDO O SEO (META TITULO, DESCRIÇÃO, PALAVRAS CHAVES E SLUG)")
+                teclado = opencart.preencher_seo(driver, meta_tittle, meta_descricao, palavra_chave, slug)
+                if teclado:
+                    print(f"CAMPOS PREENCHIDOS PELO TECLADO: {', '.join(teclado)}")
+            else:
+                opencart.ajustar_zoom(driver)
+                print("ATUALIZANDO O META TITULO")
+                opencart.atualizar_meta_titulo(driver, meta_tittle)
+                print("ATUALIZANDO A META DESCRIÇÃO")
+                opencart.atualizar_descricao(driver, meta_descricao)
+                print("ATUALIZANDO AS PALAVRAS CHAVES")
+                opencart.atualziar_palavra_chave(driver, palavra_chave)
+            print("ATUALIZANDO OS PRODUTOS RELACIONADOS")
+            opencart.atualizar_produtos_relacionados(
+                driver, produtos_relacionados)
+            print("ATUALIZANDO OS PRODUTOS COMPRE JUNTO")
+            opencart.atualizar_compre_junto(driver, compre_junto)
+            print("ATUALIZANDO AS PROMOÇÕES")
+            opencart.atualizar_promocoes(
+                driver, p_fisica, p_juridica, p_revenda)
+            if preenchimento != "rapido":
+                print("ATUALIZANDO O SLUG")
+                opencart.atualizar_slug(driver, slug)
+            print("SALVANDO AS ALTERAÇÕES")
+            opencart.salvar_altercoes(driver)
+            operacoes.registrar('opencart', product_id, 'ajustar_produto', dados)
+            navegadores.contabilizar_bloqueios(driver, 'opencart')
+
+    operacoes.fechar()
+
+
+# Função principal - modo HTTP
+def main_http(workers: int = 8, refazer: bool = False):
+    """Edita os produtos pelo painel da Opencart via HTTP, vários produtos ao mesmo tempo.
+    O status de cada produto é gravado na coluna `status` da planilha.
+
+    Args:
+        workers (int, optional): Quantidade de produtos editados ao mesmo tempo. Defaults to 8.
+        refazer (bool, optional): Ignora o histórico de operações e ajusta novamente os produtos. Defaults to False.
+    """
+    _, produtos_df, _ = setup(navegador=False)
+    diario = planilhas.DiarioStatus(produtos_df, PLANILHA, coluna_chave='ID')
+    operacoes = historico.HistoricoOperacoes(refazer=refazer)
+
+    cliente = opencart_http.OpencartHTTP(workers=workers)
+    cliente.login(USERNAME, PASSWORD)
+
+    def ajustar(produto: Produto) -> str | None:
+        try:
+            cliente.atualizar_produto(
+                produto.id,
+                meta_titulo=produto.meta_titulo,
+                meta_descricao=produto.meta_descricao,
+                palavra_chave=produto.palavra_chave,
+                produtos_relacionados=produto.produtos_relacionados,
+                compre_junto=produto.compre_junto,
+                promocoes=(produto.p_fisica, produto.p_juridica, produto.p_revenda),
+                slug=produto.slug)
+        except RuntimeError as e:
+            return str(e)
+        return None
+
+    pendentes = []
+    for produto in criar_produtos(produtos_df):
+        if 'FEITO' in produto.status:
+            continue
+        if operacoes.ja_feito('opencart', produto.id, 'ajustar_produto', produto.dados):
+            diario.registrar(produto.id, 'status', 'FEITO', produto.linha)
+            continue
+        pendentes.append(produto)
+
+    print(f"AJUSTANDO {len(pendentes)} PRODUTOS POR HTTP - OPENCART")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for produto, erro in zip(pendentes, executor.map(ajustar, pendentes)):
+            if erro:
+                print(erro)
+            else:
+                operacoes.registrar('opencart', produto.id, 'ajustar_produto', produto.dados)
+            diario.registrar(produto.id, 'status', 'ERRO' if erro else 'FEITO', produto.linha)
+
+    diario.fechar()
+    operacoes.fechar()
+
+
+# Função principal - modo banco
+def main_banco(dry_run: bool = False, sqlite: str | None = None, refazer: bool = False):
+    """Aplica a planilha inteira direto no banco da Opencart, em lotes e com transações.
+    As alterações são mostradas e salvas em `alteracoes_opencart.csv`.
+
+    Args:
+        dry_run (bool, optional): Somente mostra as alterações, sem gravar. Defaults to False.
+        sqlite (str | None, optional): Caminho de um banco SQLite local para testes. Defaults to None.
+        refazer (bool, optional): Ignora o histórico de operações e ajusta novamente os produtos. Defaults to False.
+    """
+    _, produtos_df, _ = setup(navegador=False)
+    operacoes = historico.HistoricoOperacoes(refazer=refazer)
+
+    # Os produtos já ajustados com os mesmos dados, em qualquer modo, não são comparados com o banco
+    pendentes = [produto for produto in criar_produtos(produtos_df)
+                 if not operacoes.ja_feito('opencart', produto.id, 'ajustar_produto', produto.dados)]
+    if len(pendentes) < len(produtos_df):
+        print(f"{len(produtos_df) - len(pendentes)} PRODUTOS JÁ AJUSTADOS ANTERIORMENTE - OPENCART")
+    produtos_df = produtos_df.loc[[produto.linha for produto in pendentes]]
+
+    if sqlite:
+        conexao = sqlite3.connect(sqlite)
+    else:
+        try:
+            import pymysql
+        except ImportError as e:
+            raise RuntimeError("Instale o pymysql para usar o modo banco: pip install pymysql") from e
+        conexao = pymysql.connect(host=DB_HOST, user=DB_USUARIO, password=DB_SENHA, database=DB_NOME, charset='utf8mb4')
+
+    try:
+        alteracoes = opencart_db.OpencartDB(conexao).aplicar(produtos_df, dry_run=dry_run)
+    finally:
+        conexao.close()
+
+    if not dry_run:
+        # Os produtos com aviso (ID inválido, produto ou relacionado não encontrado) ficam fora do histórico
+        avisos = set(alteracoes.loc[alteracoes['campo'] == 'aviso', 'ID'])
+        ajustados = [(produto.id, produto.dados) for produto in pendentes
+                     if opencart_db.id_produto(produto.id) not in avisos | {None}]
+        operacoes.registrar_lote('opencart', 'ajustar_produto', ajustados)
+    operacoes.fechar()
+
+    print(alteracoes.to_string(max_colwidth=60))
+    alteracoes.to_csv('alteracoes_opencart.csv', index=False)
+    print(f"{len(alteracoes)} ALTERAÇÕES {'ENCONTRADAS (DRY-RUN)' if dry_run else 'APLICADAS'} - OPENCART")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ajusta os produtos da Opencart conforme a planilha.")
+    parser.add_argument("--modo", choices=["navegador", "http", "banco"], default="navegador",
+                        help="Edita os produtos pelo navegador, pelo painel via HTTP ou direto no banco. Defaults to navegador.")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Quantidade de produtos editados ao mesmo tempo no modo http. Defaults to 8.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="No modo banco, somente mostra as alterações, sem gravar.")
+    parser.add_argument("--sqlite", default=None,
+                        help="No modo banco, caminho de um banco SQLite local para testes.")
+    parser.add_argument("--refazer", action="store_true",
+                        help="Ignora o histórico de operações e ajusta novamente os produtos já ajustados.")
+    parser.add_argument("--preenchimento", choices=["rapido", "teclado"], default="rapido",
+                        help="No modo navegador, preenche os campos de SEO de uma vez (rapido) ou digitando (teclado). Defaults to rapido.")
+    parser.add_argument("--perfil-navegador", choices=list(navegadores.PERFIS), default=None,
+                        help="Perfil do navegador usado no lugar do perfil padrão, para comparar os perfis no relatório de desempenho.")
+    args = parser.parse_args()
+    if args.perfil_navegador:
+        os.environ[navegadores.VARIAVEL_PERFIL] = args.perfil_navegador
+    main(args.modo, args.workers, args.dry_run, args.sqlite, args.refazer, args.preenchimento)
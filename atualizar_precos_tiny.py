@@ -1,20 +1,74 @@
 # Importações
+import os
 import logging
+import argparse
+import functools
+import operator
+from typing import Callable, NamedTuple
 import pandas as pd
 from selenium import webdriver
 from libraries import tiny
 from libraries import planilhas
+from libraries import paralelo
+from libraries import tiny_api
+from libraries import historico
+from libraries import desempenho
+from libraries import navegadores
+
+# Listas de preço no formato (ID da lista, coluna do preço, coluna do preço promocional) - ALTERE AQUI
+LISTAS_PRECO = [
+    ("ALTERE AQUI", "Preço", "Preço promocional"),  # Site
+    ("ALTERE AQUI", "Lp-Mkp", "Lp-Mkp Promocional"),  # Marketplaces
+    ("ALTERE AQUI", "Revenda", "Revenda Promocional"),  # Revenda
+]
+
+# Colunas de preço, usadas para identificar a atualização no histórico de operações
+COLUNAS_PRECO = ["Preço", "Preço promocional", "Lp-Mkp", "Lp-Mkp Promocional", "Revenda", "Revenda Promocional"]
+
+# Coluna da planilha de cada campo do produto
+COLUNAS = {
+    "id": "ID",
+    "sku": "SKU",
+    "preco": "Preço",
+    "preco_promocional": "Preço promocional",
+    "mkp": "Lp-Mkp",
+    "mkp_promocional": "Lp-Mkp Promocional",
+    "revenda": "Revenda",
+    "revenda_promocional": "Revenda Promocional",
+}
+CAMPOS = {coluna: campo for campo, coluna in COLUNAS.items()}
+
+
+# Produto da planilha
+class Produto(NamedTuple):
+    """Linha da planilha convertida uma única vez por `planilhas.criar_registros()`.
+    `linha` é a posição do produto na planilha, usada para gravar o status."""
+    linha: int
+    id: str
+    sku: str
+    preco: float
+    preco_promocional: float
+    mkp: float
+    mkp_promocional: float
+    revenda: float
+    revenda_promocional: float
+
+    def valor(self, coluna: str):
+        """Valor do produto pelo nome da coluna da planilha."""
+        return getattr(self, CAMPOS[coluna])
+
 
 # Função login
-def login(driver: webdriver.Chrome) -> str:
+def login(driver: webdriver.Chrome, confirmar: Callable = input) -> str:
     """Faz o login em todas as plataformas necessárias.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        confirmar (Callable, optional): Função que aguarda o usuário finalizar o login. Defaults to input.
     """
     # Logando no Tiny
     try:
-        tiny.login_manual(driver)
+        tiny.login_manual(driver, confirmar=confirmar)
     except RuntimeError as e:
         error_msg = f"Erro ao fazer login no Tiny - {e}"
         logging.error(error_msg, extra={"sku": ""})
@@ -22,14 +76,19 @@ def login(driver: webdriver.Chrome) -> str:
 
 
 # Função Setup
-def setup() -> tuple[webdriver.Chrome, pd.DataFrame]:
+def setup(navegador: bool = True, refazer: bool = False) -> tuple[webdriver.Chrome | None, pd.DataFrame, planilhas.IndiceErrosHandler, planilhas.DiarioStatus, historico.HistoricoOperacoes]:
     """Função de inicialização de váriavies fixa do código e organização.
 
+    Args:
+        navegador (bool, optional): Cria o navegador e faz o login. No modo paralelo cada worker
+        tem o seu navegador, então o coordenador não precisa de um. Defaults to True.
+        refazer (bool, optional): Ignora o histórico de operações e refaz todos os produtos. Defaults to False.
+
     Returns:
-        tuple[webdriver.Chrome, pd.DataFrame]: Retorna todas as váriaves inicializadas e organizadas.
+        tuple[webdriver.Chrome | None, pd.DataFrame, planilhas.IndiceErrosHandler, planilhas.DiarioStatus, historico.HistoricoOperacoes]: Retorna todas as váriaves inicializadas e organizadas.
     """
     # Criando o driver
-    driver = webdriver.Chrome()
+    driver = navegadores.criar_navegador('tiny') if navegador else None
 
     # Configurando o Logging
     logging.basicConfig(
@@ -38,81 +97,426 @@ def setup() -> tuple[webdriver.Chrome, pd.DataFrame]:
     format='%(asctime)s | %(levelname)s | %(message)s | %(sku)s | %(funcName)s | %(lineno)d',
     datefmt='%d/%m/%Y %H:%M:%S'
     )
+    # Índice em memória dos SKUs com erro (lê o log existente uma única vez)
+    indice_erros = planilhas.registrar_indice_erros('erro_logs_atualizar_precos.log', separador=' | ')
 
-    # Lendo a planilha dos produtos a serem excluídos
-    produtos_df = pd.read_excel("lista 18122024_1.xlsx") # ALTERE AQUI CONFORME NECESSÁRIO
-    if "status" not in produtos_df.columns:
-        produtos_df["status"] = '-'
-    # Tratando os tipos de dados por coluna
-    produtos_df = produtos_df.astype({'ID': 'string',
-                                      'SKU': 'string',
-                                      'Descrição': 'string',
-                                      'Preço': 'Float32',
-                                      'Preço promocional': 'Float32',
-                                      'Lp-Mkp': 'float32',
-                                      'Lp-Mkp Promocional': 'float32',
-                                      'Revenda': 'float32',
-                                      'Revenda Promocional': 'float32',
-                                      'status': 'string'})
+    # Lendo a planilha inteira e tratando os tipos de dados por coluna (em cache enquanto a planilha não mudar).
+    # Não é lida em lotes: o diário de status e a comparação com os preços atuais usam a planilha toda
+    produtos_df = planilhas.ler_planilha("lista 18122024_1.xlsx", # ALTERE AQUI CONFORME NECESSÁRIO
+                                         tipos={'ID': 'string',
+                                                'SKU': 'string',
+                                                'Descrição': 'string',
+                                                'Preço': 'Float32',
+                                                'Preço promocional': 'Float32',
+                                                'Lp-Mkp': 'float32',
+                                                'Lp-Mkp Promocional': 'float32',
+                                                'Revenda': 'float32',
+                                                'Revenda Promocional': 'float32',
+                                                'status': 'string'},
+                                         padroes={'status': '-'})
     produtos_df[produtos_df.select_dtypes(include=['float32', 'float64', 'float']).columns] = produtos_df.select_dtypes(include=['float32', 'float64', 'float']).round(2)
 
-    login(driver)
+    # Diário de status, a planilha só é regravada periodicamente
+    diario = planilhas.DiarioStatus(produtos_df, "lista 18122024_1.xlsx") # MUDAR O NOME CONFORME NECESSÁRIO
+
+    # Histórico de operações, compartilhado entre as execuções e planilhas
+    operacoes = historico.HistoricoOperacoes(refazer=refazer)
+
+    if navegador:
+        login(driver)
+
+    return driver, produtos_df, indice_erros, diario, operacoes
+
+
+# Função dados de preço
+def dados_precos(produto: Produto) -> dict:
+    """Retorna os preços do produto, que identificam a atualização no histórico de operações.
+
+    Args:
+        produto (Produto): Produto da planilha
+
+    Returns:
+        dict: Preço de cada coluna de preço, `None` quando vazio
+    """
+    return {coluna: None if pd.isna(produto.valor(coluna)) else round(float(produto.valor(coluna)), 2)
+            for coluna in COLUNAS_PRECO}
+
+
+# Função filtrar pendentes
+def filtrar_pendentes(produtos_df: pd.DataFrame,
+                      diario: planilhas.DiarioStatus,
+                      operacoes: historico.HistoricoOperacoes) -> list[Produto]:
+    """Retorna os produtos que ainda precisam ser atualizados. Os produtos que já foram atualizados
+    com os mesmos preços em outra execução são marcados como FEITO sem abrir o Tiny.
+
+    Args:
+        produtos_df (pd.DataFrame): Planilha dos produtos
+        diario (planilhas.DiarioStatus): Diário de status da planilha
+        operacoes (historico.HistoricoOperacoes): Histórico de operações
+
+    Returns:
+        list[Produto]: Produtos pendentes
+    """
+    pendentes_df = produtos_df[~produtos_df["status"].fillna('').str.contains('FEITO')]
+
+    pendentes = []
+    for produto in planilhas.criar_registros(pendentes_df, Produto, COLUNAS):
+        if operacoes.ja_feito('tiny', produto.sku, 'atualizar_precos', dados_precos(produto)):
+            print(f"Preços já atualizados anteriormente - {produto.sku}")
+            diario.registrar(produto.sku, "status", "FEITO", produto.linha)
+        else:
+            pendentes.append(produto)
+
+    return pendentes
+
+
+# Função exportar preços do Tiny
+def exportar_precos_tiny(token: str) -> pd.DataFrame | None:
+    """Lê pela API os preços atuais de todos os produtos do Tiny, no formato da planilha.
+
+    Args:
+        token (str): Token da API do Tiny
+
+    Returns:
+        pd.DataFrame | None: Preços atuais por ID, `None` se a leitura falhar
+    """
+    print("LENDO OS PREÇOS ATUAIS - TINY")
+    try:
+        atuais_df = tiny_api.TinyAPI(token).exportar_precos_df(LISTAS_PRECO)
+    except RuntimeError as e:
+        error_msg = f"Erro ao ler os preços atuais do Tiny - {e}"
+        print(error_msg)
+        logging.error(error_msg, extra={'sku': ''})
+        return None
+    print(f"PREÇOS ATUAIS LIDOS - TINY: {len(atuais_df)} PRODUTOS")
+    return atuais_df
+
+
+# Função filtrar inalterados
+def filtrar_inalterados(produtos_df: pd.DataFrame,
+                        pendentes: list[Produto],
+                        atuais_df: pd.DataFrame,
+                        diario: planilhas.DiarioStatus,
+                        operacoes: historico.HistoricoOperacoes) -> list[Produto]:
+    """Compara, de uma vez, os preços da planilha com os preços atuais do Tiny. Os produtos com todos
+    os preços iguais são marcados como FEITO sem abrir o Tiny. Preços vazios na planilha não são
+    alterados, então não contam na comparação.
+
+    Os produtos com ERRO continuam pendentes mesmo com os preços iguais, pois o erro pode ter sido
+    na sincronização com as plataformas, depois de o preço já ter sido atualizado no Tiny.
+
+    Args:
+        produtos_df (pd.DataFrame): Planilha dos produtos
+        pendentes (list[Produto]): Produtos pendentes, retornados por `filtrar_pendentes()`
+        atuais_df (pd.DataFrame): Preços atuais, retornados por `exportar_precos_tiny()`
+        diario (planilhas.DiarioStatus): Diário de status da planilha
+        operacoes (historico.HistoricoOperacoes): Histórico de operações
+
+    Returns:
+        list[Produto]: Produtos com algum preço diferente ou que não estão nos preços atuais
+    """
+    if not pendentes:
+        return pendentes
+
+    planilha = pd.DataFrame(pendentes, columns=Produto._fields)
+    ids = planilha["id"].astype(str)
+    atuais = atuais_df.drop_duplicates("ID").set_index("ID")
+
+    status = produtos_df["status"].iloc[planilha["linha"]].fillna('').astype(str)
+    iguais = ids.isin(atuais.index) & ~pd.Series(status.str.contains('ERRO').to_numpy(), index=planilha.index)
+    for coluna in COLUNAS_PRECO:
+        novo = pd.to_numeric(planilha[CAMPOS[coluna]], errors="coerce").round(2)
+        atual = pd.Series(atuais[coluna].reindex(ids).to_numpy(dtype=float), index=planilha.index)
+        iguais &= novo.isna() | (novo - atual).abs().lt(0.005)
+
+    inalterados = [produto for produto, igual in zip(pendentes, iguais) if igual]
+    for produto in inalterados:
+        diario.registrar(produto.sku, "status", "FEITO", produto.linha)
+    operacoes.registrar_lote('tiny', 'atualizar_precos', [(produto.sku, dados_precos(produto)) for produto in inalterados])
+    print(f"{len(inalterados)} PRODUTOS JÁ ESTÃO COM OS PREÇOS DA PLANILHA - TINY")
+
+    return [produto for produto, igual in zip(pendentes, iguais) if not igual]
+
+
+# Função comparar com o Tiny
+def comparar_com_tiny(produtos_df: pd.DataFrame,
+                      pendentes: list[Produto],
+                      token: str | None,
+                      diario: planilhas.DiarioStatus,
+                      operacoes: historico.HistoricoOperacoes) -> list[Produto]:
+    """Remove dos pendentes os produtos que já estão com os preços da planilha no Tiny.
+    Sem o token ou se a leitura dos preços atuais falhar, todos os produtos continuam pendentes.
+
+    Args:
+        produtos_df (pd.DataFrame): Planilha dos produtos
+        pendentes (list[Produto]): Produtos pendentes
+        token (str | None): Token da API do Tiny
+        diario (planilhas.DiarioStatus): Diário de status da planilha
+        operacoes (historico.HistoricoOperacoes): Histórico de operações
+
+    Returns:
+        list[Produto]: Produtos que precisam ser atualizados
+    """
+    if not token:
+        print("Sem o token da API do Tiny, os preços atuais não serão comparados com a planilha.")
+        return pendentes
+    if not pendentes:
+        return pendentes
+
+    atuais_df = exportar_precos_tiny(token)
+    if atuais_df is None:
+        return pendentes
+    return filtrar_inalterados(produtos_df, pendentes, atuais_df, diario, operacoes)
+
+
+# Função registrar resultado
+def registrar_resultado(produtos_df: pd.DataFrame,
+                        indice_erros: planilhas.IndiceErrosHandler,
+                        diario: planilhas.DiarioStatus,
+                        operacoes: historico.HistoricoOperacoes,
+                        sku: str,
+                        dados: dict,
+                        linha: int | None = None) -> pd.DataFrame:
+    """Atualiza o status do produto na planilha e, se não houve erro, registra no histórico de operações.
+
+    Args:
+        produtos_df (pd.DataFrame): Planilha dos produtos
+        indice_erros (planilhas.IndiceErrosHandler): Índice dos SKUs com erro
+        diario (planilhas.DiarioStatus): Diário de status da planilha
+        operacoes (historico.HistoricoOperacoes): Histórico de operações
+        sku (str): SKU do produto
+        dados (dict): Preços do produto, retornados por `dados_precos()`
+        linha (int | None, optional): Posição do produto na planilha. Defaults to None.
+
+    Returns:
+        pd.DataFrame: Planilha atualizada
+    """
+    produtos_df = planilhas.atualizar_status(produtos_df, indice_erros, sku, diario=diario, linha=linha)
+    if not indice_erros.contem(sku, "status"):
+        operacoes.registrar('tiny', sku, 'atualizar_precos', dados)
+    return produtos_df
+
+
+# Função processar produto
+def processar_produto(driver: webdriver.Chrome, produto: Produto):
+    """Atualiza os preços de um produto no Tiny e sincroniza com as plataformas de venda.
+    Os erros são registrados no logging com o SKU do produto.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        produto (Produto): Produto da planilha
+    """
+    desempenho.definir_sku(produto.sku)
+    atualizar_precos_produto(driver, produto)
+    sincronizar_produto(driver, produto, acessar=False)
+
 
-    return driver, produtos_df
+# Função atualizar preços do produto
+def atualizar_precos_produto(driver: webdriver.Chrome, produto: Produto):
+    """Atualiza os preços de um produto no Tiny pelo navegador.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        produto (Produto): Produto da planilha
+    """
+    sku = produto.sku
+
+    try:
+        tiny.acessar_produto(driver, produto.id) # Acessando o produto
+        tiny.clicar_editar_produtos(driver) # Clicando no botão de edição
+        tiny.atualizar_preco(driver, produto.preco)
+        tiny.atualizar_preco(driver, produto.preco_promocional, promocional=True)
+        # Site, marketplaces e revenda lidos e escritos de uma vez na aba de preços
+        tiny.atualizar_tabela_precos(driver, {
+            lista: {tiny.COLUNA_PRECO: produto.valor(coluna), tiny.COLUNA_PRECO_PROMOCIONAL: produto.valor(coluna_promocional)}
+            for lista, coluna, coluna_promocional in LISTAS_PRECO})
+        tiny.clicar_salvar_edicao_produtos(driver) # Salvando as edições
+        print("")
+    except RuntimeError as e:
+        driver.refresh()
+        print(e)
+        logging.error(e, extra={'sku': sku})
+
+
+# Função sincronizar produto
+def sincronizar_produto(driver: webdriver.Chrome, produto: Produto, acessar: bool = True):
+    """Sincroniza o produto com o site, Mercado Livre e Magalu.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        produto (Produto): Produto da planilha
+        acessar (bool, optional): Acessa a página do produto antes de sincronizar. Defaults to True.
+    """
+    sku = produto.sku
+    desempenho.definir_sku(sku)
+
+    if acessar:
+        try:
+            tiny.acessar_produto(driver, produto.id)
+        except RuntimeError as e:
+            print(e)
+            logging.error(e, extra={'sku': sku})
+            return
+
+    try:
+        tiny.sincronizar_produtos_sites(driver, opencart=True)
+    except RuntimeError as e:
+        driver.refresh()
+        print(e)
+        logging.error(e, extra={'sku': sku})
+
+    try:
+        tiny.sincronizar_mkp_ml(driver)
+    except RuntimeError as e:
+        driver.refresh()
+        print(e)
+        logging.error(e, extra={'sku': sku})
+
+    try:
+        tiny.sincronizar_mkp_magalu(driver)
+    except RuntimeError as e:
+        driver.refresh()
+        print(e)
+        logging.error(e, extra={'sku': sku})
+
+    navegadores.contabilizar_bloqueios(driver, 'tiny')
 
 
 # Função principal
-def main():
-    """Função principal"""
-    driver, produtos_df = setup()
-
-    for i, row in produtos_df.iterrows():
-        product_id = row["ID"]
-        sku = row["SKU"]
-        status = row["status"]
-
-        if 'FEITO' not in status:
-            try:
-                tiny.acessar_produto(driver, product_id) # Acessando o produto
-                tiny.clicar_editar_produtos(driver) # Clicando no botão de edição
-                tiny.atualizar_preco(driver, row["Preço"])
-                tiny.atualizar_preco(driver, row["Preço promocional"], promocional=True)
-                tiny.atualizar_preco_site(driver, row["Preço"])
-                tiny.atualizar_preco_site(driver, row["Preço promocional"], promocional=True)
-                tiny.atualizar_preco_mkp(driver, row["Lp-Mkp"])
-                tiny.atualizar_preco_mkp(driver, row["Lp-Mkp Promocional"], promocional=True)
-                tiny.atualizar_preco_revenda(driver, row["Revenda"])
-                tiny.atualizar_preco_revenda(driver, row["Revenda Promocional"], promocional=True)
-                tiny.clicar_salvar_edicao_produtos(driver) # Salvando as edições
-                print("")
-            except RuntimeError as e:
-                driver.refresh()
-                print(e)
-                logging.error(e, extra={'sku': sku})
-
-            try:
-                tiny.sincronizar_produtos_sites(driver, opencart=True)
-            except RuntimeError as e:
-                driver.refresh()
-                print(e)
-                logging.error(e, extra={'sku': sku})
-
-            try:
-                tiny.sincronizar_mkp_ml(driver)
-            except RuntimeError as e:
-                driver.refresh()
-                print(e)
-                logging.error(e, extra={'sku': sku})
-
-            try:
-                tiny.sincronizar_mkp_magalu(driver)
-            except RuntimeError as e:
-                driver.refresh()
-                print(e)
-                logging.error(e, extra={'sku': sku})
-
-        produtos_df = planilhas.atualizar_status_log(produtos_df, "erro_logs_atualizar_precos.xlsx", sku)
-        produtos_df.to_excel('lista 18122024_1.xlsx', index=False) # MUDAR O NOME CONFORME NECESSÁRIO
-
-
-main()
+def main(workers: int = 1,
+         backend: str = "navegador",
+         token: str | None = None,
+         sincronizar: bool = True,
+         refazer: bool = False,
+         comparar: bool = True):
+    """Função principal
+
+    Args:
+        workers (int, optional): Quantidade de navegadores em paralelo, 0 calcula
+        conforme os núcleos e a memória da máquina. Defaults to 1.
+        backend (str, optional): "navegador" atualiza os preços pelo Selenium e "api" pela API do Tiny. Defaults to "navegador".
+        token (str | None, optional): Token da API do Tiny, usado no backend "api" e para ler os preços
+        atuais antes da atualização. Defaults to None.
+        sincronizar (bool, optional): No backend "api", abre o navegador para sincronizar
+        os produtos com as plataformas depois de atualizar os preços. Defaults to True.
+        refazer (bool, optional): Ignora o histórico de operações e refaz todos os produtos. Defaults to False.
+        comparar (bool, optional): Lê os preços atuais pela API do Tiny e pula os produtos
+        que já estão com os preços da planilha. Defaults to True.
+    """
+    if backend == "api":
+        main_api(token, sincronizar, refazer, comparar)
+        return
+
+    if workers != 1:
+        main_paralelo(workers or paralelo.calcular_workers(), refazer, token, comparar)
+        return
+
+    driver, produtos_df, indice_erros, diario, operacoes = setup(refazer=refazer)
+    pendentes = filtrar_pendentes(produtos_df, diario, operacoes)
+    if comparar:
+        pendentes = comparar_com_tiny(produtos_df, pendentes, token, diario, operacoes)
+
+    for produto in pendentes:
+        processar_produto(driver, produto)
+        produtos_df = registrar_resultado(produtos_df, indice_erros, diario, operacoes,
+                                          produto.sku, dados_precos(produto), produto.linha)
+
+    diario.fechar()
+    operacoes.fechar()
+
+
+# Função principal - modo paralelo
+def main_paralelo(workers: int, refazer: bool = False, token: str | None = None, comparar: bool = True):
+    """Divide a planilha entre vários navegadores, cada um em um processo com o seu login.
+    O processo principal recebe os logs e os status e é o único que grava a planilha e o histórico.
+
+    Args:
+        workers (int): Quantidade de navegadores em paralelo
+        refazer (bool, optional): Ignora o histórico de operações e refaz todos os produtos. Defaults to False.
+        token (str | None, optional): Token da API do Tiny, para ler os preços atuais. Defaults to None.
+        comparar (bool, optional): Pula os produtos que já estão com os preços da planilha. Defaults to True.
+    """
+    _, produtos_df, indice_erros, diario, operacoes = setup(navegador=False, refazer=refazer)
+
+    pendentes = filtrar_pendentes(produtos_df, diario, operacoes)
+    if comparar:
+        pendentes = comparar_com_tiny(produtos_df, pendentes, token, diario, operacoes)
+    por_linha = {produto.linha: produto for produto in pendentes}
+    paralelo.executar_em_paralelo(
+        pendentes,
+        processar_produto,
+        login,
+        lambda linha: registrar_resultado(produtos_df, indice_erros, diario, operacoes, por_linha[linha].sku,
+                                          dados_precos(por_linha[linha]), linha),
+        workers,
+        criar_driver=functools.partial(navegadores.criar_navegador, 'tiny'),
+        chave=operator.attrgetter('linha'))
+
+    diario.fechar()
+    operacoes.fechar()
+
+
+# Função principal - API do Tiny
+def main_api(token: str, sincronizar: bool = True, refazer: bool = False, comparar: bool = True):
+    """Atualiza os preços de todos os produtos pendentes pela API do Tiny, em lotes,
+    e depois sincroniza pelo navegador somente os produtos atualizados.
+
+    Args:
+        token (str): Token da API do Tiny
+        sincronizar (bool, optional): Sincroniza os produtos com as plataformas pelo navegador. Defaults to True.
+        refazer (bool, optional): Ignora o histórico de operações e refaz todos os produtos. Defaults to False.
+        comparar (bool, optional): Pula os produtos que já estão com os preços da planilha. Defaults to True.
+    """
+    if not token:
+        raise ValueError("Informe o token da API do Tiny (--token ou variável TINY_TOKEN).")
+
+    _, produtos_df, indice_erros, diario, operacoes = setup(navegador=False, refazer=refazer)
+    pendentes = filtrar_pendentes(produtos_df, diario, operacoes)
+    if comparar:
+        pendentes = comparar_com_tiny(produtos_df, pendentes, token, diario, operacoes)
+
+    print(f"ATUALIZANDO {len(pendentes)} PRODUTOS PELA API - TINY")
+    api = tiny_api.TinyAPI(token)
+    resultados = api.atualizar_precos_df(produtos_df.iloc[[produto.linha for produto in pendentes]], LISTAS_PRECO)
+
+    driver = None
+    if sincronizar and any(erro is None for erro in resultados.values()):
+        driver = navegadores.criar_navegador('tiny')
+        login(driver)
+
+    for produto in pendentes:
+        sku = produto.sku
+        erro = resultados.get(str(sku))
+        if erro:
+            print(erro)
+            logging.error(erro, extra={'sku': sku})
+        elif driver is not None:
+            sincronizar_produto(driver, produto)
+
+        produtos_df = registrar_resultado(produtos_df, indice_erros, diario, operacoes,
+                                          sku, dados_precos(produto), produto.linha)
+
+    diario.fechar()
+    operacoes.fechar()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Atualiza os preços dos produtos no Tiny conforme a planilha.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Quantidade de navegadores em paralelo (0 = automático). Defaults to 1.")
+    parser.add_argument("--backend", choices=["navegador", "api"], default="navegador",
+                        help="Atualiza os preços pelo navegador ou pela API do Tiny. Defaults to navegador.")
+    parser.add_argument("--token", default=os.environ.get("TINY_TOKEN"),
+                        help="Token da API do Tiny, também usado para ler os preços atuais antes da atualização. Defaults to variável de ambiente TINY_TOKEN.")
+    parser.add_argument("--sem-sincronizar", action="store_true",
+                        help="No backend api, não abre o navegador para sincronizar os produtos.")
+    parser.add_argument("--sem-comparar", action="store_true",
+                        help="Não lê os preços atuais do Tiny e abre todos os produtos pendentes.")
+    parser.add_argument("--refazer", action="store_true",
+                        help="Ignora o histórico de operações e atualiza novamente os produtos já atualizados.")
+    parser.add_argument("--perfil-navegador", choices=list(navegadores.PERFIS), default=None,
+                        help="Perfil do navegador usado no lugar do perfil padrão, para comparar os perfis no relatório de desempenho.")
+    args = parser.parse_args()
+    if args.perfil_navegador:
+        os.environ[navegadores.VARIAVEL_PERFIL] = args.perfil_navegador  # Herdado pelos workers do modo paralelo
+    main(args.workers, args.backend, args.token, not args.sem_sincronizar, args.refazer, not args.sem_comparar)
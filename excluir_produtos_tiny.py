@@ -1,12 +1,67 @@
 # Importações
 import os
+import queue
 import logging
+import argparse
+import functools
+import threading
+from typing import Callable, Iterator, NamedTuple
 import pandas as pd
 from selenium import webdriver
 import libraries as orion
 
+# Plataforma de cada coluna de status da planilha, usada no histórico de operações
+PLATAFORMAS = {'Tiny': 'tiny', 'Ecommerce': 'opencart', 'ML': 'mercado_livre', 'Magalu': 'magalu'}
+
+# Login de cada plataforma, pela coluna de status: (função de login, nome usado nas mensagens)
+LOGINS = {
+    'Tiny': (orion.tiny.login_manual, 'no Tiny'),
+    'Ecommerce': (orion.opencart.login_opencart, 'na Opencart'),
+    'ML': (orion.mercado_livre.login_ml, 'no Mercado Livre'),  # Login manual, aperte ENTER para concluir o login
+    'Magalu': (orion.magalu.login_mag, 'no Magalu'),  # Login manual, aperte ENTER para concluir o login
+}
+
+# Coluna da planilha de cada campo do produto
+COLUNAS = {'sku': 'SKU', 'titulo': 'Descrição', 'ml': 'ML', 'magalu': 'Magalu'}
+
+
+# Produto da planilha
+class Produto(NamedTuple):
+    """Linha da planilha convertida uma única vez por `orion.planilhas.criar_registros()`.
+    `linha` é a posição do produto na planilha, usada para gravar o status."""
+    linha: int
+    sku: str
+    titulo: str
+    ml: str
+    magalu: str
+
+# Função login da plataforma
+def login_plataforma(driver: webdriver.Chrome, coluna: str) -> str | None:
+    """Faz o login em uma plataforma na aba atual do navegador.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        coluna (str): Coluna de status da plataforma (Tiny, Ecommerce, ML ou Magalu)
+
+    Returns:
+        str | None: Retorno da função de login (a URL com o token de acesso na Opencart)
+    """
+    funcao_login, nome = LOGINS[coluna]
+    try:
+        return funcao_login(driver)
+    except RuntimeError as e:
+        error_msg = f"Erro ao fazer login {nome} - {e}"
+        logging.error(error_msg, extra={"sku": ""})
+        raise RuntimeError(error_msg) from e
+
 # Função login
-def login(driver: webdriver.Chrome, aba_tiny: str, aba_opencart: str, aba_ml: str, aba_mag: str) -> str:
+def login(driver: webdriver.Chrome,
+          aba_tiny: str,
+          aba_opencart: str,
+          aba_ml: str,
+          aba_mag: str,
+          navegador_ml: bool = True,
+          navegador_mag: bool = True) -> str:
     """Faz o login em todas as plataformas necessárias.
 
     Args:
@@ -15,69 +70,67 @@ def login(driver: webdriver.Chrome, aba_tiny: str, aba_opencart: str, aba_ml: st
         aba_opencart (str): código da aba gerada pelo Selenium referente ao Opencart
         aba_ml (str): código da aba gerada pelo Selenium referente ao Mercado Livre
         aba_mag (str): código da aba gerada pelo Selenium referente ao Magalu
+        navegador_ml (bool, optional): Faz o login no Mercado Livre pelo navegador,
+        desnecessário quando a API é usada. Defaults to True.
+        navegador_mag (bool, optional): Faz o login no Magalu pelo navegador,
+        desnecessário quando a API é usada. Defaults to True.
 
     Returns:
         str: Url com o token de acesso para não desconectar da sessão atual na Opencart
     """
-    
     # Logando no Tiny
     driver.switch_to.window(aba_tiny)
-    try:
-        orion.tiny.login_manual(driver)
-    except RuntimeError as e:
-        error_msg = f"Erro ao fazer login no Tiny - {e}"
-        logging.error(error_msg, extra={"sku": ""})
-        raise RuntimeError(f"Erro ao fazer login no Tiny - {e}") from e
+    login_plataforma(driver, 'Tiny')
 
     # Logando na Opencart
     driver.switch_to.window(aba_opencart)
-    try:
-        url_product_opencart = orion.opencart.login_opencart(driver)
-    except RuntimeError as e:
-        error_msg = f"Erro ao fazer login na Opencart - {e}"
-        logging.error(error_msg, extra={"sku": ""})
-        raise RuntimeError(f"Erro ao fazer login na Opencart - {e}") from e
+    url_product_opencart = login_plataforma(driver, 'Ecommerce')
 
     # Logando no Mercado Livre
-    driver.switch_to.window(aba_ml)
-    try:
-        orion.mercado_livre.login_ml(driver)  # Login manual, aperte ENTER para concluir o login
-    except RuntimeError as e:
-        error_msg = f"Erro ao fazer login no Mercado Livre - {e}"
-        logging.error(error_msg, extra={"sku": ""})
-        raise RuntimeError(f"Erro ao fazer login no Mercado Livre - {e}") from e
+    if navegador_ml:
+        driver.switch_to.window(aba_ml)
+        login_plataforma(driver, 'ML')
 
     # Logando no Magalu
-    driver.switch_to.window(aba_mag)
-    try:
-        orion.magalu.login_mag(driver)  # Login manual, aperte ENTER para concluir o login
-    except RuntimeError as e:
-        error_msg = f"Erro ao fazer login no Magalu - {e}"
-        logging.error(error_msg, extra={"sku": ""})
-        raise RuntimeError(f"Erro ao fazer login no Magalu - {e}") from e
-    
+    if navegador_mag:
+        driver.switch_to.window(aba_mag)
+        login_plataforma(driver, 'Magalu')
+
     return url_product_opencart
 
 # Função Setup
-def setup() -> tuple[webdriver.Chrome, str, str, str, str, pd.DataFrame]:
+def setup(refazer: bool = False, navegador: bool = True) -> tuple[webdriver.Chrome | None, str | None, str | None, str | None, str | None, pd.DataFrame, orion.planilhas.IndiceErrosHandler, orion.planilhas.DiarioStatus, orion.historico.HistoricoOperacoes]:
     """Função de inicialização de váriavies fixa do código e organização.
 
+    Args:
+        refazer (bool, optional): Ignora o histórico de operações e refaz todas as exclusões. Defaults to False.
+        navegador (bool, optional): Cria o navegador com uma aba por plataforma. No modo por faixas cada
+        plataforma tem o seu navegador, então o driver e as abas são None. Defaults to True.
+
     Returns:
         tuple[webdriver.Chrome, pd.DataFrame, str, str]: Retorna todas as váriaves inicializadas e organizadas.
     """
-    # Criando o driver
-    driver = webdriver.Chrome()
+    driver = aba_tiny = aba_ml = aba_mag = aba_opencart = None
+    if navegador:
+        # Criando o driver
+        driver = orion.navegadores.criar_navegador('multiplataforma')
+
+        # Abrindo duas novas abas
+        driver.execute_script("window.open('');")
+        driver.execute_script("window.open('');")
+        driver.execute_script("window.open('');")
 
-    # Abrindo duas novas abas
-    driver.execute_script("window.open('');")
-    driver.execute_script("window.open('');")
-    driver.execute_script("window.open('');")
+        # Gerenciando as abas
+        aba_tiny = driver.window_handles[0]
+        aba_ml = driver.window_handles[1]
+        aba_mag = driver.window_handles[2]
+        aba_opencart = driver.window_handles[3]
 
-    # Gerenciando as abas
-    aba_tiny = driver.window_handles[0]
-    aba_ml = driver.window_handles[1]
-    aba_mag = driver.window_handles[2]
-    aba_opencart = driver.window_handles[3]
+        # Bloqueando os recursos desnecessários de cada plataforma na sua aba
+        for aba, plataforma in [(aba_tiny, 'tiny'), (aba_ml, 'mercado_livre'), (aba_mag, 'magalu'), (aba_opencart, 'opencart')]:
+            driver.switch_to.window(aba)
+            orion.navegadores.bloquear_recursos(driver, plataforma)
+        driver.switch_to.window(aba_tiny)
 
     # Configurando o Logging
     logging.basicConfig(
@@ -92,68 +145,212 @@ def setup() -> tuple[webdriver.Chrome, str, str, str, str, pd.DataFrame]:
         columns = ["asctime", "levelname", "message", "sku", "funcName", "lineno"]
         pd.DataFrame(columns=columns).to_csv('erro_logs.csv', index=False)
 
-    # Lendo a planilha dos produtos a serem excluídos
-    produtos_df = pd.read_excel("excluir_produtos.xlsx")
-    # Tratando os tipos de dados por coluna
-    produtos_df = produtos_df.astype({'Tiny': 'string', 'Ecommerce': 'string', 'ML': 'string', 'Magalu': 'string'})
+    # Índice em memória dos SKUs com erro (lê o log existente uma única vez)
+    indice_erros = orion.planilhas.registrar_indice_erros('erro_logs.csv')
+
+    # Lendo a planilha inteira e tratando os tipos de dados por coluna (em cache enquanto a planilha não mudar).
+    # Não é lida em lotes: o diário de status e as exclusões em lote de cada plataforma usam todos os SKUs
+    produtos_df = orion.planilhas.ler_planilha("excluir_produtos.xlsx",
+                                               tipos={'Tiny': 'string', 'Ecommerce': 'string', 'ML': 'string', 'Magalu': 'string'})
 
-    return driver, aba_tiny, aba_ml, aba_mag, aba_opencart, produtos_df
+    # Diário de status, a planilha só é regravada periodicamente
+    diario = orion.planilhas.DiarioStatus(produtos_df, 'excluir_produtos.xlsx')
+
+    # Histórico de operações, compartilhado entre as execuções e planilhas
+    operacoes = orion.historico.HistoricoOperacoes(refazer=refazer)
+
+    return driver, aba_tiny, aba_ml, aba_mag, aba_opencart, produtos_df, indice_erros, diario, operacoes
+
+# Função consultar histórico
+def consultar_historico(operacoes: orion.historico.HistoricoOperacoes,
+                        diario: orion.planilhas.DiarioStatus,
+                        sku: str,
+                        coluna: str,
+                        status: str,
+                        linha: int | None = None) -> str:
+    """Marca como FEITO, sem abrir a plataforma, o produto que já foi excluído em outra execução.
+
+    Args:
+        operacoes (orion.historico.HistoricoOperacoes): Histórico de operações
+        diario (orion.planilhas.DiarioStatus): Diário de status da planilha
+        sku (str): SKU do produto
+        coluna (str): Coluna de status da plataforma (Tiny, Ecommerce, ML ou Magalu)
+        status (str): Status atual da planilha
+        linha (int | None, optional): Posição do produto na planilha. Defaults to None.
+
+    Returns:
+        str: Status do produto na plataforma
+    """
+    if (pd.isna(status) or status != "FEITO") and operacoes.ja_feito(PLATAFORMAS[coluna], sku, 'excluir'):
+        print(f'Produto {sku} já excluído anteriormente - {coluna.upper()}')
+        diario.registrar(sku, coluna, 'FEITO', linha)
+        return 'FEITO'
+    return status
+
+# Função registrar resultado
+def registrar_resultado(produtos_df: pd.DataFrame,
+                        indice_erros: orion.planilhas.IndiceErrosHandler,
+                        diario: orion.planilhas.DiarioStatus,
+                        operacoes: orion.historico.HistoricoOperacoes,
+                        sku: str,
+                        coluna: str,
+                        linha: int | None = None) -> pd.DataFrame:
+    """Atualiza o status da plataforma na planilha e, se não houve erro, registra a exclusão no histórico.
+
+    Args:
+        produtos_df (pd.DataFrame): Planilha dos produtos
+        indice_erros (orion.planilhas.IndiceErrosHandler): Índice dos SKUs com erro
+        diario (orion.planilhas.DiarioStatus): Diário de status da planilha
+        operacoes (orion.historico.HistoricoOperacoes): Histórico de operações
+        sku (str): SKU do produto
+        coluna (str): Coluna de status da plataforma (Tiny, Ecommerce, ML ou Magalu)
+        linha (int | None, optional): Posição do produto na planilha. Defaults to None.
+
+    Returns:
+        pd.DataFrame: Planilha atualizada
+    """
+    produtos_df = orion.planilhas.atualizar_status(produtos_df, indice_erros, sku, coluna, diario, linha)
+    if not indice_erros.contem(sku, coluna):
+        operacoes.registrar(PLATAFORMAS[coluna], sku, 'excluir')
+    return produtos_df
+
+# Função registrar resultados do lote
+def registrar_resultados_lote(produtos_df: pd.DataFrame,
+                              indice_erros: orion.planilhas.IndiceErrosHandler,
+                              diario: orion.planilhas.DiarioStatus,
+                              operacoes: orion.historico.HistoricoOperacoes,
+                              resultados: dict[str, str | None],
+                              coluna: str,
+                              nao_encontrado: str | None = None,
+                              nao_encontrado_erro: bool = False) -> pd.DataFrame:
+    """Registra na planilha e no histórico o resultado de cada SKU de uma exclusão em lote.
+
+    Args:
+        produtos_df (pd.DataFrame): Planilha dos produtos
+        indice_erros (orion.planilhas.IndiceErrosHandler): Índice dos SKUs com erro
+        diario (orion.planilhas.DiarioStatus): Diário de status da planilha
+        operacoes (orion.historico.HistoricoOperacoes): Histórico de operações
+        resultados (dict[str, str | None]): Resultado de cada SKU retornado pela exclusão em lote
+        coluna (str): Coluna de status da plataforma (Tiny, Ecommerce, ML ou Magalu)
+        nao_encontrado (str | None, optional): Valor do resultado para os SKUs não encontrados na plataforma. Defaults to None.
+        nao_encontrado_erro (bool, optional): Registra os SKUs não encontrados como erro,
+        se não, o status deles não é alterado. Defaults to False.
+
+    Returns:
+        pd.DataFrame: Planilha atualizada
+    """
+    plataforma = PLATAFORMAS[coluna]
+    for sku, erro in resultados.items():
+        if nao_encontrado is not None and erro == nao_encontrado:
+            if not nao_encontrado_erro:
+                print(f"Produto com SKU {sku} não encontrado no {plataforma.upper()}")
+                continue
+            erro = f"O produto com SKU '{sku}' não foi encontrado"
+        if erro:
+            error_msg = f'Não foi possível excluir o produto {sku} no {plataforma.upper()} - {erro}'
+            print(error_msg)
+            logging.error(error_msg, extra={'sku': sku, 'coluna': coluna})
+
+        # Atualizando o status
+        produtos_df = registrar_resultado(produtos_df, indice_erros, diario, operacoes, sku, coluna)
+
+    return produtos_df
 
 # Função Principal
-def main():
-    """Função principal"""
+def main(refazer: bool = False,
+         token_ml: str | None = None,
+         token_magalu: str | None = None,
+         faixas: bool = False,
+         catalogo: bool = False):
+    """Função principal
+
+    Args:
+        refazer (bool, optional): Ignora o histórico de operações e refaz todas as exclusões. Defaults to False.
+        token_ml (str | None, optional): Access token da API do Mercado Livre. Quando informado, os anúncios
+        são excluídos pela API, em lote, ao invés do navegador. Defaults to None.
+        token_magalu (str | None, optional): Access token da API do Magalu. Quando informado, os produtos são
+        inativados pela API, em lote, sem o login no navegador. Defaults to None.
+        faixas (bool, optional): Exclui em todas as plataformas ao mesmo tempo, cada uma com o seu navegador
+        (`main_faixas()`). Defaults to False.
+        catalogo (bool, optional): Usa o catálogo local de cada plataforma (`orion.catalogo`) para registrar
+        os SKUs que não existem na plataforma sem pesquisá-los. Defaults to False.
+    """
+    if faixas:
+        main_faixas(refazer, token_ml, token_magalu, catalogo)
+        return
+
     # Setup inicial (variáveis inicializadas e configuradas)
-    driver, aba_tiny, aba_ml, aba_mag, aba_opencart, produtos_df = setup()
+    driver, aba_tiny, aba_ml, aba_mag, aba_opencart, produtos_df, indice_erros, diario, operacoes = setup(refazer)
 
-    url_product_opencart = login(driver, aba_tiny, aba_opencart, aba_ml, aba_mag)
+    url_product_opencart = login(driver, aba_tiny, aba_opencart, aba_ml, aba_mag,
+                                 navegador_ml=not token_ml, navegador_mag=not token_magalu)
 
-    # Percorrendo a planilha
-    for i, row in produtos_df.iterrows():
-        # Capturando os elementos principais
-        sku = row['SKU']
-        titulo = row['Descrição']
-        tiny_status = row['Tiny']
-        opencart_status = row['Ecommerce']
-        ml_status = row['ML']
-        mag_status = row['Magalu']
+    # Excluindo em lote no Tiny, com uma confirmação por página da lista
+    pendentes_tiny = [sku for sku, status in zip(produtos_df['SKU'], produtos_df['Tiny'])
+                      if consultar_historico(operacoes, diario, sku, 'Tiny', status) != "FEITO"]
+    driver.switch_to.window(aba_tiny)  # Mudando para aba do Tiny
+    if catalogo:
+        pendentes_tiny, ausentes = filtrar_catalogo(driver, 'Tiny', pendentes_tiny)
+        produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes,
+                                                ausentes, 'Tiny', *NAO_ENCONTRADOS['Tiny'])
+    # Cada resultado é gravado assim que chega, um erro no meio do lote não perde os anteriores
+    for resultado in orion.tiny.excluir_produtos_lote_por_sku(driver, pendentes_tiny):
+        produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes,
+                                                resultado, 'Tiny', orion.tiny.NAO_ENCONTRADO)
 
-        # Verifica se o status não está como "FEITO" para evitar refazer as ações.
-        if pd.isna(tiny_status) or tiny_status != "FEITO":
-            driver.switch_to.window(aba_tiny)  # Mudando para aba do Tiny
-            # Pesquisando o produto no tiny
-            encontrado = orion.tiny.pesquisar_produto(driver, sku)
-            if encontrado:
-                try:
-                    # Excluindo o produto no tiny
-                    orion.tiny.excluir_produto(driver, sku)
-                except Exception as e:
-                    error_msg = f'Não foi possível excluir o produto {sku} no TINY - {e}'
-                    print(error_msg)
-                    logging.error(error_msg, extra={'sku': sku})
-
-                # Atualizando o status - TINY
-                produtos_df = orion.planilhas.atualizar_status_csv(produtos_df, "erro_logs.csv", sku, 'Tiny')
-                produtos_df.to_excel('excluir_produtos.xlsx', index=False)
-
-        if pd.isna(opencart_status) or opencart_status != "FEITO":
-            # Mudando para o Opencart
-            driver.switch_to.window(aba_opencart)
-            # Pesquisando o produto
-            orion.opencart.pesquisar_produto_opencart(driver, url_product_opencart, sku)
+    # Excluindo em lote na Opencart, com uma confirmação por página da lista
+    pendentes_opencart = [sku for sku, status in zip(produtos_df['SKU'], produtos_df['Ecommerce'])
+                          if consultar_historico(operacoes, diario, sku, 'Ecommerce', status) != "FEITO"]
+    driver.switch_to.window(aba_opencart)  # Mudando para o Opencart
+    if catalogo:
+        pendentes_opencart, ausentes = filtrar_catalogo(driver, 'Ecommerce', pendentes_opencart, url_product_opencart)
+        produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes,
+                                                ausentes, 'Ecommerce', *NAO_ENCONTRADOS['Ecommerce'])
+    for resultado in orion.opencart.excluir_produtos_lote_opencart_por_sku(driver, url_product_opencart, pendentes_opencart):
+        produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes, resultado,
+                                                'Ecommerce', orion.opencart.NAO_ENCONTRADO, nao_encontrado_erro=True)
 
-            try:
-                # Excluindo o produto na Opencart
-                orion.opencart.excluir_produto_opencart(driver, sku)
-            except Exception as e:
-                error_msg = f'Não foi possível excluir o produto {sku} no OPENCART - {e}'
-                print(error_msg)
-                logging.error(error_msg, extra={'sku': sku})
+    # Excluindo em lote no Mercado Livre pela API
+    if token_ml:
+        pendentes_ml = [sku for sku, status in zip(produtos_df['SKU'], produtos_df['ML'])
+                        if consultar_historico(operacoes, diario, sku, 'ML', status) != "FEITO"]
+        api_ml = orion.mercado_livre_api.MercadoLivreAPI(token_ml)
+        resultados_ml = orion.mercado_livre_api.excluir_produtos_ml(api_ml, pendentes_ml)
+        produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes,
+                                                resultados_ml, 'ML')
 
-            # Atualizando o status - OPENCART
-            produtos_df = orion.planilhas.atualizar_status_csv(produtos_df, "erro_logs.csv", sku, 'Ecommerce')
-            produtos_df.to_excel('excluir_produtos.xlsx', index=False)
+    # Inativando em lote no Magalu pela API
+    if token_magalu:
+        pendentes_mag = [sku for sku, status in zip(produtos_df['SKU'], produtos_df['Magalu'])
+                         if consultar_historico(operacoes, diario, sku, 'Magalu', status) != "FEITO"]
+        api_mag = orion.magalu_api.MagaluAPI(token_magalu)
+        resultados_mag = orion.magalu_api.excluir_produtos_mag(api_mag, pendentes_mag)
+        produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes,
+                                                resultados_mag, 'Magalu', orion.magalu_api.NAO_ENCONTRADO)
 
-        if pd.isna(ml_status) or ml_status != "FEITO":
+    # SKUs que não existem no Mercado Livre, pelo catálogo local, não são pesquisados pelo navegador
+    ausentes_ml = {}
+    if catalogo and not token_ml:
+        pendentes_ml = [sku for sku, status in zip(produtos_df['SKU'], produtos_df['ML'])
+                        if consultar_historico(operacoes, diario, sku, 'ML', status) != "FEITO"]
+        driver.switch_to.window(aba_ml)  # Mudando para aba do ML
+        _, ausentes_ml = filtrar_catalogo(driver, 'ML', pendentes_ml)
+        produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes,
+                                                ausentes_ml, 'ML', *NAO_ENCONTRADOS['ML'])
+
+    # Percorrendo a planilha, convertida uma única vez em registros
+    for produto in orion.planilhas.criar_registros(produtos_df, Produto, COLUNAS):
+        # Capturando os elementos principais
+        sku = produto.sku
+        titulo = produto.titulo
+        orion.desempenho.definir_sku(sku)
+        orion.navegadores.contabilizar_bloqueios(driver, 'multiplataforma')
+        # Status da planilha, considerando as exclusões já registradas no histórico de operações
+        ml_status = consultar_historico(operacoes, diario, sku, 'ML', produto.ml, produto.linha)
+        mag_status = consultar_historico(operacoes, diario, sku, 'Magalu', produto.magalu, produto.linha)
+
+        # Verifica se o status não está como "FEITO" para evitar refazer as ações.
+        if not token_ml and sku not in ausentes_ml and (pd.isna(ml_status) or ml_status != "FEITO"):
             driver.switch_to.window(aba_ml)  # Mudando para aba do ML
             try:
                 #Excluindo produtos do Mercado Livre
@@ -161,13 +358,12 @@ def main():
             except Exception as e:
                 error_msg = f'Não foi possível excluir o produto {sku} no MERCADO LIVRE - {e}'
                 print(error_msg)
-                logging.error(error_msg, extra={'sku': sku})
+                logging.error(error_msg, extra={'sku': sku, 'coluna': 'ML'})
 
             # Atualizando o status - ML
-            produtos_df = orion.planilhas.atualizar_status_csv(produtos_df, "erro_logs.csv", sku, 'ML')
-            produtos_df.to_excel('excluir_produtos.xlsx', index=False)
+            produtos_df = registrar_resultado(produtos_df, indice_erros, diario, operacoes, sku, 'ML', produto.linha)
 
-        if pd.isna(mag_status) or mag_status != "FEITO":
+        if not token_magalu and (pd.isna(mag_status) or mag_status != "FEITO"):
             driver.switch_to.window(aba_mag)  # Mudando para aba do Magalu
             try:
                 # Excluindo produtos do Magalu
@@ -175,13 +371,228 @@ def main():
             except Exception as e:
                 error_msg = f'Não foi possível excluir o produto {sku} no MAGALU - {e}'
                 print(error_msg)
-                logging.error(error_msg, extra={'sku': sku})
+                logging.error(error_msg, extra={'sku': sku, 'coluna': 'Magalu'})
 
             # Atualizando o status - MAGALU
-            produtos_df = orion.planilhas.atualizar_status_csv(produtos_df, "erro_logs.csv", sku, 'Magalu')
-            produtos_df.to_excel('excluir_produtos.xlsx', index=False)
+            produtos_df = registrar_resultado(produtos_df, indice_erros, diario, operacoes, sku, 'Magalu', produto.linha)
+
+    orion.navegadores.contabilizar_bloqueios(driver, 'multiplataforma')
+    diario.fechar()
+    operacoes.fechar()
+    print("Exclusão concluída!")
+
+# Resultado dos SKUs não encontrados em cada plataforma: (valor do resultado, registrar como erro)
+NAO_ENCONTRADOS = {
+    'Tiny': (orion.tiny.NAO_ENCONTRADO, False),
+    'Ecommerce': (orion.opencart.NAO_ENCONTRADO, True),
+    'ML': (None, False),
+    'Magalu': (orion.magalu_api.NAO_ENCONTRADO, False),
+}
+
+# Listagem de cada plataforma para o catálogo local: (navegador, URL da Opencart) -> páginas de produtos.
+# O Magalu fica de fora, pois a pesquisa pelo SKU falha com frequência e o título é usado no lugar.
+LISTAGENS = {
+    'Tiny': lambda driver, url_opencart: orion.tiny.listar_produtos_tiny(driver),
+    'Ecommerce': lambda driver, url_opencart: orion.opencart.listar_produtos_opencart(driver, url_opencart),
+    'ML': lambda driver, url_opencart: orion.mercado_livre.listar_anuncios_ml(driver),
+}
+
+# Função filtrar pelo catálogo
+def filtrar_catalogo(driver: webdriver.Chrome,
+                     coluna: str,
+                     skus: list[str],
+                     url_product_opencart: str | None = None) -> tuple[list[str], dict[str, str | None]]:
+    """Separa, pelo catálogo local da plataforma, os SKUs que não existem nela. O catálogo é montado
+    percorrendo a lista de produtos uma vez e fica em disco até expirar (`orion.catalogo.TTL_HORAS`).
+
+    Args:
+        driver (webdriver.Chrome): Navegador logado na plataforma
+        coluna (str): Coluna de status da plataforma (Tiny, Ecommerce ou ML)
+        skus (list[str]): SKUs pendentes
+        url_product_opencart (str | None, optional): URL da Opencart com o token de acesso. Defaults to None.
+
+    Returns:
+        tuple[list[str], dict[str, str | None]]: SKUs que continuam pendentes e o resultado dos SKUs ausentes,
+        no formato de `registrar_resultados_lote()` com `NAO_ENCONTRADOS[coluna]`
+    """
+    if not skus:
+        return skus, {}
+    catalogo = orion.catalogo.obter_catalogo(PLATAFORMAS[coluna], lambda: LISTAGENS[coluna](driver, url_product_opencart))
+    pendentes, ausentes = catalogo.separar(skus)
+    if ausentes:
+        print(f"{len(ausentes)} PRODUTOS FORA DO CATÁLOGO - {coluna.upper()}")
+    nao_encontrado = NAO_ENCONTRADOS[coluna][0]
+    return pendentes, {sku: nao_encontrado or f"O produto com SKU '{sku}' não está no catálogo" for sku in ausentes}
+
+# Função faixa pelo catálogo
+def faixa_catalogo(driver: webdriver.Chrome,
+                   coluna: str,
+                   skus: list[str],
+                   url_product_opencart: str | None,
+                   faixa: Callable[[list[str]], Iterator[dict[str, str | None]]]) -> Iterator[dict[str, str | None]]:
+    """Monta o catálogo dentro da faixa da plataforma, envia os SKUs ausentes como não encontrados
+    e segue a faixa somente com os SKUs que existem na plataforma."""
+    pendentes, ausentes = filtrar_catalogo(driver, coluna, skus, url_product_opencart)
+    if ausentes:
+        yield ausentes
+    if pendentes:
+        yield from faixa(pendentes)
+
+# Função faixa do Mercado Livre
+def faixa_ml(driver: webdriver.Chrome | None, skus: list[str], token_ml: str | None) -> Iterator[dict[str, str | None]]:
+    """Exclui os produtos no Mercado Livre, pela API em lote ou pelo navegador um a um.
+
+    Args:
+        driver (webdriver.Chrome | None): Navegador do Mercado Livre, None quando a API é usada
+        skus (list[str]): SKUs pendentes
+        token_ml (str | None): Access token da API do Mercado Livre
+
+    Yields:
+        Iterator[dict[str, str | None]]: Erro de cada SKU, `None` quando excluído
+    """
+    if token_ml:
+        yield orion.mercado_livre_api.excluir_produtos_ml(orion.mercado_livre_api.MercadoLivreAPI(token_ml), skus)
+        return
+    for sku in skus:
+        orion.desempenho.definir_sku(sku)
+        try:
+            orion.mercado_livre.excluir_produto_ml(driver, sku)
+            yield {sku: None}
+        except Exception as e:
+            yield {sku: str(e)}
+
+# Função faixa do Magalu
+def faixa_mag(driver: webdriver.Chrome | None, skus: list[str], titulos: dict[str, str], token_magalu: str | None) -> Iterator[dict[str, str | None]]:
+    """Inativa os produtos no Magalu pela API em lote, se houver token, ou exclui pelo navegador
+    (pesquisa pelo título) um a um.
+
+    Args:
+        driver (webdriver.Chrome | None): Navegador do Magalu, None quando a API é usada
+        skus (list[str]): SKUs pendentes
+        titulos (dict[str, str]): Título (Descrição) de cada SKU
+        token_magalu (str | None): Access token da API do Magalu
+
+    Yields:
+        Iterator[dict[str, str | None]]: Erro de cada SKU, `None` quando excluído
+    """
+    if token_magalu:
+        yield orion.magalu_api.excluir_produtos_mag(orion.magalu_api.MagaluAPI(token_magalu), skus)
+        return
+    for sku in skus:
+        orion.desempenho.definir_sku(sku)
+        try:
+            orion.magalu.excluir_produto_mag(driver, sku, titulos[sku])
+            yield {sku: None}
+        except Exception as e:
+            yield {sku: str(e)}
+
+# Função executar faixa
+def _executar_faixa(coluna: str, resultados: Callable[[], Iterator[dict[str, str | None]]], fila: queue.Queue):
+    """Thread de cada plataforma: envia os resultados para o escritor (thread principal) pela `fila`."""
+    try:
+        for resultado in resultados():
+            fila.put(('resultado', coluna, resultado))
+    except Exception as e:
+        fila.put(('erro', coluna, str(e)))
+    finally:
+        fila.put(('fim', coluna, None))
+
+# Função Principal - faixas por plataforma
+def main_faixas(refazer: bool = False,
+                token_ml: str | None = None,
+                token_magalu: str | None = None,
+                catalogo: bool = False):
+    """Exclui os produtos em todas as plataformas ao mesmo tempo. Cada plataforma (faixa) tem o seu
+    navegador e a sua thread e percorre a lista de SKUs de forma independente, então a execução leva
+    o tempo da plataforma mais lenta ao invés da soma de todas.
+
+    Os logins são feitos antes, um de cada vez. As faixas enviam os resultados por uma fila e somente
+    a thread principal grava a planilha, o diário e o histórico de operações.
+
+    Args:
+        refazer (bool, optional): Ignora o histórico de operações e refaz todas as exclusões. Defaults to False.
+        token_ml (str | None, optional): Access token da API do Mercado Livre. Defaults to None.
+        token_magalu (str | None, optional): Access token da API do Magalu. Defaults to None.
+        catalogo (bool, optional): Cada faixa monta o catálogo local da plataforma e não pesquisa os SKUs
+        que não existem nela. Defaults to False.
+    """
+    _, _, _, _, _, produtos_df, indice_erros, diario, operacoes = setup(refazer, navegador=False)
+
+    # SKUs pendentes de cada plataforma, considerando as exclusões já registradas no histórico
+    pendentes = {coluna: [sku for sku, status in zip(produtos_df['SKU'], produtos_df[coluna])
+                          if consultar_historico(operacoes, diario, sku, coluna, status) != "FEITO"]
+                 for coluna in PLATAFORMAS}
+    titulos = dict(zip(produtos_df['SKU'], produtos_df['Descrição']))
+
+    # Um navegador por plataforma, os logins manuais são feitos um de cada vez
+    drivers = {}
+    for coluna, plataforma in PLATAFORMAS.items():
+        if not pendentes[coluna] or (coluna == 'ML' and token_ml) or (coluna == 'Magalu' and token_magalu):
+            continue
+        drivers[coluna] = orion.navegadores.criar_navegador(plataforma)
+    url_product_opencart = None
+    for coluna, driver in drivers.items():
+        retorno = login_plataforma(driver, coluna)
+        if coluna == 'Ecommerce':
+            url_product_opencart = retorno  # URL com o token de acesso da Opencart
+
+    faixas = {
+        'Tiny': lambda skus: orion.tiny.excluir_produtos_lote_por_sku(drivers['Tiny'], skus),
+        'Ecommerce': lambda skus: orion.opencart.excluir_produtos_lote_opencart_por_sku(
+            drivers['Ecommerce'], url_product_opencart, skus),
+        'ML': lambda skus: faixa_ml(drivers.get('ML'), skus, token_ml),
+        'Magalu': lambda skus: faixa_mag(drivers.get('Magalu'), skus, titulos, token_magalu),
+    }
+    fila = queue.Queue()
+    ativas = [coluna for coluna in PLATAFORMAS if pendentes[coluna]]
+    for coluna in ativas:
+        if catalogo and coluna in LISTAGENS and drivers.get(coluna) is not None:
+            resultados = functools.partial(faixa_catalogo, drivers[coluna], coluna, pendentes[coluna],
+                                           url_product_opencart, faixas[coluna])
+        else:
+            resultados = functools.partial(faixas[coluna], pendentes[coluna])
+        threading.Thread(target=_executar_faixa, args=(coluna, resultados, fila),
+                         name=f'faixa-{PLATAFORMAS[coluna]}', daemon=True).start()
+        print(f"FAIXA INICIADA - {coluna.upper()}: {len(pendentes[coluna])} PRODUTOS")
+
+    # Escritor único: somente esta thread grava os status
+    ativas = set(ativas)
+    while ativas:
+        tipo, coluna, dados = fila.get()
+        if tipo == 'resultado':
+            nao_encontrado, nao_encontrado_erro = NAO_ENCONTRADOS[coluna]
+            produtos_df = registrar_resultados_lote(produtos_df, indice_erros, diario, operacoes, dados,
+                                                    coluna, nao_encontrado, nao_encontrado_erro)
+        elif tipo == 'erro':
+            error_msg = f'Faixa {coluna.upper()} interrompida - {dados}'
+            print(error_msg)
+            logging.error(error_msg, extra={'sku': '', 'coluna': coluna})
+        else:
+            ativas.discard(coluna)
+            print(f"FAIXA CONCLUÍDA - {coluna.upper()}")
 
+    for coluna, driver in drivers.items():
+        orion.navegadores.contabilizar_bloqueios(driver, PLATAFORMAS[coluna])
+    diario.fechar()
+    operacoes.fechar()
     print("Exclusão concluída!")
 
 
-main()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exclui os produtos da planilha no Tiny, Opencart, Mercado Livre e Magalu.")
+    parser.add_argument("--refazer", action="store_true",
+                        help="Ignora o histórico de operações e tenta excluir novamente os produtos já excluídos.")
+    parser.add_argument("--token-ml", default=os.environ.get("ML_TOKEN"),
+                        help="Access token da API do Mercado Livre, exclui os anúncios pela API. Defaults to variável de ambiente ML_TOKEN.")
+    parser.add_argument("--token-magalu", default=os.environ.get("MAGALU_TOKEN"),
+                        help="Access token da API do Magalu, inativa os produtos pela API. Defaults to variável de ambiente MAGALU_TOKEN.")
+    parser.add_argument("--perfil-navegador", choices=list(orion.navegadores.PERFIS), default=None,
+                        help="Perfil do navegador usado no lugar do perfil padrão, para comparar os perfis no relatório de desempenho.")
+    parser.add_argument("--faixas", action="store_true",
+                        help="Exclui em todas as plataformas ao mesmo tempo, com um navegador por plataforma.")
+    parser.add_argument("--catalogo", action="store_true",
+                        help="Usa o catálogo local de cada plataforma para não pesquisar os SKUs que não existem nela.")
+    args = parser.parse_args()
+    if args.perfil_navegador:
+        os.environ[orion.navegadores.VARIAVEL_PERFIL] = args.perfil_navegador
+    main(args.refazer, args.token_ml, args.token_magalu, args.faixas, args.catalogo)
@@ -4,3 +4,16 @@ from . import mercado_livre
 from . import planilhas
 from . import tiny
 from . import opencart
+from . import paralelo
+from . import sessoes
+from . import tiny_api
+from . import opencart_http
+from . import opencart_db
+from . import historico
+from . import mercado_livre_api
+from . import magalu_api
+from . import esperas
+from . import desempenho
+from . import dom
+from . import navegadores
+from . import catalogo
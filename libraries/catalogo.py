@@ -0,0 +1,123 @@
+# Importações
+import os
+import json
+import time
+import logging
+from typing import Callable, Iterable
+
+PASTA_CATALOGO = 'catalogo'
+TTL_HORAS = 6  # Produtos criados depois da listagem só aparecem no catálogo seguinte
+
+
+# Catálogo local de produtos de uma plataforma
+class CatalogoProdutos:
+    """Índice local (JSON) dos SKUs que existem em uma plataforma, montado percorrendo a lista de produtos
+    da plataforma de uma só vez (`atualizar()`).
+
+    Enquanto o catálogo estiver dentro do `ttl_horas`, as ações pulam os SKUs que não existem na plataforma,
+    sem abrir a página de pesquisa.
+
+    Args:
+        plataforma (str): Nome da plataforma (tiny, opencart, mercado_livre, magalu)
+        pasta (str, optional): Pasta dos catálogos. Defaults to 'catalogo'.
+        ttl_horas (float, optional): Tempo, em horas, que o catálogo continua valendo. Defaults to 6.
+    """
+    def __init__(self, plataforma: str, pasta: str = PASTA_CATALOGO, ttl_horas: float = TTL_HORAS):
+        self.plataforma = plataforma
+        self.caminho = os.path.join(pasta, f'{plataforma}.json')
+        self.ttl = ttl_horas * 3600
+        self.atualizado_em = 0.0
+        self.skus: set[str] = set()
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                dados = json.load(arquivo)
+            self.atualizado_em = float(dados['atualizado_em'])
+            self.skus = set(dados['skus'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Sem catálogo salvo, precisa ser atualizado
+
+    @property
+    def valido(self) -> bool:
+        """`True` se o catálogo foi montado dentro do TTL."""
+        return time.time() - self.atualizado_em < self.ttl
+
+    def atualizar(self, paginas: Iterable[list[str | None]]) -> int:
+        """Substitui o catálogo pelos produtos listados e salva em disco. Se a listagem falhar no meio,
+        o catálogo anterior é mantido.
+
+        Args:
+            paginas (Iterable[list[str | None]]): SKUs de cada página da lista de produtos (`None` nas linhas sem SKU)
+
+        Raises:
+            RuntimeError: A lista tem produtos, mas nenhum com SKU (localizadores desatualizados)
+
+        Returns:
+            int: Quantidade de produtos no catálogo
+        """
+        skus, linhas = set(), 0
+        for pagina in paginas:
+            linhas += len(pagina)
+            skus.update(str(sku) for sku in pagina if sku)
+        if linhas and not skus:
+            raise RuntimeError(f"Nenhum SKU lido em {linhas} produtos, verifique os localizadores da listagem")
+
+        os.makedirs(os.path.dirname(self.caminho) or '.', exist_ok=True)
+        temporario = f'{self.caminho}.{os.getpid()}.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump({'atualizado_em': time.time(), 'skus': sorted(skus)}, arquivo, ensure_ascii=False)
+        os.replace(temporario, self.caminho)
+
+        self.skus = skus
+        self.atualizado_em = time.time()
+        return len(skus)
+
+    def separar(self, skus: list[str]) -> tuple[list[str], list[str]]:
+        """Separa os SKUs que precisam ser processados dos que não existem na plataforma.
+
+        Args:
+            skus (list[str]): SKUs pendentes
+
+        Returns:
+            tuple[list[str], list[str]]: SKUs encontrados (todos, se o catálogo expirou) e SKUs ausentes
+        """
+        if not self.valido:
+            return list(skus), []
+        presentes, ausentes = [], []
+        for sku in skus:
+            (presentes if str(sku) in self.skus else ausentes).append(sku)
+        return presentes, ausentes
+
+
+# Função obter catálogo
+def obter_catalogo(plataforma: str,
+                   listar: Callable[[], Iterable[list[str | None]]],
+                   ttl_horas: float = TTL_HORAS,
+                   pasta: str = PASTA_CATALOGO) -> CatalogoProdutos:
+    """Carrega o catálogo da plataforma e, se expirou, percorre a lista de produtos para atualizá-lo.
+    Se a listagem falhar, o catálogo fica expirado e os SKUs seguem para a pesquisa normal.
+
+    Args:
+        plataforma (str): Nome da plataforma (tiny, opencart, mercado_livre, magalu)
+        listar (Callable[[], Iterable[list[str | None]]]): Função que percorre as páginas da lista de produtos,
+        por exemplo `tiny.listar_produtos_tiny(driver)`
+        ttl_horas (float, optional): Tempo, em horas, que o catálogo continua valendo. Defaults to 6.
+        pasta (str, optional): Pasta dos catálogos. Defaults to 'catalogo'.
+
+    Returns:
+        CatalogoProdutos: Catálogo da plataforma
+    """
+    catalogo = CatalogoProdutos(plataforma, pasta, ttl_horas)
+    if catalogo.valido:
+        print(f"CATÁLOGO EM CACHE - {plataforma.upper()}: {len(catalogo.skus)} PRODUTOS")
+        return catalogo
+
+    print(f"MONTANDO O CATÁLOGO - {plataforma.upper()}")
+    try:
+        total = catalogo.atualizar(listar())
+    except Exception as e:
+        error_msg = f"Erro ao montar o catálogo - {plataforma.upper()} - {e}"
+        print(error_msg)
+        logging.error(error_msg, extra={'sku': ''})
+    else:
+        print(f"CATÁLOGO MONTADO - {plataforma.upper()}: {total} PRODUTOS")
+    return catalogo
@@ -0,0 +1,166 @@
+# Importações
+import os
+import json
+import time
+import atexit
+import inspect
+import functools
+import threading
+import contextvars
+from types import ModuleType
+import pandas as pd
+
+ARQUIVO_TEMPOS = 'tempos.jsonl'
+# Identificador da execução, herdado pelos processos filhos (modo paralelo)
+EXECUCAO = os.environ.setdefault('ORION_EXECUCAO', time.strftime('%Y%m%d-%H%M%S'))
+
+_sku_atual = contextvars.ContextVar('sku_atual', default='')
+# Tempo gasto nas etapas chamadas dentro da etapa atual, descontado do tempo exclusivo dela
+_tempo_filhas = contextvars.ContextVar('tempo_filhas', default=None)
+_IGNORAR_NA_PILHA = True  # Os envoltórios deste módulo não contam como etapa em `esperas`
+
+
+# Registro dos tempos
+class RegistroTempos:
+    """Acumula os tempos de cada etapa em memória e grava em lotes no arquivo JSON-lines.
+
+    Args:
+        caminho (str, optional): Arquivo onde os tempos são gravados. Defaults to 'tempos.jsonl'.
+        a_cada (int, optional): Quantidade de registros acumulados antes de gravar. Defaults to 50.
+    """
+    def __init__(self, caminho: str = ARQUIVO_TEMPOS, a_cada: int = 50):
+        self.caminho = caminho
+        self.a_cada = a_cada
+        self.pendentes: list[str] = []
+        self.lock = threading.Lock()
+
+    def registrar(self, plataforma: str, etapa: str, duracao: float, ok: bool,
+                  exclusivo: float | None = None, aninhada: bool = False):
+        """Registra o tempo de uma etapa para o SKU atual. `exclusivo` é a duração sem o tempo das
+        etapas chamadas dentro dela e `aninhada` indica que a etapa foi chamada por outra etapa."""
+        linha = json.dumps({'execucao': EXECUCAO, 'inicio': round(time.time() - duracao, 3),
+                            'plataforma': plataforma, 'etapa': etapa, 'sku': _sku_atual.get(),
+                            'duracao': round(duracao, 4),
+                            'exclusivo': round(duracao if exclusivo is None else exclusivo, 4),
+                            'aninhada': aninhada, 'ok': ok}, ensure_ascii=False)
+        with self.lock:
+            self.pendentes.append(linha)
+            if len(self.pendentes) >= self.a_cada:
+                self._gravar()
+
+    def _gravar(self):
+        if not self.pendentes:
+            return
+        with open(self.caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write('\n'.join(self.pendentes) + '\n')
+        self.pendentes = []
+
+    def gravar(self):
+        """Grava os registros pendentes no arquivo. Deve ser chamada no fim de cada processo
+        (o `atexit` não roda nos workers do modo paralelo)."""
+        with self.lock:
+            self._gravar()
+
+
+REGISTRO = RegistroTempos()
+atexit.register(REGISTRO.gravar)
+
+
+# Função definir SKU
+def definir_sku(sku: str):
+    """Define o SKU do produto em processamento, gravado junto com os tempos das etapas.
+
+    Args:
+        sku (str): SKU do produto
+    """
+    _sku_atual.set('' if sku is None else str(sku))
+
+
+# Função cronometrar
+def cronometrar(plataforma: str):
+    """Decorador que registra o tempo de cada chamada da função como uma etapa da plataforma.
+    Quando uma etapa chama outra, o tempo da etapa chamada é descontado do tempo exclusivo da
+    etapa que chamou, então o total do relatório não conta o mesmo tempo duas vezes.
+
+    Args:
+        plataforma (str): Nome da plataforma (tiny, opencart, mercado_livre, magalu)
+    """
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            mae = _tempo_filhas.get()
+            filhas = [0.0]
+            token = _tempo_filhas.set(filhas)
+            inicio = time.perf_counter()
+            ok = False
+            try:
+                resultado = funcao(*args, **kwargs)
+                ok = True
+                return resultado
+            finally:
+                duracao = time.perf_counter() - inicio
+                _tempo_filhas.reset(token)
+                if mae is not None:
+                    mae[0] += duracao
+                REGISTRO.registrar(plataforma, funcao.__name__, duracao, ok,
+                                   exclusivo=max(duracao - filhas[0], 0.0), aninhada=mae is not None)
+        envoltorio.cronometrada = True
+        return envoltorio
+    return decorador
+
+
+# Função instrumentar módulo
+def instrumentar_modulo(modulo: ModuleType, plataforma: str):
+    """Aplica `cronometrar()` em todas as funções públicas definidas no módulo.
+
+    Args:
+        modulo (ModuleType): Módulo que será instrumentado, normalmente `sys.modules[__name__]`
+        plataforma (str): Nome da plataforma
+    """
+    for nome, funcao in list(vars(modulo).items()):
+        if (inspect.isfunction(funcao) and funcao.__module__ == modulo.__name__
+                and not nome.startswith('_') and not getattr(funcao, 'cronometrada', False)):
+            setattr(modulo, nome, cronometrar(plataforma)(funcao))
+
+
+# Função relatório
+def relatorio(caminho: str = ARQUIVO_TEMPOS, execucao: str | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Calcula p50, p95 e máximo de cada etapa por plataforma e os produtos por hora de cada execução.
+    O `total` de cada etapa usa o tempo exclusivo (sem as etapas chamadas dentro dela), então a soma
+    dos totais é o tempo real gasto nas etapas.
+
+    Args:
+        caminho (str, optional): Arquivo dos tempos. Defaults to 'tempos.jsonl'.
+        execucao (str | None, optional): Somente uma execução, `ultima` para a mais recente. Defaults to None.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: Tempos por etapa e produtos por hora por execução
+    """
+    tempos = pd.read_json(caminho, lines=True, dtype={'execucao': str, 'sku': str})
+    if execucao == 'ultima':
+        execucao = tempos['execucao'].max()
+    if execucao:
+        tempos = tempos[tempos['execucao'] == execucao]
+    # Registros antigos, sem o tempo exclusivo
+    exclusivo = tempos['exclusivo'] if 'exclusivo' in tempos else pd.Series(float('nan'), index=tempos.index)
+    tempos = tempos.assign(exclusivo=exclusivo.fillna(tempos['duracao']))
+
+    etapas = (tempos.groupby(['plataforma', 'etapa'])
+              .agg(chamadas=('duracao', 'size'),
+                   erros=('ok', lambda ok: int((~ok.astype(bool)).sum())),
+                   p50=('duracao', lambda d: d.quantile(0.5)),
+                   p95=('duracao', lambda d: d.quantile(0.95)),
+                   maximo=('duracao', 'max'),
+                   total=('exclusivo', 'sum'))
+              .round(3)
+              .sort_values('total', ascending=False))
+
+    produtos = tempos[tempos['sku'].fillna('') != '']
+    execucoes = produtos.assign(fim=produtos['inicio'] + produtos['duracao']).groupby('execucao').agg(
+        produtos=('sku', 'nunique'),
+        inicio=('inicio', 'min'),
+        fim=('fim', 'max'))
+    horas = (execucoes['fim'] - execucoes['inicio']) / 3600
+    execucoes['produtos_por_hora'] = (execucoes['produtos'] / horas.where(horas > 0)).round(1)
+    return etapas, execucoes[['produtos', 'produtos_por_hora']]
+
@@ -0,0 +1,322 @@
+# Importações
+import os
+from typing import Callable, Iterable
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+from .esperas import EsperaAdaptativa
+
+_IGNORAR_NA_PILHA = True  # A etapa das esperas é a função que chamou `aguardar_campos`
+
+# Resultado das pesquisas (`aguardar_resultado`)
+ENCONTRADO = 'ENCONTRADO'
+NAO_ENCONTRADO = 'NÃO ENCONTRADO'
+DESCONHECIDO = 'DESCONHECIDO'  # Nenhum dos dois apareceu dentro do tempo
+# Atributo dos elementos que já estavam na página antes da pesquisa (`marcar_antigos`)
+ATRIBUTO_ANTIGO = 'data-resultado-antigo'
+
+# Resolve os localizadores do Selenium (By, valor) dentro do navegador
+_JS_RESOLVER = """
+function resolver(localizador) {
+    const [tipo, valor] = localizador;
+    switch (tipo) {
+        case 'xpath':
+            return document.evaluate(valor, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'id':
+            return document.getElementById(valor);
+        case 'name':
+            return document.getElementsByName(valor)[0] || null;
+        case 'class name':
+            return document.getElementsByClassName(valor)[0] || null;
+        case 'tag name':
+            return document.getElementsByTagName(valor)[0] || null;
+        default:
+            return document.querySelector(valor);
+    }
+}
+function resolverTodos(localizador) {
+    const [tipo, valor] = localizador;
+    switch (tipo) {
+        case 'xpath': {
+            const nos = document.evaluate(valor, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: nos.snapshotLength}, (_, indice) => nos.snapshotItem(indice));
+        }
+        case 'id':
+            return Array.from(document.querySelectorAll(`[id="${valor}"]`));
+        case 'name':
+            return Array.from(document.getElementsByName(valor));
+        case 'class name':
+            return Array.from(document.getElementsByClassName(valor));
+        case 'tag name':
+            return Array.from(document.getElementsByTagName(valor));
+        default:
+            return Array.from(document.querySelectorAll(valor));
+    }
+}
+function ler(elemento) {
+    if (elemento === null) return null;
+    if (elemento.type === 'checkbox' || elemento.type === 'radio') return elemento.checked;
+    if ('value' in elemento && elemento.tagName !== 'BUTTON' && elemento.tagName !== 'LI') return elemento.value;
+    return elemento.textContent.trim();
+}
+"""
+
+_JS_LER = _JS_RESOLVER + """
+const [localizadores, visiveis] = arguments;
+const resultado = {};
+for (const [nome, localizador] of Object.entries(localizadores)) {
+    const elemento = resolver(localizador);
+    resultado[nome] = visiveis && elemento !== null && elemento.getClientRects().length === 0 ? null : ler(elemento);
+}
+return resultado;
+"""
+
+_JS_ESCREVER = _JS_RESOLVER + """
+function definir(elemento, valor) {
+    if (elemento.type === 'checkbox' || elemento.type === 'radio') {
+        elemento.checked = Boolean(valor);
+    } else {
+        // Usa o setter nativo para que frameworks (React, máscaras) percebam a alteração
+        const descritor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(elemento), 'value');
+        if (descritor && descritor.set) {
+            descritor.set.call(elemento, String(valor));
+        } else {
+            elemento.value = String(valor);
+        }
+    }
+    for (const evento of ['input', 'change', 'keyup', 'blur']) {
+        elemento.dispatchEvent(new Event(evento, {bubbles: true}));
+    }
+}
+const [localizadores, valores] = arguments;
+const resultado = {};
+const ausentes = [];
+for (const [nome, localizador] of Object.entries(localizadores)) {
+    const elemento = resolver(localizador);
+    if (elemento === null) {
+        ausentes.push(nome);
+        continue;
+    }
+    const antes = ler(elemento);
+    definir(elemento, valores[nome]);
+    resultado[nome] = {antes: antes, depois: ler(elemento)};
+}
+return [resultado, ausentes];
+"""
+
+
+_JS_PRIMEIRO_VISIVEL = _JS_RESOLVER + """
+const atributo = arguments[1];
+for (const [nome, localizador] of Object.entries(arguments[0])) {
+    const visivel = resolverTodos(localizador).some(
+        elemento => !elemento.hasAttribute(atributo) && elemento.getClientRects().length > 0);
+    if (visivel) return nome;
+}
+return null;
+"""
+
+_JS_MARCAR_ANTIGOS = _JS_RESOLVER + """
+const [localizadores, atributo] = arguments;
+let total = 0;
+for (const localizador of localizadores) {
+    for (const elemento of resolverTodos(localizador)) {
+        elemento.setAttribute(atributo, '');
+        total++;
+    }
+}
+return total;
+"""
+
+
+def _serializar(localizadores: dict[str, tuple[By, str]]) -> dict[str, list[str]]:
+    return {nome: [tipo, valor] for nome, (tipo, valor) in localizadores.items()}
+
+
+# Função ler campos
+def ler_campos(driver: webdriver.Chrome, localizadores: dict[str, tuple[By, str]], visiveis: bool = False) -> dict:
+    """Lê o valor de vários elementos em uma única chamada ao navegador.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        localizadores (dict[str, tuple[By, str]]): Localizador de cada campo pelo nome
+        visiveis (bool, optional): Considera somente os elementos visíveis. Defaults to False.
+
+    Returns:
+        dict: Valor de cada campo (`checked` para checkbox, `value` para inputs e selects e o texto
+        para os demais elementos), `None` quando o elemento não existe (ou está oculto, com `visiveis`)
+    """
+    return driver.execute_script(_JS_LER, _serializar(localizadores), visiveis)
+
+
+# Função aguardar campos
+def aguardar_campos(driver: webdriver.Chrome,
+                    localizadores: dict[str, tuple[By, str]],
+                    timeout: float = 10,
+                    plataforma: str = 'geral',
+                    visiveis: bool = True) -> dict:
+    """Aguarda todos os elementos ficarem visíveis e retorna os valores, lendo todos em cada verificação.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        localizadores (dict[str, tuple[By, str]]): Localizador de cada campo pelo nome
+        timeout (float, optional): Tempo máximo de espera em segundos. Defaults to 10.
+        plataforma (str, optional): Plataforma usada na espera adaptativa. Defaults to 'geral'.
+        visiveis (bool, optional): Aguarda os elementos ficarem visíveis. Com `False`, basta existirem
+        (campos de abas ocultas preenchidos por `escrever_campos()`). Defaults to True.
+
+    Raises:
+        RuntimeError: Algum dos elementos não apareceu dentro do tempo
+
+    Returns:
+        dict: Valor de cada campo
+    """
+    ultimo = {}
+
+    def todos_presentes(d):
+        ultimo.update(ler_campos(d, localizadores, visiveis))
+        return all(valor is not None for valor in ultimo.values()) and ultimo
+
+    try:
+        return EsperaAdaptativa(driver, timeout, plataforma).until(todos_presentes)
+    except TimeoutException as e:
+        ausentes = [nome for nome, valor in ultimo.items() if valor is None]
+        raise RuntimeError(f"Campos não encontrados{' ou ocultos' if visiveis else ''}: {', '.join(ausentes)}") from e
+
+
+# Função escrever campos
+def escrever_campos(driver: webdriver.Chrome,
+                    localizadores: dict[str, tuple[By, str]],
+                    valores: dict,
+                    conferir: bool = True,
+                    comparar: Callable[[object, object], bool] | None = None) -> dict[str, dict]:
+    """Altera o valor de vários elementos em uma única chamada ao navegador, disparando os eventos
+    `input`, `change`, `keyup` e `blur` que o JavaScript da página espera, e confere os valores lidos de volta.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        localizadores (dict[str, tuple[By, str]]): Localizador de cada campo pelo nome
+        valores (dict): Novo valor de cada campo pelo nome (bool para checkbox)
+        conferir (bool, optional): Gera um erro se algum campo não ficou com o valor informado. Com `False`,
+        quem chama confere o resultado (`divergentes()`). Defaults to True.
+        comparar (Callable[[object, object], bool] | None, optional): Compara o valor informado com o lido,
+        para campos com máscara (por exemplo preços). Defaults to None, valores iguais.
+
+    Raises:
+        RuntimeError: Algum dos elementos não foi encontrado ou não ficou com o valor informado
+
+    Returns:
+        dict[str, dict]: Valor `antes` e `depois` de cada campo
+    """
+    localizadores = {nome: localizador for nome, localizador in localizadores.items() if nome in valores}
+    resultado, ausentes = driver.execute_script(_JS_ESCREVER, _serializar(localizadores), valores)
+    if ausentes:
+        raise RuntimeError(f"Campos não encontrados: {', '.join(ausentes)}")
+    if conferir:
+        diferentes = divergentes(resultado, valores, comparar)
+        if diferentes:
+            raise RuntimeError("Campos não alterados: " + ', '.join(
+                f"{nome} (esperado {esperado!r}, lido {lido!r})" for nome, (esperado, lido) in diferentes.items()))
+    return resultado
+
+
+# Função divergentes
+def divergentes(resultado: dict[str, dict],
+                valores: dict,
+                comparar: Callable[[object, object], bool] | None = None) -> dict[str, tuple]:
+    """Retorna os campos de `escrever_campos()` que não ficaram com o valor informado.
+
+    Args:
+        resultado (dict[str, dict]): Retorno de `escrever_campos()`
+        valores (dict): Valores informados em `escrever_campos()`
+        comparar (Callable[[object, object], bool] | None, optional): Compara o valor informado com o lido.
+        Defaults to None, valores iguais, sem diferenciar as quebras de linha dos textarea.
+
+    Returns:
+        dict[str, tuple]: Valor esperado e lido de cada campo divergente
+    """
+    def iguais(esperado, lido) -> bool:
+        if isinstance(lido, bool):
+            return bool(esperado) == lido
+        return str(esperado).replace('\r\n', '\n') == str(lido).replace('\r\n', '\n')
+
+    comparar = comparar or iguais
+    return {nome: (valores[nome], campo['depois']) for nome, campo in resultado.items()
+            if not comparar(valores[nome], campo['depois'])}
+
+
+# Função agrupar por prefixo
+def agrupar_por_prefixo(skus: Iterable[str], tamanho_minimo: int = 3) -> tuple[list[tuple[str, list[str]]], list[str]]:
+    """Agrupa os SKUs pelos primeiros `tamanho_minimo` caracteres, para que cada grupo seja excluído
+    filtrando a lista uma única vez pelo prefixo comum do grupo, com uma confirmação por página.
+
+    Args:
+        skus (Iterable[str]): SKUs pendentes
+        tamanho_minimo (int, optional): Tamanho mínimo do prefixo usado no filtro. Defaults to 3.
+
+    Returns:
+        tuple[list[tuple[str, list[str]]], list[str]]: Grupos (prefixo comum, SKUs) com pelo menos dois SKUs
+        e os SKUs avulsos, sem outro SKU com o mesmo prefixo, que são pesquisados individualmente
+    """
+    por_inicio: dict[str, list[str]] = {}
+    avulsos = []
+    for sku in sorted({str(sku) for sku in skus}):
+        if len(sku) < tamanho_minimo:
+            avulsos.append(sku)
+        else:
+            por_inicio.setdefault(sku[:tamanho_minimo], []).append(sku)
+
+    grupos = []
+    for grupo in por_inicio.values():
+        if len(grupo) > 1:
+            grupos.append((os.path.commonprefix(grupo), grupo))
+        else:
+            avulsos.extend(grupo)
+    return grupos, sorted(avulsos)
+
+
+# Função marcar antigos
+def marcar_antigos(driver: webdriver.Chrome, *localizadores: tuple[By, str]) -> int:
+    """Marca os elementos que já estão na página, para que `aguardar_resultado()` só considere os
+    elementos renderizados pela nova pesquisa. Use antes de enviar a pesquisa, assim o resultado
+    ou o aviso de nenhum resultado da pesquisa anterior não é confundido com o novo.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        *localizadores (tuple[By, str]): Localizadores do resultado e do aviso de nenhum resultado
+
+    Returns:
+        int: Quantidade de elementos marcados
+    """
+    return driver.execute_script(_JS_MARCAR_ANTIGOS, [[tipo, valor] for tipo, valor in localizadores], ATRIBUTO_ANTIGO)
+
+
+# Função aguardar resultado
+def aguardar_resultado(driver: webdriver.Chrome,
+                       encontrado: tuple[By, str],
+                       nao_encontrado: tuple[By, str],
+                       timeout: float = 10,
+                       plataforma: str = 'geral',
+                       etapa: str | None = None) -> str:
+    """Aguarda o resultado de uma pesquisa verificando, na mesma chamada ao navegador, o elemento do
+    produto encontrado e o aviso de nenhum resultado da plataforma. Retorna assim que um dos dois
+    aparece, sem esperar o timeout inteiro quando o produto não existe. Os elementos marcados por
+    `marcar_antigos()` são ignorados.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        encontrado (tuple[By, str]): Localizador do elemento que aparece quando o produto é encontrado
+        nao_encontrado (tuple[By, str]): Localizador do aviso de nenhum resultado
+        timeout (float, optional): Tempo máximo de espera em segundos. Defaults to 10.
+        plataforma (str, optional): Plataforma usada na espera adaptativa. Defaults to 'geral'.
+        etapa (str | None, optional): Etapa da espera adaptativa, se não informada usa o nome da função
+        que chamou. Defaults to None.
+
+    Returns:
+        str: `ENCONTRADO`, `NAO_ENCONTRADO` ou `DESCONHECIDO` quando nenhum dos dois apareceu no tempo
+    """
+    localizadores = _serializar({ENCONTRADO: encontrado, NAO_ENCONTRADO: nao_encontrado})
+    try:
+        return EsperaAdaptativa(driver, timeout, plataforma, etapa).until(
+            lambda d: d.execute_script(_JS_PRIMEIRO_VISIVEL, localizadores, ATRIBUTO_ANTIGO))
+    except TimeoutException:
+        return DESCONHECIDO
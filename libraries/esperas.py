@@ -0,0 +1,197 @@
+# Importações
+import os
+import re
+import sys
+import json
+import time
+import atexit
+import bisect
+import threading
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+ARQUIVO_ESPERAS = 'esperas.json'
+# Limites (em segundos) de cada faixa do histograma de latência
+FAIXAS = [0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 5, 7.5, 10, 15, 20, 30, 45, 60]
+MIN_AMOSTRAS = 20  # Amostras necessárias para usar o tempo aprendido no lugar do padrão
+MARGEM = 2.0  # Multiplicador aplicado ao p99
+FOLGA = 1.0  # Segundos somados ao p99 * MARGEM
+TIMEOUT_MINIMO = 1.0
+TIMEOUT_MAXIMO = 60.0
+POLL_MINIMO = 0.05
+POLL_MAXIMO = 0.5
+# Timeouts nesta execução a partir dos quais a etapa volta ao timeout padrão do código
+MIN_TIMEOUTS = 3
+TAXA_TIMEOUTS = 0.1  # Proporção de timeouts entre as esperas da etapa nesta execução
+_IGNORAR_NA_PILHA = True  # Funções deste módulo não contam como etapa
+
+
+# Histogramas de latência por plataforma e etapa
+class HistogramasEspera:
+    """Guarda um histograma de latência por etapa (`plataforma|etapa`) e calcula o timeout e a
+    frequência de verificação de cada espera. Os histogramas são salvos em JSON entre as execuções.
+
+    Ao salvar, somente as amostras novas são somadas ao arquivo, então os workers do modo paralelo
+    e o coordenador podem salvar no mesmo arquivo sem apagar o aprendizado um do outro.
+
+    Args:
+        caminho (str, optional): Arquivo JSON dos histogramas. Defaults to 'esperas.json'.
+    """
+    def __init__(self, caminho: str = ARQUIVO_ESPERAS):
+        self.caminho = caminho
+        self.lock = threading.Lock()
+        self.etapas: dict[str, dict] = self._ler()
+        self.novas: dict[str, dict] = {}  # Amostras registradas desde o último salvamento
+
+    def _ler(self) -> dict[str, dict]:
+        """Lê os histogramas salvos, juntando as chaves antigas `funcao:linha` na chave da função."""
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                salvas = json.load(arquivo)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        etapas: dict[str, dict] = {}
+        for chave, etapa in salvas.items():
+            _somar(etapas, re.sub(r':\d+$', '', chave), etapa)
+        return etapas
+
+    def _etapa(self, chave: str) -> dict:
+        return _etapa_vazia(self.etapas, chave)
+
+    def percentil(self, chave: str, p: float) -> float | None:
+        """Retorna o limite superior da faixa do percentil `p` (0 a 1), ou `None` sem amostras suficientes."""
+        faixas = self.etapas.get(chave, {}).get('faixas')
+        total = sum(faixas) if faixas else 0
+        if total < MIN_AMOSTRAS:
+            return None
+        acumulado = 0
+        for indice, quantidade in enumerate(faixas):
+            acumulado += quantidade
+            if acumulado >= p * total:
+                return FAIXAS[indice] if indice < len(FAIXAS) else TIMEOUT_MAXIMO
+        return TIMEOUT_MAXIMO
+
+    def parametros(self, chave: str, timeout_padrao: float) -> tuple[float, float]:
+        """Calcula o timeout (p99 * MARGEM + FOLGA) e a frequência de verificação (p50 / 5) da etapa.
+        Sem amostras suficientes, usa o timeout padrão do código. Se as esperas da etapa nesta execução
+        passaram de `MIN_TIMEOUTS` e `TAXA_TIMEOUTS` em timeouts (a plataforma ficou mais lenta que o
+        histograma), o timeout não fica menor que o padrão até a taxa baixar.
+
+        Args:
+            chave (str): Etapa no formato `plataforma|etapa`
+            timeout_padrao (float): Timeout usado no código antes do aprendizado
+
+        Returns:
+            tuple[float, float]: Timeout e frequência de verificação em segundos
+        """
+        with self.lock:
+            p99 = self.percentil(chave, 0.99)
+            p50 = self.percentil(chave, 0.5)
+            recentes = self.novas.get(chave, {'faixas': [], 'timeouts': 0})
+            timeouts = recentes['timeouts']
+            esperas = sum(recentes['faixas']) + timeouts
+        if p99 is None:
+            return timeout_padrao, POLL_MAXIMO
+        timeout = min(max(p99 * MARGEM + FOLGA, TIMEOUT_MINIMO), TIMEOUT_MAXIMO)
+        if timeouts >= MIN_TIMEOUTS and timeouts >= TAXA_TIMEOUTS * esperas:
+            timeout = max(timeout, timeout_padrao)
+        poll = min(max(p50 / 5, POLL_MINIMO), POLL_MAXIMO)
+        return timeout, poll
+
+    def registrar(self, chave: str, latencia: float):
+        """Registra a latência de uma espera concluída com sucesso."""
+        faixa = bisect.bisect_left(FAIXAS, latencia)
+        with self.lock:
+            self._etapa(chave)['faixas'][faixa] += 1
+            _etapa_vazia(self.novas, chave)['faixas'][faixa] += 1
+
+    def registrar_timeout(self, chave: str):
+        """Registra uma espera que terminou em timeout (não entra no histograma, mas é usada por `parametros()`)."""
+        with self.lock:
+            self._etapa(chave)['timeouts'] += 1
+            _etapa_vazia(self.novas, chave)['timeouts'] += 1
+
+    def salvar(self):
+        """Soma as amostras novas aos histogramas do arquivo JSON e salva, se houver amostras novas.
+        Deve ser chamada no fim de cada processo (o `atexit` não roda nos workers do modo paralelo)."""
+        with self.lock:
+            if not self.novas:
+                return
+            etapas = self._ler()
+            for chave, etapa in self.novas.items():
+                _somar(etapas, chave, etapa)
+            temporario = f'{self.caminho}.{os.getpid()}.tmp'
+            with open(temporario, 'w', encoding='utf-8') as arquivo:
+                json.dump(etapas, arquivo)
+            os.replace(temporario, self.caminho)
+            self.etapas = etapas
+            self.novas = {}
+
+
+def _etapa_vazia(etapas: dict[str, dict], chave: str) -> dict:
+    return etapas.setdefault(chave, {'faixas': [0] * (len(FAIXAS) + 1), 'timeouts': 0})
+
+
+def _somar(etapas: dict[str, dict], chave: str, etapa: dict):
+    """Soma o histograma `etapa` ao histograma da `chave` em `etapas`."""
+    destino = _etapa_vazia(etapas, chave)
+    for indice, quantidade in enumerate(etapa.get('faixas', [])[:len(destino['faixas'])]):
+        destino['faixas'][indice] += quantidade
+    destino['timeouts'] += etapa.get('timeouts', 0)
+
+
+HISTOGRAMAS = HistogramasEspera()
+atexit.register(HISTOGRAMAS.salvar)
+
+
+# Função nome da etapa
+def _etapa_chamadora() -> str:
+    """Identifica a etapa pelo nome da função que chamou a espera, ignorando os auxiliares de clique
+    e os módulos marcados com `_IGNORAR_NA_PILHA` (como os envoltórios de `desempenho`). O nome não
+    muda quando o arquivo é editado, então o aprendizado é mantido entre as versões do código."""
+    frame = sys._getframe(2)
+    while frame is not None and (frame.f_globals.get('_IGNORAR_NA_PILHA') or frame.f_code.co_name == 'clicar_elemento'):
+        frame = frame.f_back
+    if frame is None:
+        return 'desconhecida'
+    return frame.f_code.co_name
+
+
+# Espera adaptativa
+class EsperaAdaptativa(WebDriverWait):
+    """Substitui o `WebDriverWait` usando o timeout e a frequência de verificação aprendidos para cada etapa.
+
+    O `timeout` informado é usado até a etapa ter amostras suficientes. Depois, o timeout passa a ser
+    o p99 das latências observadas com margem, e a verificação acompanha a latência da etapa.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        timeout (float): Timeout padrão em segundos
+        plataforma (str, optional): Plataforma da espera (tiny, opencart, mercado_livre, magalu). Defaults to 'geral'.
+        etapa (str | None, optional): Nome da etapa, se não informado usa o nome da função que chamou `until`.
+        Informe quando a mesma função tem esperas com latências diferentes. Defaults to None.
+    """
+    def __init__(self, driver, timeout: float, plataforma: str = 'geral', etapa: str | None = None, **kwargs):
+        super().__init__(driver, timeout, **kwargs)
+        self.timeout_padrao = float(timeout)
+        self.plataforma = plataforma
+        self.etapa = etapa
+
+    def _esperar(self, metodo, message: str, negar: bool):
+        chave = f'{self.plataforma}|{self.etapa or _etapa_chamadora()}'
+        self._timeout, self._poll = HISTOGRAMAS.parametros(chave, self.timeout_padrao)
+
+        inicio = time.monotonic()
+        try:
+            resultado = super().until_not(metodo, message) if negar else super().until(metodo, message)
+        except TimeoutException:
+            HISTOGRAMAS.registrar_timeout(chave)
+            raise
+        HISTOGRAMAS.registrar(chave, time.monotonic() - inicio)
+        return resultado
+
+    def until(self, method, message: str = ''):
+        return self._esperar(method, message, negar=False)
+
+    def until_not(self, method, message: str = ''):
+        return self._esperar(method, message, negar=True)
@@ -0,0 +1,113 @@
+# Importações
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+# Histórico de operações entre execuções
+class HistoricoOperacoes:
+    """Histórico persistente (SQLite) das ações já feitas em cada plataforma, entre execuções e planilhas.
+
+    Cada ação é identificada por `(plataforma, SKU, ação, hash dos dados)`. Se a mesma ação, com os
+    mesmos dados, já foi feita dentro do `ttl_horas`, ela pode ser pulada. As chaves válidas ficam em
+    memória, então a consulta por linha é feita em tempo constante.
+
+    Args:
+        caminho (str, optional): Caminho do banco SQLite. Defaults to 'historico_operacoes.db'.
+        ttl_horas (float, optional): Tempo, em horas, que uma ação continua valendo. Defaults to 168 (7 dias).
+        refazer (bool, optional): Ignora o histórico e refaz todas as ações (continua registrando). Defaults to False.
+    """
+    def __init__(self, caminho: str = 'historico_operacoes.db', ttl_horas: float = 168, refazer: bool = False):
+        self.ttl = ttl_horas * 3600
+        self.refazer = refazer
+        self.lock = threading.Lock()
+        self.conexao = sqlite3.connect(caminho, timeout=30, check_same_thread=False)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("""
+            CREATE TABLE IF NOT EXISTS operacoes (
+                plataforma TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                acao TEXT NOT NULL,
+                hash_dados TEXT NOT NULL,
+                feito_em REAL NOT NULL,
+                PRIMARY KEY (plataforma, sku, acao, hash_dados))""")
+        self.conexao.commit()
+
+        # Carregando as ações ainda válidas uma única vez
+        limite = time.time() - self.ttl
+        self.feitas = {
+            tuple(linha) for linha in self.conexao.execute(
+                "SELECT plataforma, sku, acao, hash_dados FROM operacoes WHERE feito_em >= ?", (limite,))
+        }
+
+    @staticmethod
+    def hash_dados(dados=None) -> str:
+        """Gera o hash dos dados da ação (preços, textos...). Sem dados, retorna uma string vazia.
+
+        Args:
+            dados (optional): Dados da ação, qualquer objeto serializável em JSON. Defaults to None.
+
+        Returns:
+            str: Hash SHA-1 dos dados.
+        """
+        if dados is None:
+            return ''
+        texto = json.dumps(dados, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha1(texto.encode('utf-8')).hexdigest()
+
+    def ja_feito(self, plataforma: str, sku: str, acao: str, dados=None) -> bool:
+        """Verifica se a ação, com os mesmos dados, já foi feita dentro do TTL.
+
+        Args:
+            plataforma (str): Nome da plataforma (tiny, opencart, mercado_livre, magalu).
+            sku (str): SKU ou ID do produto.
+            acao (str): Nome da ação, por exemplo `excluir` ou `atualizar_precos`.
+            dados (optional): Dados da ação. Defaults to None.
+
+        Returns:
+            bool: `True` se a ação pode ser pulada, `False` caso contrário.
+        """
+        if self.refazer:
+            return False
+        return (plataforma, str(sku), acao, self.hash_dados(dados)) in self.feitas
+
+    def registrar(self, plataforma: str, sku: str, acao: str, dados=None):
+        """Registra que a ação foi feita com sucesso.
+
+        Args:
+            plataforma (str): Nome da plataforma (tiny, opencart, mercado_livre, magalu).
+            sku (str): SKU ou ID do produto.
+            acao (str): Nome da ação, por exemplo `excluir` ou `atualizar_precos`.
+            dados (optional): Dados da ação. Defaults to None.
+        """
+        chave = (plataforma, str(sku), acao, self.hash_dados(dados))
+        with self.lock:
+            self.conexao.execute(
+                "INSERT OR REPLACE INTO operacoes (plataforma, sku, acao, hash_dados, feito_em) VALUES (?, ?, ?, ?, ?)",
+                (*chave, time.time()))
+            self.conexao.commit()
+            self.feitas.add(chave)
+
+    def registrar_lote(self, plataforma: str, acao: str, itens: list[tuple[str, object]]):
+        """Registra várias ações feitas com sucesso em uma única transação.
+
+        Args:
+            plataforma (str): Nome da plataforma (tiny, opencart, mercado_livre, magalu).
+            acao (str): Nome da ação, por exemplo `excluir` ou `atualizar_precos`.
+            itens (list[tuple[str, object]]): SKU e dados de cada ação.
+        """
+        chaves = [(plataforma, str(sku), acao, self.hash_dados(dados)) for sku, dados in itens]
+        feito_em = time.time()
+        with self.lock:
+            self.conexao.executemany(
+                "INSERT OR REPLACE INTO operacoes (plataforma, sku, acao, hash_dados, feito_em) VALUES (?, ?, ?, ?, ?)",
+                [(*chave, feito_em) for chave in chaves])
+            self.conexao.commit()
+            self.feitas.update(chaves)
+
+    def fechar(self):
+        """Fecha a conexão com o banco do histórico."""
+        with self.lock:
+            self.conexao.close()
@@ -1,35 +1,58 @@
 # Importações
+import sys
+from typing import Callable
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
+from . import sessoes
+from .esperas import EsperaAdaptativa
+from . import dom
+from . import navegadores
+from . import desempenho
+
+# Elemento que só aparece com o usuário logado
+LOGIN_SUCESSO = (By.CLASS_NAME, "PlataformaSeller-MuiShellProfile-userInfo")
+# Botão de ações do produto encontrado e aviso da busca sem resultados, dentro da lista de produtos
+# VERIFIQUE O AVISO ANTES DE UTILIZA-LO
+PRODUTO_ENCONTRADO = (By.CLASS_NAME, 'icon--mode-actions')
+BUSCA_VAZIA = (By.XPATH, '//*[contains(@class, "MaasProduct")]//*[self::p or self::span or self::h6]'
+                         '[contains(text(), "Nenhum produto") or contains(text(), "Nenhum resultado")]')
 
 # Função de login manual
-def login_mag(driver: webdriver.Chrome, login_url='https://seller.magalu.com/dashboard'):
+def login_mag(driver: webdriver.Chrome, login_url='https://seller.magalu.com/dashboard', confirmar: Callable = input, sessao: bool = True):
     """Função de login manual no Magalu, devido à verificação em duas etapas.
 
+    Antes de pedir o login, tenta restaurar a sessão salva da última execução.
     Acessa a página de login e aguarda que o usuário finalize o processo manualmente. 
     Verifica se o login foi concluído com sucesso, baseado em elementos da página.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium.
         login_url (str, optional): URL de acesso à página de login. Defaults to https://seller.magalu.com/dashboard.
+        confirmar (Callable, optional): Função que aguarda o usuário finalizar o login. Defaults to input.
+        sessao (bool, optional): Restaura e salva a sessão (cookies) entre as execuções. Defaults to True.
     """
+    if sessao and sessoes.restaurar_sessao(driver, 'magalu', login_url, LOGIN_SUCESSO):
+        return
+
     driver.get(login_url)
     print("Aguardando você fazer o login...")
 
     while True:
-        input("Pressione ENTER assim que finalizar: ")
+        confirmar("Pressione ENTER assim que finalizar: ")
         try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "PlataformaSeller-MuiShellProfile-userInfo"))
+            EsperaAdaptativa(driver, 10, 'magalu').until(
+                EC.presence_of_element_located(LOGIN_SUCESSO)
             )
             print("Login detectado com sucesso!")
             break
         except TimeoutException:
             print("Login ainda não detectado. Tente novamente.")
 
+    if sessao:
+        sessoes.salvar_cookies(driver, 'magalu')
+
 
 # Buscar produto - MAGALU
 def pesquisar_produto_mag(driver: webdriver.Chrome, valor: str, tipo='SKU'):
@@ -43,7 +66,7 @@ def pesquisar_produto_mag(driver: webdriver.Chrome, valor: str, tipo='SKU'):
         valor (str): Valor a ser pesquisado (SKU ou Título)
         tipo (str, optional): Tipo da pesquisa aceita pela plataforma do Magalu. Defaults to 'SKU'.
     """
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'magalu')
     busca = wait.until(EC.visibility_of_element_located(
         (By.CSS_SELECTOR, '.MaasProduct-MuiOutlinedInput-input.MaasProduct-MuiInputBase-input')))
     busca.click()
@@ -53,33 +76,32 @@ def pesquisar_produto_mag(driver: webdriver.Chrome, valor: str, tipo='SKU'):
     wait.until(EC.element_to_be_clickable((By.XPATH, tipo_button_xpath))).click()
 
     busca.send_keys(valor)
+    # A lista atual (ou o aviso da busca anterior) é marcada para não ser lida como o novo resultado
+    dom.aguardar_resultado(driver, PRODUTO_ENCONTRADO, BUSCA_VAZIA, 2, 'magalu')
+    dom.marcar_antigos(driver, PRODUTO_ENCONTRADO, BUSCA_VAZIA)
     wait.until(EC.element_to_be_clickable(
         (By.CSS_SELECTOR, '.MaasProduct-MuiButtonBase-root.MaasProduct-MuiButton-root.MaasProduct-MuiButton-contained.MaasProduct-MuiButton-root.MaasProduct-MuiButton-contained.MaasProduct-MuiButton-containedPrimary.MaasProduct-MuiButton-containedSizeLarge.MaasProduct-MuiButton-sizeLarge.MaasProduct-MuiButton-disableElevation.MaasProduct-MuiButton-fullWidth')
         )).click()
 
 
 # Verifica se o produto foi encontrado
-def verificar_produto_mg(driver: webdriver.Chrome, sku: str) -> bool:
-    """Verifica se o produto, após a busca (`pesquisar_produto_mag()`), foi encontrado ou não. 
+def verificar_produto_mg(driver: webdriver.Chrome, sku: str) -> str:
+    """Verifica se o produto, após a busca (`pesquisar_produto_mag()`), foi encontrado ou não.
+    Retorna assim que o botão de ações do produto ou o aviso de nenhum resultado aparece.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium.
         sku (str): SKU do produto
 
     Returns:
-        bool: `True` se o produto foi encontrado e `False` caso contrário.
+        str: `dom.ENCONTRADO`, `dom.NAO_ENCONTRADO` ou `dom.DESCONHECIDO` quando a busca não respondeu no tempo.
     """
-    try:
-        # Procurando o elemento mais ações
-        WebDriverWait(driver, 5).until(EC.visibility_of_element_located(
-        (By.CLASS_NAME, 'icon--mode-actions')))
-    except TimeoutException:
-        print(f'Não foi possível encontrar o produto com o SKU: {sku} - MAGALU')
-        encontrado = False
-    else:
-        encontrado = True
+    # Procurando o elemento mais ações
+    resultado = dom.aguardar_resultado(driver, PRODUTO_ENCONTRADO, BUSCA_VAZIA, 5, 'magalu')
+    if resultado != dom.ENCONTRADO:
+        print(f'Não foi possível encontrar o produto com o SKU: {sku} - MAGALU ({resultado})')
 
-    return encontrado
+    return resultado
 
 
 # Função Auxiliar
@@ -95,12 +117,12 @@ def inativar_produto_mag(driver: webdriver.Chrome, encontrado: bool, sku: str, t
         sku (str): SKU do produto.
         titulo (str): Titulo do produto.
     """
-    wait = WebDriverWait(driver, 2)
+    wait = EsperaAdaptativa(driver, 2, 'magalu')
     if encontrado:
         try:
-            # Clicando em mais ações
+            # Clicando em mais ações do produto encontrado pela busca (ignora os da lista anterior)
             wait.until(EC.element_to_be_clickable(
-                (By.CLASS_NAME, 'icon--mode-actions'))).click()
+                (By.CSS_SELECTOR, f'.icon--mode-actions:not([{dom.ATRIBUTO_ANTIGO}])'))).click()
             # Clicando em inativar produto
             wait.until(EC.element_to_be_clickable(
                 (By.XPATH, '//li[@role="menuitem" and .//p[contains(text(), "Inativar")]]'))).click()
@@ -113,7 +135,7 @@ def inativar_produto_mag(driver: webdriver.Chrome, encontrado: bool, sku: str, t
 
 
 # Função excluir kits - Magalu
-def excluir_produto_mag(driver: webdriver.Chrome, sku: str, titulo: str):
+def excluir_produto_mag(driver: webdriver.Chrome, sku: str, titulo: str) -> str:
     """Exclui o produto/anúncio especificado no Magalu, através de seu SKU e/ou Titulo.
 
     Temos a opção titulo como alternativa ao SKU devido a dificuldade de pesquisa no Magalu,
@@ -123,11 +145,14 @@ def excluir_produto_mag(driver: webdriver.Chrome, sku: str, titulo: str):
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium.
         sku (str): SKU do produto que será excluido.
         titulo (str): Titulo do produto, para caso a pesquisa do SKU dê erro.
+
+    Returns:
+        str: Resultado da última pesquisa (`dom.ENCONTRADO`, `dom.NAO_ENCONTRADO` ou `dom.DESCONHECIDO`).
     """
-    wait = WebDriverWait(driver, 2)
+    wait = EsperaAdaptativa(driver, 2, 'magalu')
     # Caso apareça uma tela de notificação
     try:
-        WebDriverWait(driver, 2).until(EC.element_to_be_clickable(
+        EsperaAdaptativa(driver, 2, 'magalu').until(EC.element_to_be_clickable(
             (By.XPATH, '/html/body/div[3]/div[3]/div/div/div/div[3]/button'))).click()
     except TimeoutException:
         print('')
@@ -142,23 +167,23 @@ def excluir_produto_mag(driver: webdriver.Chrome, sku: str, titulo: str):
     # Tentando encontrar pelo SKU
     pesquisar_produto_mag(driver, sku, tipo='SKU')
     # Verificando se o produto foi encontrado
-    encontrado = verificar_produto_mg(driver, sku)
+    resultado = verificar_produto_mg(driver, sku)
     # Inativando o produto
-    inativar_produto_mag(driver, encontrado, sku, titulo)
+    inativar_produto_mag(driver, resultado == dom.ENCONTRADO, sku, titulo)
 
     # Resetando a pesquisa
     wait.until(EC.element_to_be_clickable(
         (By.XPATH, '//button[@aria-label="Limpar"]'))).click()
 
-    if not encontrado:
+    if resultado != dom.ENCONTRADO:
         print('PROCURANDO PELO TITULO')
         pesquisar_produto_mag(driver, titulo, tipo='Título')
 
         # Verificando se o produto foi encontrado
-        encontrado = verificar_produto_mg(driver, sku)
+        resultado = verificar_produto_mg(driver, sku)
 
         # Inativando o produto
-        inativar_produto_mag(driver, encontrado, sku, titulo)
+        inativar_produto_mag(driver, resultado == dom.ENCONTRADO, sku, titulo)
 
     try:
         # Resetando a pesquisa
@@ -166,3 +191,10 @@ def excluir_produto_mag(driver: webdriver.Chrome, sku: str, titulo: str):
             (By.XPATH, '//button[@aria-label="Limpar"]'))).click()
     except Exception:
         print('')
+
+    return resultado
+
+
+# Tempo de cada função pública gravado em tempos.jsonl (relatório: python relatorio_desempenho.py)
+navegadores.liberar_etapas(sys.modules[__name__], 'magalu')  # Etapas em ETAPAS_SEM_BLOQUEIO
+desempenho.instrumentar_modulo(sys.modules[__name__], 'magalu')
@@ -0,0 +1,190 @@
+# Importações
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from .tiny_api import LimitadorRequisicoes, STATUS_TEMPORARIOS, espera_servidor
+
+# API do Seller Magalu - VERIFIQUE OS ENDPOINTS ANTES DE UTILIZA-LOS
+URL_API = 'https://api.magalu.com/'
+ENDPOINT_SKUS = 'seller/v1/portfolios/skus'
+ENDPOINT_STATUS_SKUS = 'seller/v1/portfolios/skus/status'
+NAO_ENCONTRADO = 'NÃO ENCONTRADO'
+
+
+# Cliente da API do Magalu
+class MagaluAPI:
+    """Alternativa ao navegador para inativar produtos no Magalu pela API do Seller.
+
+    Consulta o portfólio do vendedor uma única vez (todas as páginas) para saber quais SKUs existem
+    e inativa os SKUs em lotes, com várias requisições em paralelo dentro do limite da API.
+
+    Args:
+        token (str): Access token da API do Magalu.
+        url_api (str, optional): URL base da API, altere para testar com um servidor local. Defaults to URL_API.
+        requisicoes_por_minuto (int, optional): Limite de requisições por minuto. Defaults to 300.
+        workers (int, optional): Quantidade de requisições simultâneas. Defaults to 4.
+        tamanho_lote (int, optional): Quantidade de SKUs inativados em cada requisição. Defaults to 50.
+        tamanho_pagina (int, optional): Quantidade de SKUs por página do portfólio. Defaults to 100.
+        timeout (float, optional): Tempo máximo de cada requisição em segundos. Defaults to 30.
+        tentativas (int, optional): Novas tentativas para erros temporários. Defaults to 5.
+        espera_tentativa (float, optional): Espera, em segundos, antes da primeira nova tentativa,
+        dobrando a cada tentativa. Defaults to 1.
+    """
+    def __init__(self,
+                 token: str,
+                 url_api: str = URL_API,
+                 requisicoes_por_minuto: int = 300,
+                 workers: int = 4,
+                 tamanho_lote: int = 50,
+                 tamanho_pagina: int = 100,
+                 timeout: float = 30,
+                 tentativas: int = 5,
+                 espera_tentativa: float = 1):
+        self.url_api = url_api.rstrip('/') + '/'
+        self.workers = workers
+        self.tamanho_lote = tamanho_lote
+        self.tamanho_pagina = tamanho_pagina
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera_tentativa = espera_tentativa
+        self.limitador = LimitadorRequisicoes(requisicoes_por_minuto)
+
+        # Sessão com conexões reaproveitadas. As novas tentativas ficam em `requisitar()`, passando pelo
+        # limitador, e não no urllib3, que repetiria as requisições sem respeitar o limite da API
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {token}'
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def requisitar(self, metodo: str, caminho: str, params: dict | None = None, dados=None):
+        """Faz uma requisição para a API e retorna o JSON da resposta. Repete a requisição, sempre pelo
+        limitador, quando a API não a processou (`STATUS_TEMPORARIOS`) ou a conexão falhou. As consultas (GET)
+        também são repetidas após erro 500 ou timeout de leitura, as alterações não.
+
+        Args:
+            metodo (str): Método HTTP (GET, PATCH...).
+            caminho (str): Caminho do recurso.
+            params (dict | None, optional): Parâmetros da URL. Defaults to None.
+            dados (optional): Corpo JSON da requisição. Defaults to None.
+
+        Raises:
+            RuntimeError: Erro de conexão ou a API retornou um erro.
+
+        Returns:
+            dict | list: JSON da resposta.
+        """
+        consulta = metodo.upper() == 'GET'
+        temporarios = (*STATUS_TEMPORARIOS, 500) if consulta else STATUS_TEMPORARIOS
+        erros_conexao = (requests.ConnectionError, requests.Timeout) if consulta else requests.ConnectionError
+        for tentativa in range(self.tentativas + 1):
+            self.limitador.aguardar()
+            espera = self.espera_tentativa * 2 ** tentativa
+            try:
+                resposta = self.session.request(metodo, self.url_api + caminho, params=params, json=dados,
+                                                timeout=self.timeout)
+            except erros_conexao as e:
+                if tentativa < self.tentativas:
+                    time.sleep(espera)
+                    continue
+                raise RuntimeError(f"Erro na requisição {caminho} - {str(e)}") from e
+            except requests.RequestException as e:
+                raise RuntimeError(f"Erro na requisição {caminho} - {str(e)}") from e
+            if resposta.status_code not in temporarios or tentativa == self.tentativas:
+                break
+            time.sleep(espera_servidor(resposta, espera))
+
+        if not resposta.ok:
+            try:
+                mensagem = resposta.json().get('message', resposta.text)
+            except ValueError:
+                mensagem = resposta.text
+            raise RuntimeError(f"Erro na API do Magalu {caminho} - {resposta.status_code} {mensagem}")
+        return resposta.json() if resposta.content else {}
+
+    def listar_skus(self) -> dict[str, dict]:
+        """Retorna todos os SKUs do portfólio do vendedor, percorrendo as páginas.
+
+        Returns:
+            dict[str, dict]: Dados de cada SKU pelo código do SKU.
+        """
+        skus, offset = {}, 0
+        while True:
+            pagina = self.requisitar('GET', ENDPOINT_SKUS, params={'_offset': offset, '_limit': self.tamanho_pagina})
+            resultados = pagina.get('results', [])
+            for item in resultados:
+                skus[str(item['sku'])] = item
+            offset += self.tamanho_pagina
+            if len(resultados) < self.tamanho_pagina:
+                return skus
+
+    def inativar_lote(self, skus: list[str]) -> dict[str, str | None]:
+        """Inativa vários SKUs em uma única requisição.
+
+        Args:
+            skus (list[str]): SKUs que serão inativados.
+
+        Returns:
+            dict[str, str | None]: Erro de cada SKU, `None` quando inativado.
+        """
+        try:
+            resposta = self.requisitar('PATCH', ENDPOINT_STATUS_SKUS,
+                                       dados=[{'sku': sku, 'status': 'inactive'} for sku in skus])
+        except RuntimeError as e:
+            return {sku: str(e) for sku in skus}
+
+        # Resultado de cada SKU quando a API o retorna, se não, o lote todo foi aceito
+        resultados = {sku: None for sku in skus}
+        for item in resposta.get('results', []) if isinstance(resposta, dict) else resposta:
+            sku = str(item.get('sku'))
+            if sku in resultados and item.get('error'):
+                resultados[sku] = f"Erro ao inativar o produto {sku} - MAGALU - {item['error']}"
+        return resultados
+
+    def inativar_skus(self, skus: list[str]) -> dict[str, str | None]:
+        """Inativa vários SKUs, em lotes e em paralelo. Os SKUs que não estão no portfólio não são enviados.
+
+        Args:
+            skus (list[str]): SKUs que serão inativados.
+
+        Returns:
+            dict[str, str | None]: Resultado de cada SKU: `None` se inativado, `NAO_ENCONTRADO` se não
+            está no portfólio ou a mensagem de erro.
+        """
+        skus = [str(sku) for sku in skus]
+        if not skus:
+            return {}
+        portfolio = self.listar_skus()
+
+        resultados: dict[str, str | None] = {}
+        pendentes = []
+        for sku in skus:
+            if sku not in portfolio:
+                resultados[sku] = NAO_ENCONTRADO
+            elif portfolio[sku].get('status') == 'inactive':
+                resultados[sku] = None  # Já está inativo
+            else:
+                pendentes.append(sku)
+
+        lotes = [pendentes[i:i + self.tamanho_lote] for i in range(0, len(pendentes), self.tamanho_lote)]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for resultado in executor.map(self.inativar_lote, lotes):
+                resultados.update(resultado)
+
+        return resultados
+
+
+# Função excluir produtos - Magalu
+def excluir_produtos_mag(api: MagaluAPI, skus: list[str]) -> dict[str, str | None]:
+    """Inativa os produtos de vários SKUs no Magalu pela API, equivalente a `magalu.excluir_produto_mag()`.
+
+    Args:
+        api (MagaluAPI): Cliente da API do Magalu
+        skus (list[str]): SKUs dos produtos
+
+    Returns:
+        dict[str, str | None]: Resultado de cada SKU: `None` se inativado, `NAO_ENCONTRADO` se não
+        está no portfólio ou a mensagem de erro
+    """
+    return api.inativar_skus(skus)
@@ -1,66 +1,139 @@
 # Importações
+import sys
+from typing import Callable, Iterator
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
+from . import sessoes
+from .esperas import EsperaAdaptativa
+from . import dom
+from . import navegadores
+from . import desempenho
+
+# Elemento que só aparece com o usuário logado
+LOGIN_SUCESSO = (By.CLASS_NAME, "nav-header-user")
+# Página usada para verificar a sessão restaurada, o login termina no domínio .com.br
+URL_SESSAO = 'https://www.mercadolivre.com.br/'
+# Checkbox "selecionar tudo" da lista de anúncios e aviso da busca sem resultados - VERIFIQUE O AVISO ANTES DE UTILIZA-LO
+SELECIONAR_TUDO = (By.CLASS_NAME, 'andes-checkbox__input')
+LISTA_VAZIA = (By.XPATH, '//*[contains(text(), "Não encontramos") or contains(text(), "Nenhum anúncio")]')
+
+# Linhas da lista de anúncios, para o catálogo local - VERIFIQUE O LOCALIZADOR ANTES DE UTILIZA-LO
+LINHA_ANUNCIO = (By.CSS_SELECTOR, '[class*="sc-list-item-row"]')
+_JS_LISTAR_ANUNCIOS = """
+return Array.from(document.querySelectorAll(arguments[0]), linha => {
+    const sku = /SKU:?\\s*(\\S+)/i.exec(linha.innerText);
+    return sku ? sku[1] : null;
+});
+"""
+
 
 # Função de login manual
-def login_ml(driver: webdriver.Chrome, login_url='https://www.mercadolivre.com/jms/mlb/lgz/msl/login'):
+def login_ml(driver: webdriver.Chrome, login_url='https://www.mercadolivre.com/jms/mlb/lgz/msl/login', confirmar: Callable = input, sessao: bool = True):
     """Função de login manual no Mercado Livre, devido à verificação em duas etapas.
 
+    Antes de pedir o login, tenta restaurar a sessão salva da última execução.
     Acessa a página de login e aguarda que o usuário finalize o processo manualmente. 
     Verifica se o login foi concluído com sucesso, baseado em elementos da página.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium.
         login_url (str, optional): URL de acesso à página de login. Defaults to'https://www.mercadolivre.com/jms/mlb/lgz/msl/login'.
+        confirmar (Callable, optional): Função que aguarda o usuário finalizar o login. Defaults to input.
+        sessao (bool, optional): Restaura e salva a sessão (cookies) entre as execuções. Defaults to True.
     """
+    if sessao and sessoes.restaurar_sessao(driver, 'mercado_livre', login_url, LOGIN_SUCESSO,
+                                           url_verificacao=URL_SESSAO):
+        return
+
     driver.get(login_url)
     print("Aguardando você fazer o login...")
 
     while True:
-        input("Pressione ENTER assim que finalizar: ")
+        confirmar("Pressione ENTER assim que finalizar: ")
         try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "nav-header-user"))
+            EsperaAdaptativa(driver, 10, 'mercado_livre').until(
+                EC.presence_of_element_located(LOGIN_SUCESSO)
             )
             print("Login detectado com sucesso!")
             break
         except TimeoutException:
             print("Login ainda não detectado. Tente novamente.")
 
+    if sessao:
+        sessoes.salvar_cookies(driver, 'mercado_livre')
 
-# Função excluir anúncios - Mercado livre
-def excluir_produto_ml(driver: webdriver.Chrome, sku: str|int):
-    """Exclui o produto/anúncio especificado no mercado livre, através do seu SKU.
+
+# Função selecionar anúncios
+def selecionar_anuncios_ml(driver: webdriver.Chrome, sku: str | int):
+    """Pesquisa os anúncios do SKU e clica em selecionar tudo. Retorna assim que a lista mostra
+    os anúncios ou o aviso de nenhum resultado, sem esperar o timeout quando o SKU não existe.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
-        sku (str | int): SKU do produto/anúncio que será excluido
-    """
-    wait = WebDriverWait(driver, 5)
+        sku (str | int): SKU do produto/anúncio
 
-    # Link do produto para excluir
-    url_product = f'https://www.mercadolivre.com.br/anuncios/lista?page=1&search={sku}'
-    # Acessando o produto
-    driver.get(url_product)
+    Raises:
+        RuntimeError: O SKU não tem anúncios ou a lista não respondeu no tempo
+    """
+    # Acessando a lista de anúncios filtrada pelo SKU
+    driver.get(f'https://www.mercadolivre.com.br/anuncios/lista?page=1&search={sku}')
 
     # Obtém a altura total da página
     total_height = driver.execute_script("return document.body.scrollHeight")
-    # Calcula 50% da altura total
-    half_height = total_height / 2
     # Faz o scroll até 50% da página
-    driver.execute_script(f"window.scrollTo(0, {half_height});")
+    driver.execute_script(f"window.scrollTo(0, {total_height / 2});")
 
-    # Clicando na opção selecionar tudo
-    try:
-        wait.until(EC.element_to_be_clickable(
-            (By.CLASS_NAME, 'andes-checkbox__input'))).click()
-    except TimeoutException as e:
+    resultado = dom.aguardar_resultado(driver, SELECIONAR_TUDO, LISTA_VAZIA, 5, 'mercado_livre')
+    if resultado != dom.ENCONTRADO:
         error_msg = f'Não foi possivel encontrar o produto de SKU: {sku} - MERCADO LIVRE'
         print(error_msg)
-        raise RuntimeError(f"{error_msg} - {e}") from e
+        raise RuntimeError(f"{error_msg} - {resultado}")
+
+    # Clicando na opção selecionar tudo
+    EsperaAdaptativa(driver, 5, 'mercado_livre').until(EC.element_to_be_clickable(SELECIONAR_TUDO)).click()
+
+
+# Função listar anúncios - Mercado livre
+def listar_anuncios_ml(driver: webdriver.Chrome, max_paginas: int = 1000) -> Iterator[list[str | None]]:
+    """Percorre todas as páginas da lista de anúncios, lendo cada página com uma única chamada ao navegador.
+    Usada para montar o catálogo local (`catalogo.obter_catalogo()`).
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        max_paginas (int, optional): Quantidade máxima de páginas percorridas. Defaults to 1000.
+
+    Raises:
+        RuntimeError: A lista não carregou ou tem mais páginas que `max_paginas` (catálogo incompleto)
+
+    Yields:
+        Iterator[list[str | None]]: SKU de cada anúncio da página (`None` nos anúncios sem SKU)
+    """
+    print('LISTANDO OS ANÚNCIOS - MERCADO LIVRE')
+    for pagina in range(1, max_paginas + 1):
+        driver.get(f'https://www.mercadolivre.com.br/anuncios/lista?page={pagina}')
+        resultado = dom.aguardar_resultado(driver, LINHA_ANUNCIO, LISTA_VAZIA, 10, 'mercado_livre')
+        if resultado == dom.DESCONHECIDO:
+            raise RuntimeError(f'A página {pagina} da lista de anúncios não carregou')
+        if resultado == dom.NAO_ENCONTRADO:
+            return
+        yield driver.execute_script(_JS_LISTAR_ANUNCIOS, LINHA_ANUNCIO[1])
+    raise RuntimeError(f'A lista de anúncios tem mais de {max_paginas} páginas')
+
+
+# Função excluir anúncios - Mercado livre
+def excluir_produto_ml(driver: webdriver.Chrome, sku: str|int):
+    """Exclui o produto/anúncio especificado no mercado livre, através do seu SKU.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        sku (str | int): SKU do produto/anúncio que será excluido
+    """
+    wait = EsperaAdaptativa(driver, 5, 'mercado_livre')
+
+    # Pesquisando o SKU e clicando na opção selecionar tudo
+    selecionar_anuncios_ml(driver, sku)
 
     # Clicando na opção excluir
     wait.until(EC.element_to_be_clickable(
@@ -78,28 +151,10 @@ def pausar_produto_ml(driver: webdriver.Chrome, sku: str|int):
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
         sku (str | int): SKU do produto/anúncio que será excluido
     """
-    wait = WebDriverWait(driver, 5)
-
-    # Link do produto para excluir
-    url_product = f'https://www.mercadolivre.com.br/anuncios/lista?page=1&search={sku}'
-    # Acessando o produto
-    driver.get(url_product)
+    wait = EsperaAdaptativa(driver, 5, 'mercado_livre')
 
-    # Obtém a altura total da página
-    total_height = driver.execute_script("return document.body.scrollHeight")
-    # Calcula 50% da altura total
-    half_height = total_height / 2
-    # Faz o scroll até 50% da página
-    driver.execute_script(f"window.scrollTo(0, {half_height});")
-
-    # Clicando na opção selecionar tudo
-    try:
-        wait.until(EC.element_to_be_clickable(
-            (By.CLASS_NAME, 'andes-checkbox__input'))).click()
-    except TimeoutException as e:
-        error_msg = f'Não foi possivel encontrar o produto de SKU: {sku} - MERCADO LIVRE'
-        print(error_msg)
-        raise RuntimeError(f"{error_msg} - {e}") from e
+    # Pesquisando o SKU e clicando na opção selecionar tudo
+    selecionar_anuncios_ml(driver, sku)
 
     try:
         # Clicando na opção pausar
@@ -113,3 +168,8 @@ def pausar_produto_ml(driver: webdriver.Chrome, sku: str|int):
     # Confirmando o pause do produto
     wait.until(EC.element_to_be_clickable(
         (By.XPATH, '//*[@id=":r14t:"]/span'))).click()
+
+
+# Tempo de cada função pública gravado em tempos.jsonl (relatório: python relatorio_desempenho.py)
+navegadores.liberar_etapas(sys.modules[__name__], 'mercado_livre')  # Etapas em ETAPAS_SEM_BLOQUEIO
+desempenho.instrumentar_modulo(sys.modules[__name__], 'mercado_livre')
@@ -0,0 +1,272 @@
+# Importações
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from .tiny_api import LimitadorRequisicoes, STATUS_TEMPORARIOS, espera_servidor
+
+# API do Mercado Livre - VERIFIQUE OS ENDPOINTS ANTES DE UTILIZA-LOS
+URL_API = 'https://api.mercadolibre.com/'
+TAMANHO_MULTIGET = 20  # Máximo de itens por consulta em /items?ids=
+
+
+# Cliente da API do Mercado Livre
+class MercadoLivreAPI:
+    """Alternativa ao navegador para pausar e excluir anúncios no Mercado Livre pela API.
+
+    Localiza os anúncios pelo SKU do vendedor (`seller_sku`), consulta os itens em lotes de 20
+    e altera o status de vários anúncios em paralelo, respeitando o limite de requisições.
+
+    Args:
+        token (str): Access token da aplicação do Mercado Livre.
+        seller_id (str | None, optional): ID do vendedor, se não informado é consultado em `/users/me`. Defaults to None.
+        url_api (str, optional): URL base da API, altere para testar com um servidor local. Defaults to URL_API.
+        requisicoes_por_minuto (int, optional): Limite de requisições por minuto. Defaults to 600.
+        workers (int, optional): Quantidade de requisições simultâneas. Defaults to 8.
+        timeout (float, optional): Tempo máximo de cada requisição em segundos. Defaults to 30.
+        tentativas (int, optional): Novas tentativas para erros temporários. Defaults to 3.
+        espera_tentativa (float, optional): Espera, em segundos, antes da primeira nova tentativa,
+        dobrando a cada tentativa. Defaults to 1.
+    """
+    def __init__(self,
+                 token: str,
+                 seller_id: str | None = None,
+                 url_api: str = URL_API,
+                 requisicoes_por_minuto: int = 600,
+                 workers: int = 8,
+                 timeout: float = 30,
+                 tentativas: int = 3,
+                 espera_tentativa: float = 1):
+        self.url_api = url_api.rstrip('/') + '/'
+        self.workers = workers
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera_tentativa = espera_tentativa
+        self.limitador = LimitadorRequisicoes(requisicoes_por_minuto)
+
+        # Sessão com conexões reaproveitadas. As novas tentativas ficam em `requisitar()`, passando pelo
+        # limitador, e não no urllib3, que repetiria as requisições sem respeitar o limite da API
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {token}'
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.seller_id = seller_id or str(self.requisitar('GET', 'users/me')['id'])
+
+    def requisitar(self, metodo: str, caminho: str, params: dict | None = None, dados: dict | None = None):
+        """Faz uma requisição para a API e retorna o JSON da resposta. Repete a requisição, sempre pelo
+        limitador, quando a API não a processou (`STATUS_TEMPORARIOS`) ou a conexão falhou. As consultas (GET)
+        também são repetidas após erro 500 ou timeout de leitura, as alterações não.
+
+        Args:
+            metodo (str): Método HTTP (GET, PUT...).
+            caminho (str): Caminho do recurso, por exemplo `items/MLB123`.
+            params (dict | None, optional): Parâmetros da URL. Defaults to None.
+            dados (dict | None, optional): Corpo JSON da requisição. Defaults to None.
+
+        Raises:
+            RuntimeError: Erro de conexão ou a API retornou um erro.
+
+        Returns:
+            dict | list: JSON da resposta.
+        """
+        consulta = metodo.upper() == 'GET'
+        temporarios = (*STATUS_TEMPORARIOS, 500) if consulta else STATUS_TEMPORARIOS
+        erros_conexao = (requests.ConnectionError, requests.Timeout) if consulta else requests.ConnectionError
+        for tentativa in range(self.tentativas + 1):
+            self.limitador.aguardar()
+            espera = self.espera_tentativa * 2 ** tentativa
+            try:
+                resposta = self.session.request(metodo, self.url_api + caminho, params=params, json=dados,
+                                                timeout=self.timeout)
+            except erros_conexao as e:
+                if tentativa < self.tentativas:
+                    time.sleep(espera)
+                    continue
+                raise RuntimeError(f"Erro na requisição {caminho} - {str(e)}") from e
+            except requests.RequestException as e:
+                raise RuntimeError(f"Erro na requisição {caminho} - {str(e)}") from e
+            if resposta.status_code not in temporarios or tentativa == self.tentativas:
+                break
+            time.sleep(espera_servidor(resposta, espera))
+
+        if not resposta.ok:
+            try:
+                mensagem = resposta.json().get('message', resposta.text)
+            except ValueError:
+                mensagem = resposta.text
+            raise RuntimeError(f"Erro na API do Mercado Livre {caminho} - {resposta.status_code} {mensagem}")
+        return resposta.json() if resposta.content else {}
+
+    def buscar_itens(self, sku: str) -> list[str]:
+        """Retorna os IDs de todos os anúncios do vendedor com o SKU informado, percorrendo as páginas.
+
+        Args:
+            sku (str): SKU do produto (`seller_sku`).
+
+        Returns:
+            list[str]: IDs dos anúncios encontrados.
+        """
+        itens, offset = [], 0
+        while True:
+            pagina = self.requisitar('GET', f'users/{self.seller_id}/items/search',
+                                     params={'seller_sku': sku, 'offset': offset, 'limit': 50})
+            itens.extend(pagina.get('results', []))
+            offset += 50
+            if offset >= pagina.get('paging', {}).get('total', 0):
+                return itens
+
+    def obter_itens(self, item_ids: list[str]) -> dict[str, dict]:
+        """Consulta vários anúncios de uma vez (lotes de 20 por requisição).
+
+        Args:
+            item_ids (list[str]): IDs dos anúncios.
+
+        Returns:
+            dict[str, dict]: Dados de cada anúncio encontrado pelo ID.
+        """
+        lotes = [item_ids[i:i + TAMANHO_MULTIGET] for i in range(0, len(item_ids), TAMANHO_MULTIGET)]
+
+        def consultar(lote):
+            return self.requisitar('GET', 'items', params={'ids': ','.join(lote), 'attributes': 'id,status,sub_status'})
+
+        itens = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for resposta in executor.map(consultar, lotes):
+                for item in resposta:
+                    if item.get('code') == 200:
+                        itens[item['body']['id']] = item['body']
+        return itens
+
+    def alterar_status(self, item_id: str, status: str):
+        """Altera o status do anúncio (`paused`, `active` ou `closed`).
+
+        Args:
+            item_id (str): ID do anúncio.
+            status (str): Novo status.
+        """
+        self.requisitar('PUT', f'items/{item_id}', dados={'status': status})
+
+    def excluir_item(self, item_id: str, status_atual: str | None = None):
+        """Exclui o anúncio. O Mercado Livre só exclui anúncios finalizados, então o anúncio é finalizado antes.
+
+        Args:
+            item_id (str): ID do anúncio.
+            status_atual (str | None, optional): Status atual, evita finalizar um anúncio já finalizado. Defaults to None.
+        """
+        if status_atual != 'closed':
+            self.alterar_status(item_id, 'closed')
+        self.requisitar('PUT', f'items/{item_id}', dados={'deleted': 'true'})
+
+    def executar_skus(self, skus: list[str], acao: str) -> dict[str, str | None]:
+        """Pausa ou exclui todos os anúncios de vários SKUs, em paralelo.
+
+        Args:
+            skus (list[str]): SKUs dos produtos.
+            acao (str): `pausar` ou `excluir`.
+
+        Returns:
+            dict[str, str | None]: Erro de cada SKU, `None` quando todos os anúncios do SKU foram alterados.
+        """
+        resultados: dict[str, str | None] = {}
+
+        # Localizando os anúncios de cada SKU
+        def buscar(sku):
+            try:
+                return sku, self.buscar_itens(sku), None
+            except RuntimeError as e:
+                return sku, [], str(e)
+
+        itens_por_sku = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for sku, itens, erro in executor.map(buscar, [str(sku) for sku in skus]):
+                if erro:
+                    resultados[sku] = erro
+                elif not itens:
+                    resultados[sku] = f'Não foi possivel encontrar o produto de SKU: {sku} - MERCADO LIVRE'
+                else:
+                    itens_por_sku[sku] = itens
+
+        # Consultando o status atual de todos os anúncios em lotes
+        tarefas = [(sku, item_id) for sku, itens in itens_por_sku.items() for item_id in itens]
+        status = self.obter_itens([item_id for _, item_id in tarefas]) if tarefas else {}
+
+        def alterar(tarefa):
+            sku, item_id = tarefa
+            atual = status.get(item_id, {}).get('status')
+            try:
+                if acao == 'excluir':
+                    self.excluir_item(item_id, atual)
+                elif atual != 'paused':
+                    self.alterar_status(item_id, 'paused')
+            except RuntimeError as e:
+                return sku, str(e)
+            return sku, None
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for sku, erro in executor.map(alterar, tarefas):
+                if erro:
+                    anterior = resultados.get(sku)
+                    resultados[sku] = f"{anterior}; {erro}" if anterior else erro
+                else:
+                    resultados.setdefault(sku, None)
+
+        return resultados
+
+
+# Funções com os mesmos nomes de `mercado_livre`, recebendo o cliente da API no lugar do driver
+def excluir_produto_ml(api: MercadoLivreAPI, sku: str | int):
+    """Exclui todos os anúncios do SKU no Mercado Livre pela API.
+
+    Args:
+        api (MercadoLivreAPI): Cliente da API do Mercado Livre
+        sku (str | int): SKU do produto/anúncio que será excluido
+
+    Raises:
+        RuntimeError: Anúncio não encontrado ou erro ao excluir
+    """
+    erro = api.executar_skus([str(sku)], 'excluir')[str(sku)]
+    if erro:
+        raise RuntimeError(erro)
+
+
+def pausar_produto_ml(api: MercadoLivreAPI, sku: str | int):
+    """Pausa todos os anúncios do SKU no Mercado Livre pela API.
+
+    Args:
+        api (MercadoLivreAPI): Cliente da API do Mercado Livre
+        sku (str | int): SKU do produto/anúncio que será pausado
+
+    Raises:
+        RuntimeError: Anúncio não encontrado ou erro ao pausar
+    """
+    erro = api.executar_skus([str(sku)], 'pausar')[str(sku)]
+    if erro:
+        raise RuntimeError(erro)
+
+
+def excluir_produtos_ml(api: MercadoLivreAPI, skus: list[str]) -> dict[str, str | None]:
+    """Exclui os anúncios de vários SKUs de uma vez.
+
+    Args:
+        api (MercadoLivreAPI): Cliente da API do Mercado Livre
+        skus (list[str]): SKUs dos produtos
+
+    Returns:
+        dict[str, str | None]: Erro de cada SKU, `None` quando excluído
+    """
+    return api.executar_skus(skus, 'excluir')
+
+
+def pausar_produtos_ml(api: MercadoLivreAPI, skus: list[str]) -> dict[str, str | None]:
+    """Pausa os anúncios de vários SKUs de uma vez.
+
+    Args:
+        api (MercadoLivreAPI): Cliente da API do Mercado Livre
+        skus (list[str]): SKUs dos produtos
+
+    Returns:
+        dict[str, str | None]: Erro de cada SKU, `None` quando pausado
+    """
+    return api.executar_skus(skus, 'pausar')
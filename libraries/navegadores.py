@@ -0,0 +1,268 @@
+# Importações
+import os
+import json
+import atexit
+import weakref
+import functools
+import threading
+from contextlib import contextmanager
+from types import ModuleType
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+PASTA_CACHE = 'cache_navegador'
+# Perfil usado no lugar do informado pelo código, para comparar os perfis (--perfil-navegador)
+VARIAVEL_PERFIL = 'ORION_PERFIL_NAVEGADOR'
+# Desativa o bloqueio de recursos em todas as etapas (ORION_SEM_BLOQUEIO=1)
+VARIAVEL_SEM_BLOQUEIO = 'ORION_SEM_BLOQUEIO'
+_IGNORAR_NA_PILHA = True  # Os envoltórios deste módulo não contam como etapa em `esperas`
+
+# URLs bloqueadas pelo DevTools (Network.setBlockedURLs), `*` aceita qualquer texto
+# VERIFIQUE AS LISTAS ANTES DE UTILIZA-LAS
+_RASTREAMENTO_E_CHAT = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googleadservices.com*',
+    '*connect.facebook.net*', '*hotjar.com*', '*clarity.ms*', '*nr-data.net*', '*js-agent.newrelic.com*',
+    '*zdassets.com*', '*zopim.com*', '*intercom.io*', '*intercomcdn.com*', '*tawk.to*', '*jivosite.com*',
+    '*hs-scripts.com*', '*hs-analytics.net*',
+]
+_FONTES = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*fonts.googleapis.com*', '*fonts.gstatic.com*']
+BLOQUEIOS = {
+    'tiny': _RASTREAMENTO_E_CHAT + _FONTES,
+    'opencart': _RASTREAMENTO_E_CHAT + _FONTES,
+    # Mercado Livre e Magalu dependem da renderização completa, somente rastreamento e chat
+    'mercado_livre': _RASTREAMENTO_E_CHAT,
+    'magalu': _RASTREAMENTO_E_CHAT,
+}
+# Etapas (funções dos módulos das plataformas) que rodam sem bloqueio - ALTERE AQUI SE ALGUM FLUXO QUEBRAR
+ETAPAS_SEM_BLOQUEIO = {
+    'tiny': set(),
+    'opencart': set(),
+    'mercado_livre': set(),
+    'magalu': set(),
+}
+# Tamanho estimado por tipo de recurso, o recurso bloqueado não é baixado e o tamanho real não é conhecido
+TAMANHO_ESTIMADO = {'Script': 30_000, 'Stylesheet': 15_000, 'Font': 40_000, 'Image': 50_000,
+                    'Media': 500_000, 'XHR': 2_000, 'Fetch': 2_000, 'Other': 5_000}
+
+# Perfis do navegador - ALTERE AQUI CONFORME NECESSÁRIO
+# headless: sem janela | estrategia: 'normal' espera a página inteira, 'eager' somente o HTML
+# sem_imagens / sem_fontes / sem_extensoes: não carrega esses recursos
+# renderizadores: limite de processos de renderização | memoria_mb: limite de memória do JavaScript por aba
+# cache: cache HTTP em disco compartilhado entre as execuções (pasta `cache_navegador/<perfil>`)
+# bloqueios: lista de `BLOQUEIOS` aplicada na primeira aba | contar_bloqueios: somente habilita o log de rede
+PERFIS = {
+    # Igual ao webdriver.Chrome() sem opções
+    'completo': {},
+    # Tiny: login manual com a janela aberta, mas as telas de edição não precisam das imagens
+    'tiny': {'estrategia': 'eager', 'sem_imagens': True, 'sem_extensoes': True, 'cache': True, 'bloqueios': 'tiny'},
+    # Opencart: painel administrativo simples, o zoom e a rolagem funcionam sem imagens e fontes
+    'opencart': {'estrategia': 'eager', 'sem_imagens': True, 'sem_fontes': True, 'sem_extensoes': True,
+                 'renderizadores': 2, 'cache': True, 'bloqueios': 'opencart'},
+    # Mercado Livre e Magalu: as telas dependem da renderização completa (imagens e carregamento tardio)
+    'mercado_livre': {'sem_extensoes': True, 'cache': True, 'bloqueios': 'mercado_livre'},
+    'magalu': {'sem_extensoes': True, 'cache': True, 'bloqueios': 'magalu'},
+    # Um navegador com abas de todas as plataformas (excluir_produtos_tiny.py), o bloqueio é aplicado em cada aba
+    'multiplataforma': {'sem_extensoes': True, 'cache': True, 'contar_bloqueios': True},
+    # Sem janela e sem recursos pesados, para fluxos que não precisam de interação manual
+    'rapido': {'headless': True, 'estrategia': 'eager', 'sem_imagens': True, 'sem_fontes': True,
+               'sem_extensoes': True, 'renderizadores': 1, 'memoria_mb': 512, 'cache': True},
+}
+
+
+# Função opções do navegador
+def opcoes_navegador(perfil: str = 'completo',
+                     options: webdriver.ChromeOptions | None = None,
+                     pasta_cache: str = PASTA_CACHE,
+                     **ajustes) -> webdriver.ChromeOptions:
+    """Monta as opções do Chrome conforme o perfil.
+
+    Args:
+        perfil (str, optional): Nome do perfil em `PERFIS`. Defaults to 'completo'.
+        options (webdriver.ChromeOptions | None, optional): Opções já existentes do Chrome. Defaults to None.
+        pasta_cache (str, optional): Pasta do cache HTTP em disco. Defaults to 'cache_navegador'.
+        **ajustes: Substitui configurações do perfil, por exemplo `headless=True`.
+
+    Raises:
+        ValueError: Perfil não existe
+
+    Returns:
+        webdriver.ChromeOptions: Opções do Chrome
+    """
+    if perfil not in PERFIS:
+        raise ValueError(f"Perfil do navegador inválido: {perfil}. Perfis disponíveis: {', '.join(PERFIS)}")
+    config = {**PERFIS[perfil], **ajustes}
+    options = options or webdriver.ChromeOptions()
+
+    if config.get('headless'):
+        options.add_argument('--headless=new')
+        options.add_argument('--window-size=1920,1080')
+    if config.get('estrategia'):
+        options.page_load_strategy = config['estrategia']
+    if config.get('sem_imagens'):
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        prefs = options.experimental_options.get('prefs', {})
+        options.add_experimental_option('prefs', {**prefs, 'profile.managed_default_content_settings.images': 2})
+    if config.get('sem_fontes'):
+        options.add_argument('--disable-remote-fonts')
+    if config.get('sem_extensoes'):
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-component-extensions-with-background-pages')
+    if config.get('renderizadores'):
+        options.add_argument(f"--renderer-process-limit={config['renderizadores']}")
+    if config.get('memoria_mb'):
+        options.add_argument(f"--js-flags=--max-old-space-size={config['memoria_mb']}")
+    if config.get('cache'):
+        # OBS: Navegadores em paralelo com o mesmo perfil dividem a pasta, o Chrome descarta o cache se corromper
+        pasta = os.path.abspath(os.path.join(pasta_cache, perfil))
+        os.makedirs(pasta, exist_ok=True)
+        options.add_argument(f'--disk-cache-dir={pasta}')
+    if config.get('bloqueios') or config.get('contar_bloqueios'):
+        # Log de rede do DevTools, usado para contar as requisições bloqueadas
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+    return options
+
+
+# Função criar navegador
+def criar_navegador(perfil: str = 'completo',
+                    options: webdriver.ChromeOptions | None = None,
+                    **ajustes) -> webdriver.Chrome:
+    """Cria o navegador com as opções do perfil. Os scripts devem criar os navegadores somente por aqui.
+
+    A variável de ambiente `ORION_PERFIL_NAVEGADOR` substitui o perfil informado, o que permite
+    comparar os perfis no relatório de desempenho sem alterar o código.
+
+    Args:
+        perfil (str, optional): Nome do perfil em `PERFIS`. Defaults to 'completo'.
+        options (webdriver.ChromeOptions | None, optional): Opções já existentes do Chrome. Defaults to None.
+        **ajustes: Substitui configurações do perfil, por exemplo `headless=True`.
+
+    Returns:
+        webdriver.Chrome: Objeto de controle do navegador do Selenium
+    """
+    perfil = os.environ.get(VARIAVEL_PERFIL) or perfil
+    print(f"Abrindo o navegador - perfil {perfil}")
+    driver = webdriver.Chrome(options=opcoes_navegador(perfil, options, **ajustes))
+    plataforma = ajustes.get('bloqueios', PERFIS[perfil].get('bloqueios'))
+    if plataforma:
+        bloquear_recursos(driver, plataforma)
+    return driver
+
+
+# Contador de requisições bloqueadas
+class ContadorBloqueios:
+    """Soma as requisições bloqueadas e os bytes economizados (estimados por tipo de recurso) na execução."""
+    def __init__(self):
+        self.plataformas: dict[str, dict[str, int]] = {}
+        self.lock = threading.Lock()
+
+    def registrar(self, plataforma: str, requisicoes: int, bytes_economizados: int):
+        """Soma as requisições bloqueadas da plataforma."""
+        with self.lock:
+            total = self.plataformas.setdefault(plataforma, {'requisicoes': 0, 'bytes': 0})
+            total['requisicoes'] += requisicoes
+            total['bytes'] += bytes_economizados
+
+    def resumo(self):
+        """Mostra o total bloqueado por plataforma."""
+        for plataforma, total in self.plataformas.items():
+            print(f"RECURSOS BLOQUEADOS - {plataforma.upper()}: {total['requisicoes']} requisições, "
+                  f"~{total['bytes'] / 1024 / 1024:.1f} MB economizados (estimado)")
+
+
+CONTADOR = ContadorBloqueios()
+atexit.register(CONTADOR.resumo)
+
+# URLs bloqueadas em cada aba ({aba: urls}) de cada navegador
+_bloqueios_ativos = weakref.WeakKeyDictionary()
+
+
+# Função bloquear recursos
+def bloquear_recursos(driver: webdriver.Chrome, plataforma: str):
+    """Bloqueia na aba atual as URLs de rastreamento, chat e recursos pesados da plataforma (`BLOQUEIOS`).
+    Em navegadores com várias abas, chame em cada aba após trocar para ela.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        plataforma (str): Plataforma da aba (tiny, opencart, mercado_livre, magalu)
+    """
+    if os.environ.get(VARIAVEL_SEM_BLOQUEIO):
+        return
+    urls = BLOQUEIOS[plataforma]
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+    _bloqueios_ativos.setdefault(driver, {})[driver.current_window_handle] = urls
+
+
+# Função sem bloqueio
+@contextmanager
+def sem_bloqueio(driver: webdriver.Chrome):
+    """Desativa o bloqueio de recursos da aba atual dentro do bloco `with` e reativa no final.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+    """
+    aba = driver.current_window_handle
+    urls = _bloqueios_ativos.get(driver, {}).get(aba)
+    if not urls:
+        yield
+        return
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+    try:
+        yield
+    finally:
+        try:
+            atual = driver.current_window_handle
+            driver.switch_to.window(aba)
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+            driver.switch_to.window(atual)
+        except WebDriverException:
+            pass  # Aba ou navegador fechado
+
+
+# Função liberar etapas
+def liberar_etapas(modulo: ModuleType, plataforma: str):
+    """Executa as funções do módulo listadas em `ETAPAS_SEM_BLOQUEIO` sem o bloqueio de recursos.
+    As funções precisam receber o driver como primeiro argumento.
+
+    Args:
+        modulo (ModuleType): Módulo da plataforma, normalmente `sys.modules[__name__]`
+        plataforma (str): Nome da plataforma
+    """
+    for nome in ETAPAS_SEM_BLOQUEIO.get(plataforma, ()):
+        funcao = getattr(modulo, nome)
+
+        @functools.wraps(funcao)
+        def envoltorio(driver, *args, _funcao=funcao, **kwargs):
+            with sem_bloqueio(driver):
+                return _funcao(driver, *args, **kwargs)
+        setattr(modulo, nome, envoltorio)
+
+
+# Função contabilizar bloqueios
+def contabilizar_bloqueios(driver: webdriver.Chrome, plataforma: str) -> int:
+    """Lê o log de rede do navegador e soma as requisições bloqueadas no contador da execução.
+    Chame periodicamente (por exemplo, a cada produto), o log fica acumulado no navegador até ser lido.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        plataforma (str): Plataforma usada no contador
+
+    Returns:
+        int: Quantidade de requisições bloqueadas desde a última leitura
+    """
+    try:
+        registros = driver.get_log('performance')
+    except (WebDriverException, ValueError):
+        return 0  # Navegador sem o log de rede (perfil sem bloqueio)
+
+    requisicoes = bytes_economizados = 0
+    for registro in registros:
+        mensagem = json.loads(registro['message'])['message']
+        if mensagem.get('method') == 'Network.loadingFailed' and mensagem['params'].get('blockedReason') == 'inspector':
+            requisicoes += 1
+            bytes_economizados += TAMANHO_ESTIMADO.get(mensagem['params'].get('type'), TAMANHO_ESTIMADO['Other'])
+    if requisicoes:
+        CONTADOR.registrar(plataforma, requisicoes, bytes_economizados)
+    return requisicoes
@@ -1,12 +1,63 @@
 # Importações
 import re
 import time
+import sys
+from typing import Iterator
 from selenium import webdriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from .esperas import EsperaAdaptativa
+from . import dom
+from . import navegadores
+from . import desempenho
+
+# Exclusão em lote
+NAO_ENCONTRADO = dom.NAO_ENCONTRADO
+# Linha "Sem resultados!" da lista de produtos filtrada - VERIFIQUE O LOCALIZADOR ANTES DE UTILIZA-LO
+LISTA_VAZIA = (By.XPATH, '//table//tbody//td[@colspan and contains(@class, "text-center")]')
+# Produtos por página na listagem do catálogo - VERIFIQUE SE O PAINEL ACEITA O PARÂMETRO `limit`
+ITENS_POR_PAGINA = 500
+
+# SKUs da página da lista, com a coluna identificada pelo cabeçalho (null sem a coluna de SKU)
+_JS_LISTAR_PRODUTOS = """
+const cabecalho = Array.from(document.querySelectorAll('table thead td, table thead th'),
+                             celula => celula.textContent.trim().toLowerCase());
+const sku = cabecalho.indexOf('sku');  // Só a coluna SKU, a coluna Modelo não é o SKU
+if (sku < 0) return null;
+return Array.from(document.querySelectorAll('input[name="selected[]"]'),
+                  checkbox => checkbox.closest('tr').querySelectorAll('td')[sku].textContent.trim());
+"""
+
+# Marca somente as linhas cuja coluna SKU (identificada pelo cabeçalho) é um dos SKUs. Sem a coluna,
+# marca a única linha de uma lista filtrada por um SKU (`arguments[1]`)
+_JS_SELECIONAR_PRODUTOS = """
+const [skus, unico] = [new Set(arguments[0]), arguments[1]];
+const cabecalho = Array.from(document.querySelectorAll('table thead td, table thead th'),
+                             celula => celula.textContent.trim().toLowerCase());
+const coluna = cabecalho.indexOf('sku');
+const checkboxes = Array.from(document.querySelectorAll('input[name="selected[]"]'));
+checkboxes.forEach(checkbox => { checkbox.checked = false; });
+if (coluna < 0) {
+    if (unico !== null && checkboxes.length === 1) {
+        checkboxes[0].checked = true;
+        return [[unico], 1, false];
+    }
+    return [[], checkboxes.length, false];
+}
+const selecionados = [];
+for (const checkbox of checkboxes) {
+    const celula = checkbox.closest('tr').querySelectorAll('td')[coluna];
+    const sku = celula ? celula.textContent.trim() : null;
+    if (sku !== null && skus.has(sku) && !selecionados.includes(sku)) {
+        checkbox.checked = true;
+        selecionados.push(sku);
+    }
+}
+return [selecionados, checkboxes.length, true];
+"""
 
 
 # Função AUXILIARES
@@ -71,7 +122,7 @@ def login_opencart(driver: webdriver.Chrome, login_url='URL DO LOGIN', username=
     Returns:
         str: Url com o token de acesso para não desconectar da sessão atual
     """
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'opencart')
 
     # Acessando a página de login
     print('LOGANDO - OPENCART')
@@ -107,28 +158,22 @@ def login_opencart(driver: webdriver.Chrome, login_url='URL DO LOGIN', username=
 
 
 # Função verificar produto - OPENCART
-def verificar_produto_opencart(driver: webdriver.Chrome) -> bool:
-    """Verifica se o produto existe na Opecart.
+def verificar_produto_opencart(driver: webdriver.Chrome) -> str:
+    """Verifica se o produto existe na Opecart, retornando assim que o produto ou a linha
+    "Sem resultados!" aparece na lista.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium.
 
     Returns:
-        bool: True se o produto existe, False caso contrário.
+        str: `dom.ENCONTRADO`, `dom.NAO_ENCONTRADO` ou `dom.DESCONHECIDO` quando a lista não respondeu no tempo.
     """
-    wait = WebDriverWait(driver, 2)
-
     print('VERIFICANDO SE O PRODUTO EXISTE')
-    try:
-        # Capturando o ID do produto
-        produto = wait.until(EC.visibility_of_element_located(
-            (By.NAME, 'selected[]'))).get_attribute('value')
-    except Exception:
-        print('O produto não existe na Opencart')
-        produto = None
+    resultado = dom.aguardar_resultado(driver, (By.NAME, 'selected[]'), LISTA_VAZIA, 2, 'opencart')
+    if resultado != dom.ENCONTRADO:
+        print(f'O produto não existe na Opencart ({resultado})')
 
-    # Verificando se o produto existe
-    return produto is not None and produto != ''
+    return resultado
 
 
 # Função Acessar produto
@@ -170,10 +215,10 @@ def atualizar_categoria_opencart(driver: webdriver.Chrome, category: str, produc
         category (str): Nome da categoria existente que o produto irá ser atribuido
         product_id (str | int): ID do produto fornecido pelo Tiny
     """
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'opencart')
 
     # Verificando se o produto existe no site
-    existe = verificar_produto_opencart(driver)
+    existe = verificar_produto_opencart(driver) == dom.ENCONTRADO
 
     # Se existir atualiza o produto
     if existe:
@@ -223,12 +268,12 @@ def excluir_produto_opencart(driver: webdriver.Chrome, sku: str):
         driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
         sku (str): SKU do produto, somente para confirmar se o produto foi encontrado.
     """
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'opencart')
 
     # Verificando se o produto foi encontrado
     encontrado = verificar_produto_opencart(driver)
-    
-    if encontrado:
+
+    if encontrado == dom.ENCONTRADO:
         # Selecionando o produto
         wait.until(EC.visibility_of_element_located(
                 (By.NAME, 'selected[]'))).click()
@@ -240,9 +285,221 @@ def excluir_produto_opencart(driver: webdriver.Chrome, sku: str):
         wait.until(EC.alert_is_present())
         alert = driver.switch_to.alert
         alert.accept()
-    else:
+    elif encontrado == dom.NAO_ENCONTRADO:
         # Lança uma exceção caso o produto não seja encontrado
         raise ValueError(f"O produto com SKU '{sku}' não foi encontrado no Opencart.")
+    else:
+        raise RuntimeError(f"Não foi possível confirmar se o produto com SKU '{sku}' existe no Opencart.")
+
+
+# Função selecionar produtos da página - OPENCART
+def selecionar_produtos_pagina_opencart(driver: webdriver.Chrome,
+                                        skus: set[str],
+                                        sku_filtrado: str | None = None) -> tuple[list[str], int, bool]:
+    """Desmarca todos os checkboxes `selected[]` da página atual da lista e marca, de uma só vez,
+    os produtos cuja coluna SKU (identificada pelo cabeçalho) está em `skus`. As demais colunas
+    (modelo, preço, quantidade) nunca são comparadas.
+
+    Sem a coluna SKU na lista, só marca o produto quando a lista foi filtrada por um único SKU
+    (`sku_filtrado`) e o filtro retornou exatamente um produto.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        skus (set[str]): SKUs que devem ser selecionados
+        sku_filtrado (str | None, optional): SKU usado no `filter_sku` da página. Defaults to None.
+
+    Returns:
+        tuple[list[str], int, bool]: SKUs selecionados, a quantidade de produtos na página e se a lista tem a coluna SKU
+    """
+    selecionados, linhas, coluna_sku = driver.execute_script(_JS_SELECIONAR_PRODUTOS, list(skus), sku_filtrado)
+    return selecionados, linhas, coluna_sku
+
+
+# Função excluir selecionados - OPENCART
+def excluir_selecionados_opencart(driver: webdriver.Chrome):
+    """Exclui todos os produtos selecionados na lista com um único clique em Excluir e uma única confirmação.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+
+    Raises:
+        RuntimeError: Erro ao excluir ou a Opencart não confirmou a exclusão
+    """
+    wait = EsperaAdaptativa(driver, 10, 'opencart')
+    try:
+        # Clicando em excluir produto
+        wait.until(EC.visibility_of_element_located(
+            (By.CSS_SELECTOR, 'button[data-original-title="Excluir"]')
+        )).click()
+        # Confirmando o pop-up
+        wait.until(EC.alert_is_present())
+        driver.switch_to.alert.accept()
+        # Aguardando a mensagem de sucesso
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.alert-success')))
+    except Exception as e:
+        raise RuntimeError(f"Erro ao excluir os produtos selecionados: {str(e)}") from e
+
+
+# Função excluir produtos em lote - OPENCART
+def excluir_produtos_lote_opencart(driver: webdriver.Chrome,
+                                   url_product: str,
+                                   skus: list[str],
+                                   pesquisa: str | None = None,
+                                   max_paginas: int = 20) -> dict[str, str | None]:
+    """Exclui vários produtos com uma confirmação por página da lista, ao invés de um
+    carregamento e uma confirmação por produto.
+
+    Os SKUs são agrupados pelo prefixo (`dom.agrupar_por_prefixo()`, ou um único grupo com a `pesquisa`
+    informada) e, para cada grupo, a lista é filtrada pelo prefixo comum e as páginas são percorridas
+    marcando os produtos pela coluna SKU. Os SKUs avulsos, os que não aparecerem nas páginas percorridas,
+    ou todos se a lista não tiver a coluna SKU, são filtrados individualmente.
+
+    Deve se usar a função `login()` antes para conseguir a url com o token ativo.
+
+    VERIFIQUE O CÓDIGO DESSA FUNÇÃO ANTES DE UTILIZA-LA
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        url_product (str): url com o token ativo para manter a sessão
+        skus (list[str]): SKUs dos produtos que serão excluídos
+        pesquisa (str | None, optional): Texto usado no filtro de SKU da lista, no lugar dos grupos por prefixo. Defaults to None.
+        max_paginas (int, optional): Quantidade máxima de páginas percorridas em cada grupo. Defaults to 20.
+
+    Returns:
+        dict[str, str | None]: Resultado de cada SKU: `None` se excluído, `NAO_ENCONTRADO` se não
+        existe na Opencart ou a mensagem de erro.
+    """
+    resultados: dict[str, str | None] = {}
+    for resultado in excluir_produtos_lote_opencart_por_sku(driver, url_product, skus, pesquisa, max_paginas):
+        resultados.update(resultado)
+    return resultados
+
+
+# Função excluir produtos em lote por SKU - OPENCART
+def excluir_produtos_lote_opencart_por_sku(driver: webdriver.Chrome,
+                                           url_product: str,
+                                           skus: list[str],
+                                           pesquisa: str | None = None,
+                                           max_paginas: int = 20) -> Iterator[dict[str, str | None]]:
+    """Faz a mesma exclusão de `excluir_produtos_lote_opencart()`, enviando o resultado de cada SKU
+    assim que ele é conhecido, para que o status seja gravado durante a exclusão e um erro no meio
+    não perca os resultados anteriores.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        url_product (str): url com o token ativo para manter a sessão
+        skus (list[str]): SKUs dos produtos que serão excluídos
+        pesquisa (str | None, optional): Texto usado no filtro de SKU da lista, no lugar dos grupos por prefixo. Defaults to None.
+        max_paginas (int, optional): Quantidade máxima de páginas percorridas em cada grupo. Defaults to 20.
+
+    Yields:
+        Iterator[dict[str, str | None]]: Resultado de um SKU, no formato de `excluir_produtos_lote_opencart()`
+    """
+    pendentes = {str(sku) for sku in skus}
+    if not pendentes:
+        return
+
+    print(f'EXCLUINDO {len(pendentes)} PRODUTOS EM LOTE - OPENCART')
+    url_lista = url_product.replace('route=catalog/product/edit', 'route=catalog/product')
+    if pesquisa is None:
+        grupos, _ = dom.agrupar_por_prefixo(pendentes)
+    else:
+        grupos = [(pesquisa, sorted(pendentes))] if len(pesquisa) >= 3 else []
+
+    def excluir_pagina(url: str, sku_filtrado: str | None = None) -> tuple[dict[str, str | None], int, bool]:
+        driver.get(url)
+        selecionados, linhas, coluna_sku = selecionar_produtos_pagina_opencart(driver, pendentes, sku_filtrado)
+        erro = None
+        if selecionados:
+            pendentes.difference_update(selecionados)
+            try:
+                excluir_selecionados_opencart(driver)
+            except Exception as e:
+                erro = str(e)
+        excluidos = {sku: f"Erro ao excluir o produto {sku}: {erro}" if erro else None for sku in selecionados}
+        return excluidos, linhas, coluna_sku
+
+    # Percorrendo as páginas filtradas pelo prefixo comum de cada grupo (somente com a coluna SKU na lista)
+    sem_coluna_sku = False
+    for prefixo, grupo in grupos:
+        pagina = 1
+        while pendentes.intersection(grupo) and pagina <= max_paginas:
+            try:
+                excluidos, linhas, coluna_sku = excluir_pagina(f'{url_lista}&filter_sku={prefixo}&page={pagina}')
+            except Exception as e:
+                print(f'Erro ao excluir o grupo {prefixo}, os SKUs restantes serão filtrados individualmente - {str(e)}')
+                break
+            for sku, erro in excluidos.items():
+                yield {sku: erro}
+            if linhas and not coluna_sku:
+                sem_coluna_sku = True
+                break
+            if not linhas:
+                break
+            if not excluidos:
+                pagina += 1  # Após uma exclusão a mesma página é verificada novamente
+        if sem_coluna_sku:
+            break  # Sem a coluna SKU, os demais grupos também não podem ser marcados
+
+    # SKUs avulsos e fora das páginas percorridas: filtro individual
+    for sku in sorted(pendentes):
+        if sku not in pendentes:
+            continue  # Já excluído junto com outro SKU do mesmo filtro
+        try:
+            excluidos, linhas, coluna_sku = excluir_pagina(f'{url_lista}&filter_sku={sku}', sku)
+        except Exception as e:
+            yield {sku: f"Erro ao excluir o produto {sku}: {str(e)}"}
+            continue
+        for excluido, erro in excluidos.items():
+            yield {excluido: erro}
+        if sku in excluidos:
+            continue
+        if linhas and not coluna_sku:
+            yield {sku: (f"Erro ao excluir o produto {sku}: o filtro retornou {linhas} produtos "
+                         "e a lista não tem a coluna SKU para confirmar qual é o produto")}
+        else:
+            yield {sku: NAO_ENCONTRADO}
+
+
+# Função listar produtos - OPENCART
+def listar_produtos_opencart(driver: webdriver.Chrome,
+                             url_product: str,
+                             itens_por_pagina: int = ITENS_POR_PAGINA,
+                             max_paginas: int = 1000) -> Iterator[list[str]]:
+    """Percorre todas as páginas da lista de produtos, lendo cada página com uma única chamada ao navegador.
+    Usada para montar o catálogo local (`catalogo.obter_catalogo()`).
+
+    Deve se usar a função `login()` antes para conseguir a url com o token ativo.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        url_product (str): url com o token ativo para manter a sessão
+        itens_por_pagina (int, optional): Produtos por página. Defaults to ITENS_POR_PAGINA.
+        max_paginas (int, optional): Quantidade máxima de páginas percorridas. Defaults to 1000.
+
+    Raises:
+        RuntimeError: A lista não carregou, não tem a coluna de SKU ou tem mais páginas que `max_paginas`
+
+    Yields:
+        Iterator[list[str]]: SKUs de cada página
+    """
+    print('LISTANDO OS PRODUTOS - OPENCART')
+    url_lista = url_product.replace('route=catalog/product/edit', 'route=catalog/product')
+
+    for pagina in range(1, max_paginas + 1):
+        driver.get(f'{url_lista}&limit={itens_por_pagina}&page={pagina}')
+        resultado = dom.aguardar_resultado(driver, (By.NAME, 'selected[]'), LISTA_VAZIA, 10, 'opencart')
+        if resultado == dom.DESCONHECIDO:
+            raise RuntimeError(f'A página {pagina} da lista de produtos não carregou')
+        if resultado == dom.NAO_ENCONTRADO:
+            return
+
+        produtos = driver.execute_script(_JS_LISTAR_PRODUTOS)
+        if produtos is None:
+            raise RuntimeError('A lista de produtos não tem a coluna SKU (a coluna Modelo não é usada), '
+                               'adicione a coluna SKU à lista para montar o catálogo')
+        yield produtos
+    raise RuntimeError(f'A lista de produtos tem mais de {max_paginas} páginas')
 
 
 def atualizar_produtos_relacionados(driver:webdriver.Chrome, related_products:str):
@@ -252,7 +509,7 @@ def atualizar_produtos_relacionados(driver:webdriver.Chrome, related_products:st
         driver (webdriver.Chrome): Objeto de controle do Selenium
         related_products (str): lista que se relacionam com o produto
     """
-    wait = WebDriverWait(driver, 5)
+    wait = EsperaAdaptativa(driver, 5, 'opencart')
     scrolar_comeco(driver)
     time.sleep(1)
     scrolar_final(driver)
@@ -276,7 +533,7 @@ def atualizar_compre_junto(driver:webdriver.Chrome, compre_junto:str):
         driver (webdriver.Chrome): Objeto de controle do Selenium
         compre_junto (str): Lista dos produtos que se relacionam
     """
-    wait = WebDriverWait(driver, 5)
+    wait = EsperaAdaptativa(driver, 5, 'opencart')
     scrolar_comeco(driver)
     time.sleep(1)
     scrolar_final(driver)
@@ -302,35 +559,22 @@ def atualizar_promocoes(driver:webdriver.Chrome, p_fisica:str, p_juridica:str, p
         p_juridica (str): Preço para pessoas juridicas
         p_revenda (str): Preços para revendedores
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'opencart')
     clicar_elemento(wait, By.CSS_SELECTOR, 'a[href="#tab-special"]', "aba promoções")
     clicar_elemento(wait, By.CSS_SELECTOR, 'button[onclick="addSpecial();"]', 'Adicionar promoção')
     time.sleep(1)
     clicar_elemento(wait, By.CSS_SELECTOR, 'button[onclick="addSpecial();"]', 'Adicionar promoção')
-    # ---- Provisorio até pensar em uma solução melhor
-    select_fisica = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'select[name="product_special[0][customer_group_id]"]')))
-    select_0 = Select(select_fisica)
-    select_0.select_by_value("1")
-    
-    select_juridica = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'select[name="product_special[1][customer_group_id]"]')))
-    select_1 = Select(select_juridica)
-    select_1.select_by_value("2")
-    
-    select_revenda = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'select[name="product_special[2][customer_group_id]"]')))
-    select_2 = Select(select_revenda)
-    select_2.select_by_value("3")
-    # ----
-    preco_fisica_input = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'input[name="product_special[0][price]"]')))
-    preco_fisica_input.clear()
-    preco_fisica_input.send_keys(p_fisica.replace(',', '.'))
-    
-    preco_juridica_input = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'input[name="product_special[1][price]"]')))
-    preco_juridica_input.clear()
-    preco_juridica_input.send_keys(p_juridica.replace(',', '.'))
-
-    preco_revenda_input = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'input[name="product_special[2][price]"]')))
-    preco_revenda_input.clear()
-    preco_revenda_input.send_keys(p_revenda.replace(',', '.'))
+
+    # Grupo de clientes (1 física, 2 jurídica, 3 revenda) e preço de cada promoção, em uma única chamada
+    campos = {}
+    valores = {}
+    for linha, (grupo, preco) in enumerate([("1", p_fisica), ("2", p_juridica), ("3", p_revenda)]):
+        campos[f'grupo_{linha}'] = (By.NAME, f'product_special[{linha}][customer_group_id]')
+        campos[f'preco_{linha}'] = (By.NAME, f'product_special[{linha}][price]')
+        valores[f'grupo_{linha}'] = grupo
+        valores[f'preco_{linha}'] = preco.replace(',', '.')
+    dom.aguardar_campos(driver, campos, 20, 'opencart')
+    dom.escrever_campos(driver, campos, valores)
 
 
 def atualizar_slug(driver:webdriver.Chrome, slug:str):
@@ -340,7 +584,7 @@ def atualizar_slug(driver:webdriver.Chrome, slug:str):
         driver (webdriver.Chrome): Objeto de controle do Selenium
         slug (str): URL amigavél
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'opencart')
     clicar_elemento(wait, By.CSS_SELECTOR, 'a[href="#tab-seo"]', "aba seo")
     slug_input = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'input[placeholder="URL amigável"]')))
     slug_input.clear()
@@ -354,7 +598,7 @@ def atualizar_meta_titulo(driver:webdriver.Chrome, meta_titulo:str):
         driver (webdriver.Chrome): objeto de controle do Selenium
         meta_titulo (str): Meta titulo que será atualizado
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'opencart')
     scrolar_final(driver)
     meta_titulo_input = wait.until(EC.visibility_of_element_located((By.ID, 'input-meta-title2')))
     meta_titulo_input.clear()
@@ -368,7 +612,7 @@ def atualizar_descricao(driver:webdriver.Chrome, descricao:str):
         driver (webdriver.Chrome): objeto de controle do Selenium
         descricao (str): Descrição que será atualizada
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'opencart')
     scrolar_final(driver)
     descricao_input = wait.until(EC.visibility_of_element_located((By.ID, 'input-meta-description2')))
     descricao_input.clear()
@@ -382,18 +626,69 @@ def atualziar_palavra_chave(driver:webdriver.Chrome, palavra_chave:str):
         driver (webdriver.Chrome): Objeto de controle do Selenium
         palavra_chave (str): Palavras chaves separadas por virgula, somente.
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'opencart')
     scrolar_final(driver)
     palavra_input = wait.until(EC.visibility_of_element_located((By.ID, 'input-meta-keyword2')))
     palavra_input.clear()
     palavra_input.send_keys(palavra_chave)
 
 
+# Campos de SEO e meta dados do produto
+CAMPOS_SEO = {
+    'meta_titulo': (By.ID, 'input-meta-title2'),
+    'meta_descricao': (By.ID, 'input-meta-description2'),
+    'palavra_chave': (By.ID, 'input-meta-keyword2'),
+    'slug': (By.CSS_SELECTOR, 'input[placeholder="URL amigável"]'),
+}
+
+
+def preencher_seo(driver:webdriver.Chrome, meta_titulo:str, descricao:str, palavra_chave:str, slug:str) -> list[str]:
+    """Preenche o meta titulo, a meta descrição, as palavras chaves e o slug em uma única chamada ao navegador
+    e confere os valores lidos de volta. Os campos que não ficaram com o valor esperado são preenchidos
+    pelo teclado (`atualizar_meta_titulo()`, `atualizar_descricao()`...), com a rolagem e o zoom.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+        meta_titulo (str): Meta titulo
+        descricao (str): Meta descrição
+        palavra_chave (str): Palavras chaves separadas por virgula, somente.
+        slug (str): URL amigavél
+
+    Returns:
+        list[str]: Campos que precisaram ser preenchidos pelo teclado
+    """
+    valores = {'meta_titulo': meta_titulo, 'meta_descricao': descricao, 'palavra_chave': palavra_chave, 'slug': slug}
+    try:
+        # Os campos ficam em abas ocultas, basta existirem para serem preenchidos
+        dom.aguardar_campos(driver, CAMPOS_SEO, 20, 'opencart', visiveis=False)
+        resultado = dom.escrever_campos(driver, CAMPOS_SEO, valores, conferir=False)
+        divergentes = list(dom.divergentes(resultado, valores))
+    except Exception as e:
+        print(f"Não foi possível preencher o SEO de uma vez, preenchendo pelo teclado - {str(e)}")
+        divergentes = list(valores)
+
+    if not divergentes:
+        return []
+
+    # Caminho alternativo: digitando campo a campo
+    ajustar_zoom(driver)
+    preencher = {'meta_titulo': atualizar_meta_titulo, 'meta_descricao': atualizar_descricao,
+                 'palavra_chave': atualziar_palavra_chave, 'slug': atualizar_slug}
+    for campo in divergentes:
+        preencher[campo](driver, valores[campo])
+    return divergentes
+
+
 def salvar_altercoes(driver:webdriver.Chrome):
     """Salva as alterações feitas
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do Selenium
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'opencart')
     clicar_elemento(wait, By.CSS_SELECTOR, 'button.btn.btn-primary[data-original-title="Salvar"]', 'Salvar alterações')
+
+
+# Tempo de cada função pública gravado em tempos.jsonl (relatório: python relatorio_desempenho.py)
+navegadores.liberar_etapas(sys.modules[__name__], 'opencart')  # Etapas em ETAPAS_SEM_BLOQUEIO
+desempenho.instrumentar_modulo(sys.modules[__name__], 'opencart')
@@ -0,0 +1,284 @@
+# Importações
+import re
+import math
+import sqlite3
+import pandas as pd
+
+# Grupos de clientes das promoções: pessoa física, pessoa jurídica e revenda
+GRUPOS_PROMOCAO = (1, 2, 3)
+# Prioridade das promoções gravadas pela planilha. Somente as promoções desses grupos com essa
+# prioridade são substituídas, as demais (outros grupos, promoções com data) são mantidas
+PRIORIDADE_PROMOCAO = 1
+
+
+# Funções auxiliares
+def _valor_vazio(valor) -> bool:
+    """Verifica se o valor da planilha está vazio (a planilha é convertida para `str`, então `nan` também é vazio)."""
+    return valor is None or str(valor).strip() in ('', 'nan', 'None', '<NA>')
+
+
+def id_produto(valor) -> int | None:
+    """Converte o ID da planilha para int, aceitando `123.0` (coluna lida como texto com linhas vazias).
+    Retorna None quando o ID está vazio ou não é um número inteiro."""
+    if _valor_vazio(valor):
+        return None
+    try:
+        numero = float(str(valor).strip().replace(',', '.'))
+    except ValueError:
+        return None
+    return int(numero) if numero.is_integer() else None
+
+
+def _preco(valor) -> float | None:
+    """Converte o preço da planilha para float com 2 casas, aceitando `80,5`, `1.234,56` e `R$ 10,00`.
+    Retorna None quando o preço não é um número."""
+    texto = str(valor).replace('R$', '').replace(' ', '').strip()
+    if ',' in texto:
+        texto = texto.replace('.', '').replace(',', '.')
+    try:
+        numero = float(texto)
+    except ValueError:
+        return None
+    return round(numero, 2) if math.isfinite(numero) else None
+
+
+def _lotes(itens: list, tamanho: int):
+    """Divide a lista em lotes do tamanho informado."""
+    for inicio in range(0, len(itens), tamanho):
+        yield itens[inicio:inicio + tamanho]
+
+
+def criar_tabelas_sqlite(conexao: sqlite3.Connection, prefixo: str = 'oc_'):
+    """Cria as tabelas da Opencart usadas pelo `OpencartDB` em um banco SQLite.
+    Serve para testar a planilha localmente (com `dry_run`) antes de aplicar no banco real.
+
+    Args:
+        conexao (sqlite3.Connection): Conexão com o banco SQLite.
+        prefixo (str, optional): Prefixo das tabelas. Defaults to 'oc_'.
+    """
+    conexao.executescript(f"""
+        CREATE TABLE IF NOT EXISTS {prefixo}product_description (
+            product_id INTEGER NOT NULL, language_id INTEGER NOT NULL, name TEXT NOT NULL DEFAULT '',
+            description TEXT NOT NULL DEFAULT '', tag TEXT NOT NULL DEFAULT '', meta_title TEXT NOT NULL DEFAULT '',
+            meta_description TEXT NOT NULL DEFAULT '', meta_keyword TEXT NOT NULL DEFAULT '',
+            PRIMARY KEY (product_id, language_id));
+        CREATE TABLE IF NOT EXISTS {prefixo}seo_url (
+            seo_url_id INTEGER PRIMARY KEY AUTOINCREMENT, store_id INTEGER NOT NULL, language_id INTEGER NOT NULL,
+            query TEXT NOT NULL, keyword TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS {prefixo}product_special (
+            product_special_id INTEGER PRIMARY KEY AUTOINCREMENT, product_id INTEGER NOT NULL,
+            customer_group_id INTEGER NOT NULL, priority INTEGER NOT NULL DEFAULT 1, price REAL NOT NULL DEFAULT 0,
+            date_start TEXT NOT NULL DEFAULT '0000-00-00', date_end TEXT NOT NULL DEFAULT '0000-00-00');
+        CREATE TABLE IF NOT EXISTS {prefixo}product_related (
+            product_id INTEGER NOT NULL, related_id INTEGER NOT NULL, PRIMARY KEY (product_id, related_id));
+    """)
+    conexao.commit()
+
+
+# Motor de atualização direta no banco da Opencart
+class OpencartDB:
+    """Aplica os metadados de uma planilha direto no banco da Opencart, em lotes e com transações.
+
+    Atualiza as tabelas padrão `product_description` (meta titulo, meta descrição e palavras chaves),
+    `seo_url` (slug), `product_special` (promoções) e `product_related` (produtos relacionados).
+    O compre junto não é alterado, pois depende da tabela do módulo instalado na loja.
+
+    Args:
+        conexao: Conexão DB-API (pymysql, mysql.connector, sqlite3...).
+        prefixo (str, optional): Prefixo das tabelas da Opencart. Defaults to 'oc_'.
+        id_idioma (int, optional): ID do idioma dos metadados. Defaults to 2.
+        id_loja (int, optional): ID da loja do slug. Defaults to 0.
+        marcador (str | None, optional): Marcador de parâmetros do driver (`%s` ou `?`).
+        Se None, usa `?` para SQLite e `%s` para os outros. Defaults to None.
+    """
+    def __init__(self, conexao, prefixo: str = 'oc_', id_idioma: int = 2, id_loja: int = 0, marcador: str | None = None):
+        self.conexao = conexao
+        self.prefixo = prefixo
+        self.id_idioma = id_idioma
+        self.id_loja = id_loja
+        self.marcador = marcador or ('?' if isinstance(conexao, sqlite3.Connection) else '%s')
+
+    def _sql(self, sql: str, quantidade: int = 0) -> str:
+        """Troca `{p}` pelo prefixo, `{lista}` por `quantidade` marcadores e `?` pelo marcador do driver."""
+        sql = sql.replace('{p}', self.prefixo).replace('{lista}', ', '.join(['?'] * quantidade))
+        return sql.replace('?', self.marcador)
+
+    def _consultar(self, sql: str, parametros: list, valores_lista: list, tamanho_lote: int = 500) -> list[tuple]:
+        """Executa um SELECT com `IN ({lista})` em lotes, para não passar do limite de parâmetros do banco."""
+        linhas = []
+        cursor = self.conexao.cursor()
+        for lote in _lotes(valores_lista, tamanho_lote):
+            cursor.execute(self._sql(sql, len(lote)), [*parametros, *lote])
+            linhas.extend(cursor.fetchall())
+        cursor.close()
+        return linhas
+
+    def planejar(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compara a planilha com o banco e retorna somente o que será alterado, sem alterar nada.
+
+        A planilha usa as mesmas colunas do `ajusta_produtos_opencart.py`: `ID`, `Meta titulo`,
+        `Meta Descrição`, `Meta palavras chaves`, `Produtos Relacionados`, `pessoa fisica`,
+        `pessoa juridica`, `pessoa juridica revenda` e `Padrão` (slug).
+
+        Args:
+            df (pd.DataFrame): Planilha com os produtos.
+
+        Returns:
+            pd.DataFrame: Alterações com as colunas `ID`, `tabela`, `campo`, `atual` e `novo`.
+            Produtos que não foram encontrados aparecem com o campo `aviso` e não são gravados,
+            assim como os preços de promoção inválidos (as demais alterações do produto são gravadas).
+        """
+        ids = [product_id for product_id in map(id_produto, df['ID']) if product_id is not None]
+        idioma = self.id_idioma
+
+        # Lendo o estado atual do banco de uma vez por tabela
+        descricoes = {linha[0]: linha[1:] for linha in self._consultar(
+            "SELECT product_id, meta_title, meta_description, meta_keyword FROM {p}product_description "
+            "WHERE language_id = ? AND product_id IN ({lista})", [idioma], ids)}
+        slugs = {linha[0]: linha[1] for linha in self._consultar(
+            "SELECT query, keyword FROM {p}seo_url WHERE store_id = ? AND language_id = ? AND query IN ({lista})",
+            [self.id_loja, idioma], [f'product_id={i}' for i in ids])}
+        promocoes: dict[int, dict[int, float]] = {}
+        for product_id, grupo, preco in self._consultar(
+                "SELECT product_id, customer_group_id, price FROM {p}product_special "
+                "WHERE priority = ? AND product_id IN ({lista})", [PRIORIDADE_PROMOCAO], ids):
+            if grupo not in GRUPOS_PROMOCAO:
+                continue
+            promocoes.setdefault(product_id, {})[grupo] = round(float(preco), 2)
+        relacionados: dict[int, set[int]] = {}
+        for product_id, related_id in self._consultar(
+                "SELECT product_id, related_id FROM {p}product_related WHERE product_id IN ({lista})", [], ids):
+            relacionados.setdefault(product_id, set()).add(related_id)
+
+        # Resolvendo os nomes dos produtos relacionados em IDs, igual ao autocompletar do painel
+        nomes = set()
+        for lista in df.get('Produtos Relacionados', pd.Series(dtype=str)):
+            if not _valor_vazio(lista):
+                nomes.update(re.sub(r'^\d+-', '', nome).strip() for nome in str(lista).split('\n') if nome.strip())
+        id_por_nome = {nome.lower(): product_id for product_id, nome in self._consultar(
+            "SELECT product_id, name FROM {p}product_description WHERE language_id = ? AND name IN ({lista})",
+            [idioma], sorted(nomes))}
+
+        alteracoes = []
+        campos_meta = (('Meta titulo', 'meta_title'), ('Meta Descrição', 'meta_description'), ('Meta palavras chaves', 'meta_keyword'))
+        for row in df.to_dict('records'):  # Dicionários simples, mais leves que as linhas do iterrows
+            if _valor_vazio(row['ID']):
+                continue
+            product_id = id_produto(row['ID'])
+            if product_id is None:
+                alteracoes.append((row['ID'], 'product_description', 'aviso', None, 'ID inválido'))
+                continue
+            if product_id not in descricoes:
+                alteracoes.append((product_id, 'product_description', 'aviso', None, 'produto não encontrado'))
+                continue
+
+            for posicao, (coluna, campo) in enumerate(campos_meta):
+                novo = row.get(coluna)
+                if not _valor_vazio(novo) and str(novo) != descricoes[product_id][posicao]:
+                    alteracoes.append((product_id, 'product_description', campo, descricoes[product_id][posicao], str(novo)))
+
+            slug = row.get('Padrão')
+            if not _valor_vazio(slug) and str(slug) != slugs.get(f'product_id={product_id}'):
+                alteracoes.append((product_id, 'seo_url', 'keyword', slugs.get(f'product_id={product_id}'), str(slug)))
+
+            precos = (row.get('pessoa fisica'), row.get('pessoa juridica'), row.get('pessoa juridica revenda'))
+            novas = {}
+            for grupo, preco in zip(GRUPOS_PROMOCAO, precos):
+                if _valor_vazio(preco):
+                    continue
+                if _preco(preco) is None:
+                    alteracoes.append((product_id, 'product_special', 'aviso', None, f'preço inválido: {preco}'))
+                    continue
+                novas[grupo] = _preco(preco)
+            atuais = {grupo: promocoes.get(product_id, {}).get(grupo) for grupo in novas}
+            if novas and novas != atuais:
+                alteracoes.append((product_id, 'product_special', 'price', atuais, novas))
+
+            lista = row.get('Produtos Relacionados')
+            if not _valor_vazio(lista):
+                for nome in str(lista).split('\n'):
+                    nome = re.sub(r'^\d+-', '', nome).strip()
+                    if not nome:
+                        continue
+                    related_id = id_por_nome.get(nome.lower())
+                    if related_id is None:
+                        alteracoes.append((product_id, 'product_related', 'aviso', None, f'produto relacionado não encontrado: {nome}'))
+                    elif related_id not in relacionados.get(product_id, set()) and related_id != product_id:
+                        alteracoes.append((product_id, 'product_related', 'related_id', None, related_id))
+                        relacionados.setdefault(product_id, set()).add(related_id)
+
+        return pd.DataFrame(alteracoes, columns=['ID', 'tabela', 'campo', 'atual', 'novo'])
+
+    def aplicar(self, df: pd.DataFrame, dry_run: bool = False, tamanho_lote: int = 500) -> pd.DataFrame:
+        """Aplica a planilha no banco. Cada lote de produtos é gravado em uma única transação.
+
+        Args:
+            df (pd.DataFrame): Planilha com os produtos (mesmas colunas do `planejar()`).
+            dry_run (bool, optional): Somente retorna as alterações, sem gravar. Defaults to False.
+            tamanho_lote (int, optional): Quantidade de produtos por transação. Defaults to 500.
+
+        Raises:
+            RuntimeError: Erro ao gravar um lote, o lote é desfeito (rollback).
+
+        Returns:
+            pd.DataFrame: Alterações no mesmo formato do `planejar()`.
+        """
+        alteracoes = self.planejar(df)
+        if dry_run or alteracoes.empty:
+            return alteracoes
+
+        # Ignorando os avisos (produto ou relacionado não encontrado)
+        validas = alteracoes[alteracoes['campo'] != 'aviso']
+        ids = list(dict.fromkeys(validas['ID']))
+
+        for lote in _lotes(ids, tamanho_lote):
+            lote_df = validas[validas['ID'].isin(lote)]
+            cursor = self.conexao.cursor()
+            try:
+                self._gravar_lote(cursor, lote_df)
+                self.conexao.commit()
+            except Exception as e:
+                self.conexao.rollback()
+                raise RuntimeError(f"Erro ao gravar o lote de produtos {lote[0]} a {lote[-1]} - {str(e)}") from e
+            finally:
+                cursor.close()
+
+        return alteracoes
+
+    def _gravar_lote(self, cursor, alteracoes: pd.DataFrame):
+        """Grava as alterações de um lote de produtos com `executemany` por tipo de alteração."""
+        idioma = self.id_idioma
+        for campo in ('meta_title', 'meta_description', 'meta_keyword'):
+            linhas = alteracoes[(alteracoes['tabela'] == 'product_description') & (alteracoes['campo'] == campo)]
+            if not linhas.empty:
+                cursor.executemany(
+                    self._sql(f"UPDATE {{p}}product_description SET {campo} = ? WHERE product_id = ? AND language_id = ?"),
+                    [(novo, int(product_id), idioma) for product_id, novo in zip(linhas['ID'], linhas['novo'])])
+
+        linhas = alteracoes[alteracoes['tabela'] == 'seo_url']
+        if not linhas.empty:
+            consultas = [(self.id_loja, idioma, f'product_id={int(product_id)}') for product_id in linhas['ID']]
+            cursor.executemany(self._sql("DELETE FROM {p}seo_url WHERE store_id = ? AND language_id = ? AND query = ?"), consultas)
+            cursor.executemany(self._sql("INSERT INTO {p}seo_url (store_id, language_id, query, keyword) VALUES (?, ?, ?, ?)"),
+                               [(*consulta, novo) for consulta, novo in zip(consultas, linhas['novo'])])
+
+        linhas = alteracoes[alteracoes['tabela'] == 'product_special']
+        if not linhas.empty:
+            # Somente as promoções da planilha (grupo e prioridade) são substituídas
+            promocoes = [(int(product_id), grupo, PRIORIDADE_PROMOCAO, preco)
+                         for product_id, novas in zip(linhas['ID'], linhas['novo']) for grupo, preco in novas.items()]
+            cursor.executemany(
+                self._sql("DELETE FROM {p}product_special WHERE product_id = ? AND customer_group_id = ? AND priority = ?"),
+                [promocao[:3] for promocao in promocoes])
+            cursor.executemany(
+                self._sql("INSERT INTO {p}product_special (product_id, customer_group_id, priority, price, date_start, date_end) "
+                          "VALUES (?, ?, ?, ?, '0000-00-00', '0000-00-00')"),
+                promocoes)
+
+        # A Opencart grava os relacionados nos dois sentidos
+        linhas = alteracoes[alteracoes['tabela'] == 'product_related']
+        if not linhas.empty:
+            pares = {(int(product_id), int(related_id)) for product_id, related_id in zip(linhas['ID'], linhas['novo'])}
+            pares |= {(related_id, product_id) for product_id, related_id in pares}
+            cursor.executemany(self._sql("DELETE FROM {p}product_related WHERE product_id = ? AND related_id = ?"), sorted(pares))
+            cursor.executemany(self._sql("INSERT INTO {p}product_related (product_id, related_id) VALUES (?, ?)"), sorted(pares))
@@ -0,0 +1,278 @@
+# Importações
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
+
+# URL do painel administrativo - ALTERE AQUI CONFORME NECESSÁRIO
+URL_ADMIN = 'https://www.orionferramentas.com/painel/index.php'
+ID_IDIOMA = '2'  # Mesmo idioma dos campos `input-meta-title2`, `input-meta-description2`...
+CAMPO_COMPRE_JUNTO = 'product_buy_together[]'  # VERIFIQUE O NOME DO CAMPO ANTES DE UTILIZAR
+
+
+# Leitor do formulário do produto
+class _FormularioParser(HTMLParser):
+    """Lê os campos de um formulário HTML na mesma ordem que o navegador enviaria."""
+    def __init__(self, form_id: str):
+        super().__init__(convert_charrefs=True)
+        self.form_id = form_id
+        self.dentro = False
+        self.action = None
+        self.campos: list[tuple[str, str]] = []
+        self._textarea = None
+        self._select = None
+        self._select_valor = None
+        self._select_primeiro = None
+        self._option_valor = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'form' and attrs.get('id') == self.form_id:
+            self.dentro = True
+            self.action = attrs.get('action')
+            return
+        if not self.dentro:
+            return
+
+        nome = attrs.get('name')
+        if tag == 'input' and nome:
+            tipo = (attrs.get('type') or 'text').lower()
+            if tipo in ('checkbox', 'radio') and 'checked' not in attrs:
+                return
+            if tipo not in ('button', 'submit', 'file', 'image'):
+                self.campos.append((nome, attrs.get('value') or ('on' if tipo in ('checkbox', 'radio') else '')))
+        elif tag == 'textarea' and nome:
+            self._textarea = [nome, '']
+        elif tag == 'select' and nome:
+            self._select = nome
+            self._select_valor = None
+            self._select_primeiro = None
+        elif tag == 'option' and self._select:
+            self._option_valor = attrs.get('value', '')
+            if self._select_primeiro is None:
+                self._select_primeiro = self._option_valor
+            if 'selected' in attrs:
+                self._select_valor = self._option_valor
+
+    def handle_data(self, data):
+        if self._textarea is not None:
+            self._textarea[1] += data
+
+    def handle_endtag(self, tag):
+        if not self.dentro:
+            return
+        if tag == 'form':
+            self.dentro = False
+        elif tag == 'textarea' and self._textarea is not None:
+            self.campos.append(tuple(self._textarea))
+            self._textarea = None
+        elif tag == 'select' and self._select:
+            valor = self._select_valor if self._select_valor is not None else self._select_primeiro
+            if valor is not None:
+                self.campos.append((self._select, valor))
+            self._select = None
+
+
+# Funções auxiliares
+def _valor_vazio(valor) -> bool:
+    """Verifica se o valor da planilha está vazio (a planilha é convertida para `str`, então `nan` também é vazio)."""
+    return valor is None or str(valor).strip() in ('', 'nan', 'None', '<NA>')
+
+
+def _definir_campo(campos: list[tuple[str, str]], nome: str, valor: str):
+    """Altera o valor do campo no formulário, ou adiciona o campo se ele não existir."""
+    for posicao, (campo, _) in enumerate(campos):
+        if campo == nome:
+            campos[posicao] = (nome, valor)
+            return
+    campos.append((nome, valor))
+
+
+def _remover_campos(campos: list[tuple[str, str]], prefixo: str) -> list[tuple[str, str]]:
+    """Remove todos os campos que começam com o prefixo informado."""
+    return [(campo, valor) for campo, valor in campos if not campo.startswith(prefixo)]
+
+
+# Cliente HTTP do painel da Opencart
+class OpencartHTTP:
+    """Edita os produtos no painel administrativo da Opencart por HTTP, sem navegador.
+
+    Faz o login uma vez, busca o formulário
+    `catalog/product/edit` do produto, altera somente os campos desejados e envia o formulário completo,
+    da mesma forma que o botão Salvar. As funções do `opencart` continuam como alternativa pelo navegador.
+
+    Args:
+        url_admin (str, optional): URL do `index.php` do painel. Defaults to URL_ADMIN.
+        workers (int, optional): Tamanho do pool de conexões, igual à quantidade de threads. Defaults to 8.
+        timeout (float, optional): Tempo máximo de cada requisição em segundos. Defaults to 30.
+    """
+    def __init__(self, url_admin: str = URL_ADMIN, workers: int = 8, timeout: float = 30):
+        self.url_admin = url_admin
+        self.timeout = timeout
+        self.token = None
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def login(self, username: str, password: str):
+        """Faz o login no painel e guarda o `user_token` e o cookie da sessão.
+
+        Args:
+            username (str): Nome de usuário para fazer o acesso.
+            password (str): Senha para fazer o acesso.
+
+        Raises:
+            RuntimeError: Login recusado ou token não encontrado.
+        """
+        print('LOGANDO POR HTTP - OPENCART')
+        try:
+            resposta = self.session.post(f'{self.url_admin}?route=common/login',
+                                         data={'username': username, 'password': password},
+                                         timeout=self.timeout)
+            resposta.raise_for_status()
+        except requests.RequestException as e:
+            raise RuntimeError(f"Erro ao fazer login na Opencart - {str(e)}") from e
+
+        token = re.search(r'user_token=([A-Za-z0-9]+)', resposta.url) or re.search(r'user_token=([A-Za-z0-9]+)', resposta.text)
+        if token is None:
+            raise RuntimeError("Erro ao fazer login na Opencart - user_token não encontrado, verifique o usuário e a senha")
+        self.token = token.group(1)
+
+    def url_rota(self, rota: str, **parametros) -> str:
+        """Monta a URL de uma rota do painel com o `user_token`."""
+        extras = ''.join(f'&{chave}={valor}' for chave, valor in parametros.items())
+        return f'{self.url_admin}?route={rota}&user_token={self.token}{extras}'
+
+    def obter_formulario(self, product_id: str | int) -> tuple[str, list[tuple[str, str]]]:
+        """Busca o formulário de edição do produto.
+
+        Args:
+            product_id (str | int): ID do produto.
+
+        Raises:
+            RuntimeError: Erro ao acessar o produto ou a sessão expirou.
+
+        Returns:
+            tuple[str, list[tuple[str, str]]]: URL de envio do formulário e a lista de campos `(nome, valor)`.
+        """
+        try:
+            resposta = self.session.get(self.url_rota('catalog/product/edit', product_id=product_id), timeout=self.timeout)
+            resposta.raise_for_status()
+        except requests.RequestException as e:
+            raise RuntimeError(f"Erro ao acessar o produto {product_id} - {str(e)}") from e
+
+        parser = _FormularioParser('form-product')
+        parser.feed(resposta.text)
+        if parser.action is None:
+            raise RuntimeError(f"Formulário do produto {product_id} não encontrado, verifique se a sessão expirou")
+
+        return urljoin(resposta.url, parser.action), parser.campos
+
+    def buscar_produto_id(self, nome: str) -> str | None:
+        """Busca o ID de um produto pelo nome, com o mesmo autocompletar usado nos produtos relacionados.
+        Somente o produto com o nome igual (sem diferenciar maiúsculas) é aceito, o autocompletar também
+        retorna os produtos que só começam com o nome.
+
+        Args:
+            nome (str): Nome do produto.
+
+        Returns:
+            str | None: ID do produto, ou None se nenhum produto tiver exatamente esse nome.
+        """
+        try:
+            resposta = self.session.get(self.url_rota('catalog/product/autocomplete'),
+                                        params={'filter_name': nome}, timeout=self.timeout)
+            resposta.raise_for_status()
+            produtos = resposta.json()
+        except (requests.RequestException, ValueError):
+            return None
+
+        for produto in produtos:
+            if produto.get('name', '').strip().lower() == nome.strip().lower():
+                return str(produto['product_id'])
+        return None
+
+    def _ids_relacionados(self, lista: str) -> list[str]:
+        """Converte a lista de produtos da planilha (um por linha, `ID-Nome`) em IDs da Opencart."""
+        ids = []
+        for produto in str(lista).split('\n'):
+            produto = re.sub(r'^\d+-', '', produto).strip()
+            if not produto:
+                continue
+            product_id = self.buscar_produto_id(produto)
+            if product_id is None:
+                print(f"Não foi possível relacionar o produto: {produto}")
+            elif product_id not in ids:
+                ids.append(product_id)
+        return ids
+
+    def atualizar_produto(self,
+                          product_id: str | int,
+                          meta_titulo: str | None = None,
+                          meta_descricao: str | None = None,
+                          palavra_chave: str | None = None,
+                          produtos_relacionados: str | None = None,
+                          compre_junto: str | None = None,
+                          promocoes: tuple[str, str, str] | None = None,
+                          slug: str | None = None):
+        """Atualiza os campos informados do produto em uma única requisição. Campos vazios não são alterados.
+
+        Args:
+            product_id (str | int): ID do produto.
+            meta_titulo (str | None, optional): Meta titulo. Defaults to None.
+            meta_descricao (str | None, optional): Meta descrição. Defaults to None.
+            palavra_chave (str | None, optional): Meta palavras chaves, separadas por vírgula. Defaults to None.
+            produtos_relacionados (str | None, optional): Produtos relacionados, um por linha. Defaults to None.
+            compre_junto (str | None, optional): Produtos do compre junto, um por linha. Defaults to None.
+            promocoes (tuple[str, str, str] | None, optional): Preços para pessoa física, jurídica e revenda,
+            substituem as promoções atuais do produto. Defaults to None.
+            slug (str | None, optional): URL amigável. Defaults to None.
+
+        Raises:
+            RuntimeError: Erro ao acessar ou salvar o produto.
+        """
+        action, campos = self.obter_formulario(product_id)
+
+        if not _valor_vazio(meta_titulo):
+            _definir_campo(campos, f'product_description[{ID_IDIOMA}][meta_title]', meta_titulo)
+        if not _valor_vazio(meta_descricao):
+            _definir_campo(campos, f'product_description[{ID_IDIOMA}][meta_description]', meta_descricao)
+        if not _valor_vazio(palavra_chave):
+            _definir_campo(campos, f'product_description[{ID_IDIOMA}][meta_keyword]', palavra_chave)
+        if not _valor_vazio(slug):
+            _definir_campo(campos, f'product_seo_url[0][{ID_IDIOMA}]', slug)
+
+        if not _valor_vazio(produtos_relacionados):
+            ids = self._ids_relacionados(produtos_relacionados)
+            ja_relacionados = {valor for campo, valor in campos if campo == 'product_related[]'}
+            campos.extend(('product_related[]', i) for i in ids if i not in ja_relacionados)
+
+        if not _valor_vazio(compre_junto):
+            ids = self._ids_relacionados(compre_junto)
+            ja_relacionados = {valor for campo, valor in campos if campo == CAMPO_COMPRE_JUNTO}
+            campos.extend((CAMPO_COMPRE_JUNTO, i) for i in ids if i not in ja_relacionados)
+
+        if promocoes is not None and not all(_valor_vazio(preco) for preco in promocoes):
+            campos = _remover_campos(campos, 'product_special[')
+            # Grupos de clientes: 1 pessoa física, 2 pessoa jurídica e 3 revenda
+            for linha, (grupo, preco) in enumerate(zip(('1', '2', '3'), promocoes)):
+                if _valor_vazio(preco):
+                    continue
+                campos.extend([
+                    (f'product_special[{linha}][customer_group_id]', grupo),
+                    (f'product_special[{linha}][priority]', ''),
+                    (f'product_special[{linha}][price]', str(preco).replace(',', '.')),
+                    (f'product_special[{linha}][date_start]', ''),
+                    (f'product_special[{linha}][date_end]', ''),
+                ])
+
+        try:
+            resposta = self.session.post(action, data=campos, timeout=self.timeout)
+            resposta.raise_for_status()
+        except requests.RequestException as e:
+            raise RuntimeError(f"Erro ao salvar o produto {product_id} - {str(e)}") from e
+
+        if 'alert-danger' in resposta.text:
+            raise RuntimeError(f"A Opencart recusou as alterações do produto {product_id}, verifique os campos obrigatórios")
@@ -0,0 +1,177 @@
+# Importações
+import os
+import queue
+import operator
+import logging
+import logging.handlers
+import multiprocessing as mp
+from typing import Callable
+import pandas as pd
+from selenium import webdriver
+from . import navegadores
+from .esperas import HISTOGRAMAS
+from .desempenho import REGISTRO
+
+
+# Função calcular a quantidade de workers
+def calcular_workers(memoria_por_navegador_mb: int = 700, maximo: int | None = None) -> int:
+    """Calcula quantos navegadores podem rodar ao mesmo tempo conforme os núcleos e a memória da máquina.
+
+    Cada Chrome usa em média de 500 a 800 MB de memória, então a quantidade de workers é o menor valor
+    entre a quantidade de núcleos e a memória total dividida pelo consumo de cada navegador.
+
+    Args:
+        memoria_por_navegador_mb (int, optional): Memória estimada por navegador em MB. Defaults to 700.
+        maximo (int | None, optional): Limite máximo de workers. Defaults to None.
+
+    Returns:
+        int: Quantidade de workers, no mínimo 1.
+    """
+    workers = os.cpu_count() or 1
+
+    try:
+        memoria_total_mb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+        workers = min(workers, memoria_total_mb // memoria_por_navegador_mb)
+    except (ValueError, AttributeError, OSError):
+        pass  # Sistema sem sysconf (Windows), usa somente os núcleos
+
+    if maximo is not None:
+        workers = min(workers, maximo)
+
+    return max(1, int(workers))
+
+
+# Função dividir a planilha
+def dividir_planilha(df: pd.DataFrame | list, partes: int) -> list[pd.DataFrame | list]:
+    """Divide a planilha em partes intercaladas (linha 0 na parte 0, linha 1 na parte 1...),
+    para que todas as partes tenham um tamanho parecido.
+
+    Args:
+        df (pd.DataFrame | list): Planilha ou registros (`planilhas.criar_registros()`) que serão divididos.
+        partes (int): Quantidade de partes.
+
+    Returns:
+        list[pd.DataFrame | list]: Lista com as partes não vazias.
+    """
+    if isinstance(df, pd.DataFrame):
+        return [df.iloc[i::partes] for i in range(partes) if not df.iloc[i::partes].empty]
+    return [df[i::partes] for i in range(partes) if df[i::partes]]
+
+
+# Função executada por cada worker
+def _worker(numero: int,
+            registros: list[dict],
+            fila: mp.Queue,
+            evento_login,
+            login: Callable,
+            processar: Callable,
+            criar_driver: Callable[[], webdriver.Chrome],
+            chave: Callable):
+    """Processo de cada worker: abre o próprio navegador, faz login uma vez e processa a sua parte da planilha.
+
+    Os logs e os status são enviados para o coordenador pela `fila`, que é o único que grava em disco.
+    """
+    # Enviando todos os logs para o coordenador
+    raiz = logging.getLogger()
+    raiz.handlers = [logging.handlers.QueueHandler(fila)]
+    raiz.setLevel(logging.INFO)
+
+    def confirmar(mensagem: str = ''):
+        # O coordenador é quem pede o ENTER ao usuário, um worker por vez
+        fila.put(('login', numero, mensagem))
+        evento_login.wait()
+        evento_login.clear()
+
+    driver = None
+    try:
+        driver = criar_driver()
+        login(driver, confirmar)
+        for registro in registros:
+            processar(driver, registro)
+            fila.put(('processado', numero, chave(registro)))
+    except Exception as e:
+        logging.error(f"Erro no worker {numero} - {e}", extra={"sku": ""})
+    finally:
+        if driver is not None:
+            driver.quit()
+        navegadores.CONTADOR.resumo()  # O atexit não roda nos processos dos workers
+        HISTOGRAMAS.salvar()
+        REGISTRO.gravar()
+        fila.put(('fim', numero, None))
+
+
+# Função coordenador
+def executar_em_paralelo(df: pd.DataFrame | list,
+                         processar: Callable,
+                         login: Callable,
+                         ao_processar: Callable[[str], object],
+                         workers: int | None = None,
+                         criar_driver: Callable[[], webdriver.Chrome] = navegadores.criar_navegador,
+                         chave: Callable = operator.itemgetter('SKU')):
+    """Divide a planilha entre vários processos, cada um com o seu navegador, e coordena os status.
+
+    Cada worker faz login uma única vez e chama `processar(driver, registro)` para cada linha da sua parte.
+    O coordenador (processo atual) recebe os logs e os produtos processados pela fila, então o arquivo
+    de log, o índice de erros e a planilha continuam sendo gravados por um único processo.
+
+    OBS: `processar` e `login` precisam ser funções definidas no nível do módulo, e o script deve usar
+    `if __name__ == "__main__":`, pois no Windows cada worker importa o script novamente.
+
+    Args:
+        df (pd.DataFrame | list): Linhas da planilha ou registros (`planilhas.criar_registros()`) que serão processados.
+        Os registros precisam ser definidos no nível do módulo (`NamedTuple`) para serem enviados aos workers.
+        processar (Callable): Função `processar(driver, registro)` executada para cada linha.
+        login (Callable): Função `login(driver, confirmar)`, onde `confirmar` substitui o `input()`.
+        ao_processar (Callable[[str], object]): Chamada no coordenador com a chave de cada produto processado.
+        workers (int | None, optional): Quantidade de workers, se None usa `calcular_workers()`. Defaults to None.
+        criar_driver (Callable[[], webdriver.Chrome], optional): Cria o navegador de cada worker. Defaults to navegadores.criar_navegador.
+        chave (Callable, optional): Retorna a chave do registro enviada ao `ao_processar`, por exemplo
+        `operator.attrgetter('linha')` para registros. Defaults to operator.itemgetter('SKU').
+    """
+    workers = workers or calcular_workers()
+    partes = dividir_planilha(df, workers)
+    if not partes:
+        print("Nenhum produto para processar.")
+        return
+
+    print(f"INICIANDO {len(partes)} WORKERS")
+    fila = mp.Queue()
+    eventos = [mp.Event() for _ in partes]
+    processos = [
+        mp.Process(target=_worker,
+                   args=(i, parte.to_dict('records') if isinstance(parte, pd.DataFrame) else parte,
+                         fila, eventos[i], login, processar, criar_driver, chave),
+                   daemon=True)
+        for i, parte in enumerate(partes)
+    ]
+    for processo in processos:
+        processo.start()
+
+    ativos = len(processos)
+    try:
+        while ativos > 0:
+            try:
+                mensagem = fila.get(timeout=5)
+            except queue.Empty:
+                # Se todos os processos morreram sem avisar, encerra a coordenação
+                if not any(processo.is_alive() for processo in processos):
+                    break
+                continue
+
+            if isinstance(mensagem, logging.LogRecord):
+                logging.getLogger(mensagem.name).handle(mensagem)
+                continue
+
+            tipo, numero, valor = mensagem
+            if tipo == 'login':
+                input(f"[WORKER {numero}] {valor or 'Pressione ENTER assim que finalizar: '}")
+                eventos[numero].set()
+            elif tipo == 'processado':
+                ao_processar(valor)
+            elif tipo == 'fim':
+                ativos -= 1
+    finally:
+        for processo in processos:
+            processo.join(timeout=10)
+            if processo.is_alive():
+                processo.terminate()
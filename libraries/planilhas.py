@@ -1,7 +1,18 @@
 # Importações
 import os
+import glob
+import json
+import time
+import atexit
+import hashlib
+import logging
+from typing import Iterator, NamedTuple
+import numpy as np
 import pandas as pd
 
+PASTA_CACHE_PLANILHAS = 'cache_planilhas'
+VERSAO_CACHE = 2  # Aumente quando mudar o tratamento dos lotes, para descartar os caches antigos
+
 # Função criar tabela de log - FUNÇÃO OBSOLETA
 def criar_df_log() -> pd.DataFrame:
     """FUNÇÃO OBSOLETA. Cria uma dataframe do pandas para armazernar os erros durante o programa
@@ -99,3 +110,499 @@ def atualizar_status_log(df: pd.DataFrame,
         df.loc[df['SKU'] == sku, column_name] = 'FEITO'
 
     return df
+
+
+# Índice de erros em memória
+class IndiceErrosHandler(logging.Handler):
+    """Handler do `logging` que guarda em memória os SKUs que deram erro, por coluna de status.
+
+    Cada registro de nível `ERROR` ou superior que tenha o campo `sku` no `extra` é indexado
+    em um `set`, permitindo saber em tempo constante se um SKU falhou, sem reler o arquivo de log.\n
+    Para separar os erros por plataforma, informe a coluna no `extra` do log, por exemplo:
+    `logging.error(msg, extra={'sku': sku, 'coluna': 'Tiny'})`. Registros sem coluna valem para todas.
+
+    Args:
+        path_log (str, optional): Caminho do arquivo de log já existente, lido uma única vez
+        para que execuções retomadas enxerguem os erros anteriores. Defaults to None.
+        separador (str, optional): Separador dos campos usado no `format` do log. Defaults to ','.
+    """
+    def __init__(self, path_log: str | None = None, separador: str = ','):
+        super().__init__(level=logging.ERROR)
+        self.separador = separador
+        self.erros: dict[str | None, set[str]] = {None: set()}
+        if path_log:
+            self.carregar_log(path_log)
+
+    def carregar_log(self, path_log: str):
+        """Lê o arquivo de log uma única vez e indexa os SKUs com erro.
+
+        As linhas devem seguir o formato `asctime, levelname, message, sku, funcName, lineno`
+        usado nos scripts. Como o arquivo não guarda a coluna, esses erros valem para todas as colunas.
+
+        Args:
+            path_log (str): Caminho do arquivo de log (CSV ou LOG).
+        """
+        if not os.path.exists(path_log) or os.path.getsize(path_log) == 0:
+            return
+
+        with open(path_log, 'r', encoding="utf-8", errors="replace") as log_file:
+            for linha in log_file:
+                campos = linha.rstrip('\r\n').split(self.separador)
+                # A mensagem pode conter o separador, por isso o SKU é lido a partir do final
+                if len(campos) < 6 or campos[1].strip() not in ('ERROR', 'CRITICAL'):
+                    continue
+                sku = campos[-3].strip()
+                if sku:
+                    self.erros[None].add(sku)
+
+    def emit(self, record: logging.LogRecord):
+        sku = str(getattr(record, 'sku', '') or '').strip()
+        if sku:
+            coluna = getattr(record, 'coluna', None)
+            self.erros.setdefault(coluna, set()).add(sku)
+
+    def contem(self, sku: str, column_name: str | None = None) -> bool:
+        """Verifica se o SKU teve algum erro registrado.
+
+        Args:
+            sku (str): SKU do produto.
+            column_name (str | None, optional): Coluna de status (plataforma). Defaults to None.
+
+        Returns:
+            bool: `True` se o SKU teve erro na coluna informada ou em um erro sem coluna.
+        """
+        sku = str(sku).strip()
+        return sku in self.erros[None] or sku in self.erros.get(column_name, ())
+
+
+def registrar_indice_erros(path_log: str | None = None, separador: str = ',') -> IndiceErrosHandler:
+    """Cria o `IndiceErrosHandler` e o adiciona ao logger principal.
+
+    Deve ser chamada depois do `logging.basicConfig()`, pois o `basicConfig` não faz nada
+    se o logger principal já tiver algum handler.
+
+    Args:
+        path_log (str | None, optional): Caminho do arquivo de log existente. Defaults to None.
+        separador (str, optional): Separador dos campos usado no `format` do log. Defaults to ','.
+
+    Returns:
+        IndiceErrosHandler: Índice de erros já registrado no logging.
+    """
+    indice = IndiceErrosHandler(path_log, separador)
+    logging.getLogger().addHandler(indice)
+    return indice
+
+
+def atualizar_status(df: pd.DataFrame,
+                     indice: IndiceErrosHandler,
+                     sku: str,
+                     column_name: str = "status",
+                     diario: "DiarioStatus | None" = None,
+                     linha: int | None = None) -> pd.DataFrame:
+    """Atualiza o dataframe base para saber se a `ação desejada` foi feita ou não,
+    consultando o índice de erros em memória ao invés de reler o arquivo de log.
+
+    Args:
+        df (pd.DataFrame): Dataframe que tenha uma coluna do tipo `str` para atualizar o status.
+        indice (IndiceErrosHandler): Índice de erros criado com `registrar_indice_erros()`.
+        sku (str): SKU do produto que terá o status mudado.
+        column_name (str): Nome da coluna que terá a verificação do status. Defaults to "status"
+        diario (DiarioStatus | None, optional): Diário de status, para gravar o status em disco
+        sem reescrever a planilha inteira. Defaults to None.
+        linha (int | None, optional): Posição da linha do produto (`linha` de `criar_registros()`),
+        evita procurar o SKU na planilha. Defaults to None.
+
+    Returns:
+        pd.DataFrame: Dataframe com o status atualizado.
+    """
+    status = 'ERRO' if indice.contem(sku, column_name) else 'FEITO'
+    if diario is not None:
+        diario.registrar(sku, column_name, status, linha)
+    elif linha is not None:
+        df.loc[df.index[linha], column_name] = status
+    else:
+        df.loc[df['SKU'] == sku, column_name] = status
+
+    return df
+
+
+# Diário de status
+class DiarioStatus:
+    """Diário (journal) de status que evita reescrever a planilha inteira a cada produto.
+
+    Cada status é gravado como uma linha pequena (JSON) no final do arquivo de diário, e a
+    planilha `.xlsx` só é regravada (compactada) a cada `a_cada_linhas` registros, a cada
+    `a_cada_segundos` segundos e ao final do programa.\n
+    Se o programa cair antes da compactação, o diário é reaplicado na próxima execução,
+    então nenhum status é perdido.
+
+    Args:
+        df (pd.DataFrame): Dataframe lido da planilha, com a coluna `SKU`.
+        path_planilha (str): Caminho da planilha `.xlsx` que recebe os status.
+        path_diario (str | None, optional): Caminho do diário. Defaults to `<path_planilha>.diario`.
+        a_cada_linhas (int, optional): Quantidade de registros entre as compactações. Defaults to 200.
+        a_cada_segundos (float, optional): Tempo máximo, em segundos, entre as compactações. Defaults to 120.
+        coluna_chave (str, optional): Coluna que identifica o produto na planilha. Defaults to 'SKU'.
+    """
+    def __init__(self,
+                 df: pd.DataFrame,
+                 path_planilha: str,
+                 path_diario: str | None = None,
+                 a_cada_linhas: int = 200,
+                 a_cada_segundos: float = 120,
+                 coluna_chave: str = 'SKU'):
+        self.df = df
+        self.path_planilha = path_planilha
+        self.path_diario = path_diario or f'{path_planilha}.diario'
+        self.a_cada_linhas = a_cada_linhas
+        self.a_cada_segundos = a_cada_segundos
+        self.coluna_chave = coluna_chave
+        self.pendentes = 0
+        self.ultima_compactacao = time.monotonic()
+        self.posicoes: dict[str, list[int]] | None = None  # Linhas de cada produto, criado no primeiro uso
+
+        # Reaplicando o que ficou no diário de uma execução interrompida
+        if self.reaplicar() > 0:
+            self.compactar()
+
+        self.arquivo = open(self.path_diario, 'a', encoding='utf-8')
+        atexit.register(self.fechar)
+
+    def reaplicar(self) -> int:
+        """Reaplica no dataframe os status gravados no diário.
+
+        Returns:
+            int: Quantidade de registros reaplicados.
+        """
+        if not os.path.exists(self.path_diario):
+            return 0
+
+        total = 0
+        with open(self.path_diario, 'r', encoding='utf-8') as diario:
+            for linha in diario:
+                try:
+                    registro = json.loads(linha)
+                except json.JSONDecodeError:
+                    continue  # Linha incompleta, gravada no momento da queda
+                self._gravar(self._linhas(registro['sku']), registro['coluna'], registro['status'])
+                total += 1
+
+        return total
+
+    def _linhas(self, sku: str) -> list[int]:
+        """Posições das linhas do produto, pelo índice criado uma única vez."""
+        if self.posicoes is None:
+            self.posicoes = {}
+            for posicao, chave in enumerate(self.df[self.coluna_chave].tolist()):
+                self.posicoes.setdefault(str(chave), []).append(posicao)
+        return self.posicoes.get(str(sku), [])
+
+    def _gravar(self, linhas: list[int], coluna: str, status: str):
+        """Grava o status direto nas posições das linhas, sem percorrer a coluna de chave."""
+        if coluna not in self.df.columns:
+            self.df[coluna] = pd.Series(np.nan, index=self.df.index, dtype=object)
+        elif not pd.api.types.is_string_dtype(self.df[coluna]):
+            self.df[coluna] = self.df[coluna].astype(object)  # Coluna vazia lida como número
+        posicao_coluna = self.df.columns.get_loc(coluna)
+        for linha in linhas:
+            self.df.iat[linha, posicao_coluna] = status
+
+    def registrar(self, sku: str, coluna: str, status: str, linha: int | None = None):
+        """Atualiza o status no dataframe e grava o registro no final do diário.
+
+        Args:
+            sku (str): SKU do produto (valor da `coluna_chave`).
+            coluna (str): Coluna de status (plataforma).
+            status (str): Novo status, por exemplo `FEITO` ou `ERRO`.
+            linha (int | None, optional): Posição da linha do produto (`linha` de `criar_registros()`).
+            Se não informada, todas as linhas do SKU são atualizadas. Defaults to None.
+        """
+        self._gravar(self._linhas(sku) if linha is None else [linha], coluna, status)
+
+        registro = {'sku': str(sku), 'coluna': coluna, 'status': status}
+        self.arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        self.arquivo.flush()
+        self.pendentes += 1
+
+        if (self.pendentes >= self.a_cada_linhas
+                or time.monotonic() - self.ultima_compactacao >= self.a_cada_segundos):
+            self.compactar()
+
+    def compactar(self):
+        """Grava o dataframe na planilha `.xlsx` e esvazia o diário. A planilha é gravada em um arquivo
+        temporário e só então substitui a original, assim uma queda no meio da gravação não corrompe a planilha."""
+        raiz, extensao = os.path.splitext(self.path_planilha)
+        temporario = f'{raiz}.{os.getpid()}.tmp{extensao}'
+        try:
+            self.df.to_excel(temporario, index=False)
+            os.replace(temporario, self.path_planilha)
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+        # Planilha lida por `ler_planilha()`: o cache passa a ser o da planilha regravada
+        if 'leitura' in self.df.attrs:
+            salvar_cache_planilha(self.path_planilha, self.df, **self.df.attrs['leitura'])
+
+        # Só esvazia o diário depois que a planilha foi gravada
+        if getattr(self, 'arquivo', None) is not None and not self.arquivo.closed:
+            self.arquivo.truncate(0)
+            self.arquivo.seek(0)
+        else:
+            open(self.path_diario, 'w', encoding='utf-8').close()
+
+        self.pendentes = 0
+        self.ultima_compactacao = time.monotonic()
+
+    def fechar(self):
+        """Compacta os registros pendentes e fecha o diário. Chamada automaticamente ao final do programa."""
+        if self.arquivo.closed:
+            return
+        if self.pendentes > 0:
+            self.compactar()
+        self.arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+
+# Função hash da planilha
+def _hash_arquivo(caminho: str, pasta_cache: str) -> str:
+    """Retorna o hash do conteúdo do arquivo. O hash só é recalculado quando a data de modificação
+    ou o tamanho do arquivo mudam, os valores ficam em `indice.json` na pasta do cache."""
+    caminho_indice = os.path.join(pasta_cache, 'indice.json')
+    try:
+        with open(caminho_indice, 'r', encoding='utf-8') as arquivo:
+            indice = json.load(arquivo)
+    except (OSError, json.JSONDecodeError):
+        indice = {}
+
+    estado = os.stat(caminho)
+    chave = os.path.abspath(caminho)
+    registro = indice.get(chave)
+    if registro and registro['mtime'] == estado.st_mtime and registro['tamanho'] == estado.st_size:
+        return registro['hash']
+
+    sha1 = hashlib.sha1()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(1024 * 1024), b''):
+            sha1.update(bloco)
+    indice[chave] = {'mtime': estado.st_mtime, 'tamanho': estado.st_size, 'hash': sha1.hexdigest()}
+
+    os.makedirs(pasta_cache, exist_ok=True)
+    temporario = f'{caminho_indice}.{os.getpid()}.tmp'
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump(indice, arquivo)
+    os.replace(temporario, caminho_indice)
+    return indice[chave]['hash']
+
+
+# Função caminho do cache da planilha
+def _caminho_cache(caminho: str, tipos, padroes: dict | None, pasta_cache: str) -> tuple[str, str]:
+    """Retorna o arquivo de cache da planilha para os tipos informados e o padrão dos caches antigos."""
+    leitura = json.dumps({'tipos': tipos, 'padroes': padroes, 'versao': VERSAO_CACHE}, default=str, sort_keys=True)
+    hash_leitura = hashlib.sha1(leitura.encode('utf-8')).hexdigest()[:8]
+    prefixo = os.path.join(pasta_cache, f'{os.path.basename(caminho)}.{hash_leitura}')
+    return f'{prefixo}.{_hash_arquivo(caminho, pasta_cache)[:16]}.pkl', f'{glob.escape(prefixo)}.*.pkl'
+
+
+# Função salvar cache da planilha
+def salvar_cache_planilha(caminho: str,
+                          df: pd.DataFrame,
+                          tipos=None,
+                          padroes: dict | None = None,
+                          pasta_cache: str = PASTA_CACHE_PLANILHAS):
+    """Salva o dataframe já tratado como cache da planilha, substituindo os caches antigos dela.
+
+    Args:
+        caminho (str): Caminho da planilha
+        df (pd.DataFrame): Dataframe tratado com os `tipos` e `padroes`
+        tipos (optional): Tipos usados na leitura. Defaults to None.
+        padroes (dict | None, optional): Colunas padrão usadas na leitura. Defaults to None.
+        pasta_cache (str, optional): Pasta dos caches. Defaults to 'cache_planilhas'.
+    """
+    arquivo_cache, antigos = _caminho_cache(caminho, tipos, padroes, pasta_cache)
+    for antigo in glob.glob(antigos):
+        os.remove(antigo)
+    temporario = f'{arquivo_cache}.{os.getpid()}.tmp'
+    df.to_pickle(temporario)
+    os.replace(temporario, arquivo_cache)
+
+
+# Função ler lotes do arquivo
+def _ler_lotes_arquivo(caminho: str, tamanho_lote: int) -> Iterator[pd.DataFrame]:
+    """Lê o arquivo em lotes sem carregar tudo na memória: `.xlsx` pelo openpyxl em modo somente
+    leitura, `.csv` em pedaços e `.parquet` por grupos de linhas."""
+    extensao = os.path.splitext(caminho)[1].lower()
+
+    if extensao == '.csv':
+        yield from pd.read_csv(caminho, chunksize=tamanho_lote)
+        return
+
+    if extensao == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Instale o pyarrow para ler planilhas Parquet: pip install pyarrow") from e
+        for lote in pq.ParquetFile(caminho).iter_batches(batch_size=tamanho_lote):
+            yield lote.to_pandas()
+        return
+
+    from openpyxl import load_workbook
+    livro = load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        linhas = livro.worksheets[0].iter_rows(values_only=True)
+        cabecalho = next(linhas, None)
+        if cabecalho is None:
+            return
+        colunas = [f'Unnamed: {i}' if nome is None else nome for i, nome in enumerate(cabecalho)]
+
+        lote = []
+        vazias = []
+        for linha in linhas:
+            if all(valor is None for valor in linha):
+                vazias.append(linha)
+                continue
+            # Linhas vazias no meio da planilha são mantidas e as do final descartadas, igual ao read_excel
+            lote.extend(vazias)
+            vazias = []
+            lote.append(linha)
+            if len(lote) >= tamanho_lote:
+                yield pd.DataFrame(lote, columns=colunas)
+                lote = []
+        if lote:
+            yield pd.DataFrame(lote, columns=colunas)
+    finally:
+        livro.close()
+
+
+# Função tipo de texto
+def _tipo_texto(tipo) -> bool:
+    """Retorna se o tipo informado é de texto (`str`, `'string'`, `object`)."""
+    try:
+        dtype = pd.api.types.pandas_dtype(tipo)
+    except TypeError:
+        return False
+    return isinstance(dtype, pd.StringDtype) or dtype.kind in 'OU'
+
+
+# Função converter tipos do lote
+def _converter_tipos(lote: pd.DataFrame, tipos) -> pd.DataFrame:
+    """Converte o lote para os `tipos`. Cada lote tem os tipos deduzidos só das suas linhas (um lote
+    com células vazias lê os números como float), então nas colunas de texto os números inteiros são
+    convertidos sem o '.0', para a mesma coluna ter o mesmo texto em todos os lotes."""
+    if isinstance(tipos, dict):
+        colunas = [coluna for coluna, tipo in tipos.items() if coluna in lote.columns and _tipo_texto(tipo)]
+    else:
+        colunas = list(lote.columns) if _tipo_texto(tipos) else []
+    for coluna in colunas:
+        if pd.api.types.is_numeric_dtype(lote[coluna]) or lote[coluna].dtype == object:
+            lote[coluna] = pd.Series([int(valor) if isinstance(valor, float) and valor.is_integer() else valor
+                                      for valor in lote[coluna]], index=lote.index, dtype=object)
+    return lote.astype(tipos)
+
+
+# Função ler planilha em lotes
+def ler_planilha_em_lotes(caminho: str,
+                          tipos=None,
+                          padroes: dict | None = None,
+                          tamanho_lote: int = 5000,
+                          cache: bool = True,
+                          pasta_cache: str = PASTA_CACHE_PLANILHAS) -> Iterator[pd.DataFrame]:
+    """Lê a planilha (`.xlsx`, `.csv` ou `.parquet`) em lotes já tratados, para começar o trabalho sem
+    esperar a planilha inteira. Quando todos os lotes são lidos, a planilha tratada é salva em cache
+    e as próximas leituras do mesmo arquivo (mesmo conteúdo) vêm do cache.
+
+    Args:
+        caminho (str): Caminho da planilha
+        tipos (optional): Tipos das colunas, aceita o mesmo que `DataFrame.astype()`. Defaults to None.
+        padroes (dict | None, optional): Valor das colunas que não existem na planilha,
+        por exemplo `{'status': '-'}`. Defaults to None.
+        tamanho_lote (int, optional): Quantidade de linhas de cada lote. Defaults to 5000.
+        cache (bool, optional): Usa e salva o cache da planilha tratada. Defaults to True.
+        pasta_cache (str, optional): Pasta dos caches. Defaults to 'cache_planilhas'.
+
+    Yields:
+        Iterator[pd.DataFrame]: Lotes da planilha, com o índice das linhas da planilha inteira
+    """
+    if cache:
+        arquivo_cache, _ = _caminho_cache(caminho, tipos, padroes, pasta_cache)
+        if os.path.exists(arquivo_cache):
+            df = pd.read_pickle(arquivo_cache)
+            for inicio in range(0, len(df), tamanho_lote):
+                yield df.iloc[inicio:inicio + tamanho_lote]
+            return
+
+    lotes = []
+    inicio = 0
+    for lote in _ler_lotes_arquivo(caminho, tamanho_lote):
+        lote.index = range(inicio, inicio + len(lote))
+        inicio += len(lote)
+        lote = lote.where(lote.notna(), np.nan)  # None do openpyxl como NaN, igual ao read_excel
+        for coluna, valor in (padroes or {}).items():
+            if coluna not in lote.columns:
+                lote[coluna] = valor
+        if tipos is not None:
+            lote = _converter_tipos(lote, tipos)
+        if cache:
+            lotes.append(lote)
+        yield lote
+
+    if cache and lotes:
+        salvar_cache_planilha(caminho, pd.concat(lotes), tipos, padroes, pasta_cache)
+
+
+# Função ler planilha
+def ler_planilha(caminho: str,
+                 tipos=None,
+                 padroes: dict | None = None,
+                 cache: bool = True,
+                 pasta_cache: str = PASTA_CACHE_PLANILHAS) -> pd.DataFrame:
+    """Lê a planilha inteira já tratada, pelo cache quando o arquivo não mudou (`ler_planilha_em_lotes()`).
+    O `DiarioStatus` atualiza o cache sempre que regrava a planilha.
+
+    Só retorna depois de ler todos os lotes: sem cache, o trabalho começa apenas depois da leitura do arquivo
+    inteiro. Use `ler_planilha_em_lotes()` quando os produtos podem ser processados lote a lote.
+
+    Args:
+        caminho (str): Caminho da planilha
+        tipos (optional): Tipos das colunas, aceita o mesmo que `DataFrame.astype()`. Defaults to None.
+        padroes (dict | None, optional): Valor das colunas que não existem na planilha. Defaults to None.
+        cache (bool, optional): Usa e salva o cache da planilha tratada. Defaults to True.
+        pasta_cache (str, optional): Pasta dos caches. Defaults to 'cache_planilhas'.
+
+    Returns:
+        pd.DataFrame: Planilha tratada
+    """
+    lotes = list(ler_planilha_em_lotes(caminho, tipos, padroes, cache=cache, pasta_cache=pasta_cache))
+    df = pd.concat(lotes) if lotes else pd.DataFrame()
+    if cache:
+        df.attrs['leitura'] = {'tipos': tipos, 'padroes': padroes, 'pasta_cache': pasta_cache}
+    return df
+
+
+# Função criar registros
+def criar_registros(df: pd.DataFrame, tipo: type[NamedTuple], colunas: dict[str, str], **extras: list) -> list:
+    """Converte a planilha, uma única vez, em registros compactos (`NamedTuple`), mais leves que as linhas
+    do `iterrows()`. O primeiro campo do registro é a `linha`, posição da linha na planilha, usada para
+    gravar o status direto na linha (`DiarioStatus.registrar(..., linha=...)`).
+
+    Args:
+        df (pd.DataFrame): Planilha lida por `ler_planilha()` (o índice é a posição da linha)
+        tipo (type[NamedTuple]): Tipo do registro, com os campos `linha`, os campos de `colunas` e os de `extras`, nessa ordem
+        colunas (dict[str, str]): Coluna da planilha de cada campo do registro
+        **extras (list): Valores já calculados de outros campos, um por linha
+
+    Raises:
+        ValueError: Os campos do tipo não correspondem às colunas informadas
+
+    Returns:
+        list: Registros da planilha
+    """
+    campos = ('linha', *colunas, *extras)
+    if tipo._fields != campos:
+        raise ValueError(f"Campos do registro {tipo.__name__} não correspondem às colunas: {tipo._fields} != {campos}")
+    valores = [df[coluna].tolist() for coluna in colunas.values()] + list(extras.values())
+    return [tipo._make(registro) for registro in zip(df.index.tolist(), *valores)]
@@ -0,0 +1,152 @@
+# Importações
+import os
+import json
+from urllib.parse import urlsplit
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from .esperas import EsperaAdaptativa
+
+PASTA_SESSOES = 'sessoes'
+
+
+# Função caminho dos cookies
+def caminho_cookies(plataforma: str, pasta: str = PASTA_SESSOES) -> str:
+    """Retorna o caminho do arquivo de cookies salvo da plataforma.
+
+    Args:
+        plataforma (str): Nome da plataforma (tiny, mercado_livre, magalu...)
+        pasta (str, optional): Pasta onde as sessões ficam salvas. Defaults to 'sessoes'.
+
+    Returns:
+        str: Caminho do arquivo `.json` com os cookies
+    """
+    return os.path.join(pasta, f'{plataforma}_cookies.json')
+
+
+# Função salvar cookies
+def salvar_cookies(driver: webdriver.Chrome, plataforma: str, pasta: str = PASTA_SESSOES):
+    """Salva os cookies da aba atual, junto com o endereço do domínio deles, para restaurar a
+    sessão nas próximas execuções. O arquivo contém a sessão ativa, por isso a pasta `sessoes`
+    fica fora do git (`.gitignore`).
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        plataforma (str): Nome da plataforma
+        pasta (str, optional): Pasta onde as sessões ficam salvas. Defaults to 'sessoes'.
+    """
+    os.makedirs(pasta, exist_ok=True)
+    caminho = caminho_cookies(plataforma, pasta)
+    endereco = urlsplit(driver.current_url)
+
+    # Grava em um arquivo temporário e substitui, para não corromper com workers em paralelo
+    temporario = f'{caminho}.{os.getpid()}.tmp'
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump({'url': f'{endereco.scheme}://{endereco.netloc}/', 'cookies': driver.get_cookies()}, arquivo)
+    os.replace(temporario, caminho)
+
+
+# Função carregar cookies
+def carregar_cookies(driver: webdriver.Chrome, plataforma: str, url: str, pasta: str = PASTA_SESSOES) -> bool:
+    """Carrega os cookies salvos da plataforma no navegador.
+
+    O Selenium só aceita cookies do domínio que está aberto, por isso o domínio onde os cookies
+    foram salvos é acessado antes (o login do Mercado Livre, por exemplo, termina em `.com.br`).
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        plataforma (str): Nome da plataforma
+        url (str): URL da plataforma, usada quando o arquivo não tem o domínio dos cookies
+        pasta (str, optional): Pasta onde as sessões ficam salvas. Defaults to 'sessoes'.
+
+    Returns:
+        bool: `True` se algum cookie foi carregado, `False` caso contrário
+    """
+    caminho = caminho_cookies(plataforma, pasta)
+    if not os.path.exists(caminho):
+        return False
+
+    try:
+        with open(caminho, 'r', encoding='utf-8') as arquivo:
+            salvos = json.load(arquivo)
+    except (OSError, json.JSONDecodeError):
+        return False
+    if isinstance(salvos, list):  # Arquivo antigo, somente com os cookies
+        salvos = {'url': url, 'cookies': salvos}
+    cookies = salvos.get('cookies') or []
+    if not cookies:
+        return False
+
+    driver.get(salvos.get('url') or url)
+    carregados = 0
+    for cookie in cookies:
+        if 'expiry' in cookie:
+            cookie['expiry'] = int(cookie['expiry'])
+        try:
+            driver.add_cookie(cookie)
+            carregados += 1
+        except WebDriverException:
+            continue  # Cookie de outro subdomínio ou já expirado
+
+    return carregados > 0
+
+
+# Função verificar sessão
+def sessao_valida(driver: webdriver.Chrome,
+                  url: str,
+                  localizador: tuple[By, str],
+                  timeout: float = 5,
+                  plataforma: str = 'geral') -> bool:
+    """Acessa a URL e verifica se a sessão está ativa procurando o mesmo elemento
+    que as funções de login esperam após um login com sucesso.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        url (str): URL que será acessada para a verificação
+        localizador (tuple[By, str]): Localizador do elemento que só existe com o usuário logado
+        timeout (float, optional): Tempo máximo de espera em segundos. Defaults to 5.
+        plataforma (str, optional): Plataforma usada na espera adaptativa. Defaults to 'geral'.
+
+    Returns:
+        bool: `True` se a sessão ainda é válida, `False` caso contrário
+    """
+    driver.get(url)
+    try:
+        EsperaAdaptativa(driver, timeout, plataforma).until(EC.presence_of_element_located(localizador))
+    except TimeoutException:
+        return False
+    return True
+
+
+# Função restaurar sessão
+def restaurar_sessao(driver: webdriver.Chrome,
+                     plataforma: str,
+                     url: str,
+                     localizador: tuple[By, str],
+                     pasta: str = PASTA_SESSOES,
+                     url_verificacao: str | None = None) -> bool:
+    """Tenta restaurar a sessão salva (cookies) da plataforma. Sem uma sessão salva, retorna
+    na hora, sem abrir a página nem esperar a verificação.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do navegador do Selenium
+        plataforma (str): Nome da plataforma
+        url (str): URL da plataforma usada para carregar os cookies e verificar a sessão
+        localizador (tuple[By, str]): Localizador do elemento que só existe com o usuário logado
+        pasta (str, optional): Pasta onde as sessões ficam salvas. Defaults to 'sessoes'.
+        url_verificacao (str | None, optional): URL usada na verificação, quando o domínio da sessão
+        é diferente do domínio da `url`. Defaults to None.
+
+    Returns:
+        bool: `True` se a sessão foi restaurada e está válida, `False` se for necessário fazer o login
+    """
+    if not carregar_cookies(driver, plataforma, url, pasta):
+        print(f"Nenhuma sessão salva - {plataforma.upper()}")
+        return False
+    if sessao_valida(driver, url_verificacao or url, localizador, plataforma=plataforma):
+        print(f"Sessão restaurada com sucesso - {plataforma.upper()}")
+        return True
+
+    print(f"Sessão expirada ou inexistente - {plataforma.upper()}")
+    return False
@@ -1,5 +1,7 @@
 # Importações
 import time
+import sys
+from typing import Callable, Iterator
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,6 +11,58 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
+from . import sessoes
+from .esperas import EsperaAdaptativa
+from . import dom
+from . import navegadores
+from . import desempenho
+
+# Elemento que só aparece com o usuário logado
+LOGIN_SUCESSO = (By.CLASS_NAME, "card-logo-empresa")
+
+# Exclusão em lote - VERIFIQUE O LOCALIZADOR DA PAGINAÇÃO ANTES DE UTILIZA-LO
+PAGINA_SEGUINTE = (By.CSS_SELECTOR, 'ul.pagination li:not(.disabled) a[rel="next"]')
+NAO_ENCONTRADO = dom.NAO_ENCONTRADO
+# Aviso da lista de produtos sem resultados - VERIFIQUE O LOCALIZADOR ANTES DE UTILIZA-LO
+LISTA_VAZIA = (By.XPATH, '//*[@id="tabelaListagem"]//*[contains(text(), "Nenhum")]')
+LINHA_PRODUTO = (By.CSS_SELECTOR, 'table#tabelaListagem tr[codigo]')
+# Listagem completa (catálogo): quantidade de itens por página e link que remove os filtros salvos da lista
+# VERIFIQUE OS LOCALIZADORES ANTES DE UTILIZA-LOS
+ITENS_POR_PAGINA = (By.CSS_SELECTOR, 'select[name="itensPorPagina"]')
+LIMPAR_FILTROS = (By.XPATH, '//a[contains(translate(text(), "LIMPAR", "limpar"), "limpar filtro")]')
+# Checkbox de seleção de cada linha da lista, usado para ler o estado - VERIFIQUE O LOCALIZADOR ANTES DE UTILIZA-LO
+CHECKBOX_LINHA = 'td:first-child input[type="checkbox"]'
+
+# Deixa marcadas somente as linhas dos SKUs informados. O clique no marcador alterna a seleção, então
+# só clica quando o estado atual (lido do checkbox) é diferente do desejado
+_JS_SELECIONAR_PRODUTOS = """
+const [skus, seletor] = [new Set(arguments[0]), arguments[1]];
+const [selecionados, marcados, sem_checkbox] = [[], [], []];
+document.querySelectorAll('table#tabelaListagem tr[codigo]').forEach(tr => {
+    const codigo = tr.getAttribute('codigo');
+    const checkbox = tr.querySelector(seletor);
+    const marcador = tr.querySelector('td:first-child span');
+    if (!checkbox || !marcador) {
+        sem_checkbox.push(codigo);
+        return;
+    }
+    const desejado = skus.has(codigo);
+    if (checkbox.checked !== desejado) marcador.click();
+    if (checkbox.checked) (desejado ? selecionados : marcados).push(codigo);
+});
+return [selecionados, marcados, sem_checkbox];
+"""
+
+# SKUs da página da lista, para o catálogo local - VERIFIQUE O ATRIBUTO DO SKU ANTES DE UTILIZA-LO
+_JS_LISTAR_PRODUTOS = """
+return Array.from(document.querySelectorAll('table#tabelaListagem tr[codigo]'), tr => tr.getAttribute('codigo'));
+"""
+
+# Colunas da tabela de listas de preço - VERIFIQUE OS NOMES DAS COLUNAS ANTES DE UTILIZA-LOS
+COLUNA_PRECO = 'preco'
+COLUNA_PRECO_PROMOCIONAL = 'precoPromocional'
+# IDs das listas de preço (`idListaPreco`) pelo nome, consultados uma vez por sessão
+_ids_listas_preco: dict[str, str] = {}
 
 # Funções auxiliares
 def clicar_editar_produtos(driver: webdriver.Chrome):
@@ -21,7 +75,7 @@ def clicar_editar_produtos(driver: webdriver.Chrome):
         RuntimeError: Erro ao clicar no botão editar produto
     """
     try:
-        WebDriverWait(driver, 10).until(EC.element_to_be_clickable(
+        EsperaAdaptativa(driver, 10, 'tiny').until(EC.element_to_be_clickable(
             (By.CLASS_NAME, 'btn-edicao-item'))).click()
     except Exception as e:
         raise RuntimeError(f"Erroa ao cliclar em editar o produto: {str(e)}") from e
@@ -37,7 +91,7 @@ def clicar_salvar_edicao_produtos(driver:webdriver.Chrome):
         RuntimeError: Erroa ao clicar em salvar as edições do produto
     """
     try:
-        WebDriverWait(driver, 10).until(EC.element_to_be_clickable(
+        EsperaAdaptativa(driver, 10, 'tiny').until(EC.element_to_be_clickable(
             (By.ID, 'botaoSalvar'))).click()
     except Exception as e:
         raise RuntimeError(f"Erro ao salvar as edições do produto: {str(e)}") from e
@@ -71,7 +125,7 @@ def encontrar_lista_precos(driver: webdriver.Chrome, lista_id: str) -> (WebEleme
         (WebElement | None): Retorna o elemento encontrado, se não None.
     """
     try:
-        return WebDriverWait(driver, 2).until(EC.presence_of_element_located(
+        return EsperaAdaptativa(driver, 2, 'tiny').until(EC.presence_of_element_located(
             (By.CSS_SELECTOR, f'table > tbody > tr > td > input[value="{lista_id}"]')))
     except Exception:
         return None # Se não econtrar, retona None
@@ -94,7 +148,7 @@ def configurar_lista_precos(driver: webdriver.Chrome, lista_id: str):
         lista_precos_elem = driver.find_element(By.ID, 'idListaPreco')
         lista_precos = Select(lista_precos_elem)
         lista_precos.select_by_value(f'{lista_id}')  # Seleciona a opção correta
-        WebDriverWait(driver, 5).until(EC.element_to_be_clickable(
+        EsperaAdaptativa(driver, 5, 'tiny').until(EC.element_to_be_clickable(
             (By.CSS_SELECTOR, 'button[onclick="adicionarProdutoListaPreco();"]'))).click()
         print("Lista de preços configurada com sucesso.")
     except Exception as e:
@@ -115,15 +169,11 @@ def atualizar_lista_preco(driver: webdriver.Chrome, price: str, lista_id: str, c
         RuntimeError: Erro ao atualizar o preço, verifique as colunas e o ID da lista.
     """
     try:
-        site_row = WebDriverWait(driver, 5).until(EC.visibility_of_element_located(
-            (By.XPATH, f'//input[@value="{lista_id}"]/ancestor::tr')))
-        preco_elem = site_row.find_element(By.XPATH, f'.//input[contains(@name, "[{colum_price}]")]')
-
-        # Obtém o valor atual e verifica se precisa ser atualizado
-        valor_mkp_elem = str(preco_elem.get_attribute('value')).replace('.', '').replace(',', '.')
+        # Lê o preço atual e só escreve se precisar ser atualizado (uma chamada ao navegador para cada)
+        campo = {'preco': (By.XPATH, f'//input[@value="{lista_id}"]/ancestor::tr//input[contains(@name, "[{colum_price}]")]')}
+        valor_mkp_elem = str(dom.aguardar_campos(driver, campo, 5, 'tiny')['preco']).replace('.', '').replace(',', '.')
         if valor_mkp_elem != str(price):
-            preco_elem.clear()
-            preco_elem.send_keys(Keys.BACK_SPACE * 4, str(price).replace('.', ','))
+            dom.escrever_campos(driver, campo, {'preco': str(price).replace('.', ',')}, comparar=_mesmo_preco)
             print(f"Preço antigo: {valor_mkp_elem}\nNovo preço: {price}")
         else:
             print("O preço já está atualizado.")
@@ -161,7 +211,7 @@ def login(driver: webdriver.Chrome, login_url='https://erp.tiny.com.br/login/',
         password (str, optional): Senha para fazer o acesso. Defaults to ''.
     """
     print('LOGANDO - TINY')
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'tiny')
 
     # Acessando a URL de login
     driver.get(login_url)
@@ -194,34 +244,45 @@ def login(driver: webdriver.Chrome, login_url='https://erp.tiny.com.br/login/',
 
 
 # Login manual - TINY
-def login_manual(driver: webdriver.Chrome, login_url='https://erp.tiny.com.br/login/'):
+def login_manual(driver: webdriver.Chrome, login_url='https://erp.tiny.com.br/login/', confirmar: Callable = input, sessao: bool = True):
     """Função de login manual no Tiny, devido à verificação em duas etapas.
 
+    Antes de pedir o login, tenta restaurar a sessão salva da última execução.
     Acessa a página de login e aguarda que o usuário finalize o processo manualmente. 
     Verifica se o login foi concluído com sucesso, baseado em elementos da página.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do Selenium
         login_url (str, optional): URL de acesso à página de login. Defaults to 'https://erp.tiny.com.br/login/'.
+        confirmar (Callable, optional): Função que aguarda o usuário finalizar o login. Defaults to input.
+        sessao (bool, optional): Restaura e salva a sessão (cookies) entre as execuções. Defaults to True.
     """
+    if sessao and sessoes.restaurar_sessao(driver, 'tiny', login_url, LOGIN_SUCESSO):
+        return
+
     driver.get(login_url)
     print("Aguardando você fazer o login...")
 
     while True:
-        input("Pressione ENTER assim que finalizar: ")
+        confirmar("Pressione ENTER assim que finalizar: ")
         try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "card-logo-empresa"))
+            EsperaAdaptativa(driver, 10, 'tiny').until(
+                EC.presence_of_element_located(LOGIN_SUCESSO)
             )
             print("Login detectado com sucesso!")
             break
         except TimeoutException:
             print("Login ainda não detectado. Tente novamente.")
 
+    if sessao:
+        sessoes.salvar_cookies(driver, 'tiny')
+
 
 # Função Pesquisar Produto - TINY
-def pesquisar_produto(driver: webdriver.Chrome, sku: str, product_url='https://erp.tiny.com.br/produtos#list') -> bool:
-    """Pesquisa o produto que será excluido no Tiny.
+def pesquisar_produto(driver: webdriver.Chrome, sku: str, product_url='https://erp.tiny.com.br/produtos#list') -> str:
+    """Pesquisa o produto que será excluido no Tiny. Retorna assim que a nova lista ou o aviso
+    de nenhum resultado aparece. Se a lista carregou sem a linha do SKU (a pesquisa também encontra
+    códigos parecidos), o produto não foi encontrado, sem esperar o timeout.
 
     Args:
         driver (webdriver.Chrome): Objeto de controle do Selenium
@@ -229,10 +290,10 @@ def pesquisar_produto(driver: webdriver.Chrome, sku: str, product_url='https://e
         product_url (str): URL para acessar a lista de produtos. Default to 'https://erp.tiny.com.br/produtos#list'
     
     Returns:
-        bool: `True` se o produto for encontrado, `False` caso contrario
+        str: `dom.ENCONTRADO`, `dom.NAO_ENCONTRADO` ou `dom.DESCONHECIDO` quando a lista não respondeu no tempo
     """
     print('PESQUISANDO O PRODUTO - TINY')
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'tiny')
     # Acessando a lista de produtos
     driver.get(product_url)
 
@@ -240,22 +301,20 @@ def pesquisar_produto(driver: webdriver.Chrome, sku: str, product_url='https://e
         # Clicando no campo de busca e pressionando ENTER
         busca = wait.until(EC.visibility_of_element_located(
             (By.ID, "pesquisa-mini")))
-        busca.clear()
-        busca.send_keys(sku, Keys.ENTER)
-        busca.send_keys(Keys.ENTER)
+        # A lista da pesquisa anterior (ou o aviso "Nenhum") é ignorada ao aguardar o novo resultado
+        resultado = _recarregar_lista(driver, lambda: (busca.clear(), busca.send_keys(sku, Keys.ENTER),
+                                                       busca.send_keys(Keys.ENTER)))
     except Exception as e:
-        raise f'Erro ao pesquisar o produto {sku}: {str(e)}'
+        raise RuntimeError(f'Erro ao pesquisar o produto {sku}: {str(e)}') from e
 
-    # Verificando se encontrou o produto
-    try:
-        wait.until(EC.presence_of_element_located(
-            (By.CSS_SELECTOR, f'table#tabelaListagem tr[codigo="{sku}"]')))
-        encontrado = True
-    except Exception:
-        print("Elemento não encontrado no TINY")
-        encontrado = False
+    # Verificando se a nova lista tem a linha do produto
+    if resultado == dom.ENCONTRADO and not driver.find_elements(
+            By.CSS_SELECTOR, f'table#tabelaListagem tr[codigo="{sku}"]:not([{dom.ATRIBUTO_ANTIGO}])'):
+        resultado = dom.NAO_ENCONTRADO
+    if resultado != dom.ENCONTRADO:
+        print(f"Elemento não encontrado no TINY ({resultado})")
 
-    return encontrado
+    return resultado
 
 
 # Função excluir produto - TINY
@@ -268,20 +327,45 @@ def excluir_produto(driver: webdriver.Chrome, sku: str, product_url='https://erp
         sku (str): SKU do produto que será excluido
         product_url (str, optional): URL para acessar a lista de produtos. Default to 'https://erp.tiny.com.br/produtos#list'
     """
-    if not pesquisar_produto(driver, sku, product_url):
+    if pesquisar_produto(driver, sku, product_url) != dom.ENCONTRADO:
         print(f"Produto com SKU {sku} não encontrado. A exclusão não será realizada.")
         raise ValueError(f"Produto com SKU {sku} não encontrado. A exclusão não será realizada.")
 
     print('EXCLUINDO O PRODUTO - TINY')
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'tiny')
 
     try:
         # Mudando o ZOOM para 75%
         driver.execute_script("document.body.style.zoom = '75%'")
-        # Seleciona o produto
+        # Seleciona somente o produto (desmarca os que ficaram marcados de uma exclusão anterior)
         wait.until(EC.element_to_be_clickable(
-            (By.XPATH, f'//*[@codigo="{sku}"]/td[1]/span'))).click()
+            (By.XPATH, f'//*[@codigo="{sku}"]/td[1]/span')))
+        if not selecionar_produtos_pagina(driver, {str(sku)}):
+            raise RuntimeError('O produto não foi selecionado')
+    except Exception as e:
+        limpar_selecao(driver)
+        raise RuntimeError(f'Erro ao excluir o produto {sku}: {str(e)}') from e
+
+    try:
+        excluir_selecionados(driver)
+    except RuntimeError:
+        limpar_selecao(driver)
+        raise
+
+
+# Função excluir selecionados - TINY
+def excluir_selecionados(driver: webdriver.Chrome):
+    """Exclui todos os produtos selecionados na lista pelo menu de ações em massa, com uma única confirmação.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
 
+    Raises:
+        RuntimeError: Erro ao excluir os produtos selecionados
+    """
+    wait = EsperaAdaptativa(driver, 10, 'tiny')
+
+    try:
         # Selecionando mais ações
         mais_acoes = wait.until(EC.element_to_be_clickable(
             (By.XPATH, '//div[@class="dropdown dropup dropdown-in featured-actions-menu"]//button[@class="btn btn-menu-acoes dropdown-toggle" and contains(., "Mais ações")]')))
@@ -305,7 +389,280 @@ def excluir_produto(driver: webdriver.Chrome, sku: str, product_url='https://erp
         wait.until(EC.element_to_be_clickable(
             (By.XPATH, '//button[@popup-action="confirm"]'))).click()
     except Exception as e:
-        raise RuntimeError(f'Erro ao excluir o produto {sku}: {str(e)}') from e
+        raise RuntimeError(f'Erro ao excluir os produtos selecionados: {str(e)}') from e
+
+
+# Função selecionar produtos da página - TINY
+def selecionar_produtos_pagina(driver: webdriver.Chrome, skus: set[str]) -> list[str]:
+    """Deixa marcados, de uma só vez, somente os produtos da página atual da lista cujo SKU está em
+    `skus`. As linhas que já estavam marcadas (de uma exclusão que falhou) são desmarcadas.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+        skus (set[str]): SKUs que devem ser selecionados, vazio para limpar a seleção
+
+    Raises:
+        RuntimeError: Uma linha continua marcada sem estar em `skus` ou o checkbox de um dos SKUs não foi encontrado
+
+    Returns:
+        list[str]: SKUs encontrados e selecionados na página
+    """
+    selecionados, marcados, sem_checkbox = driver.execute_script(_JS_SELECIONAR_PRODUTOS, list(skus), CHECKBOX_LINHA)
+    if marcados:
+        raise RuntimeError(f"Não foi possível desmarcar os produtos {', '.join(marcados)}")
+    sem_checkbox = [sku for sku in sem_checkbox if sku in skus]
+    if sem_checkbox:
+        raise RuntimeError(f"Checkbox de seleção não encontrado para os produtos {', '.join(sem_checkbox)}")
+    return selecionados
+
+
+# Função limpar seleção - TINY
+def limpar_selecao(driver: webdriver.Chrome):
+    """Desmarca todos os produtos da página atual da lista, sem lançar erro.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+    """
+    try:
+        selecionar_produtos_pagina(driver, set())
+    except Exception as e:
+        print(f'Não foi possível limpar a seleção da lista - {str(e)}')
+
+
+# Função aguardar exclusão - TINY
+def _aguardar_exclusao(driver: webdriver.Chrome, skus: list[str], timeout: float = 15) -> list[str]:
+    """Aguarda os produtos excluídos saírem da lista e retorna os que continuam nela."""
+    script = """
+        return arguments[0].filter(codigo =>
+            document.querySelector(`table#tabelaListagem tr[codigo="${CSS.escape(codigo)}"]`));
+    """
+    try:
+        EsperaAdaptativa(driver, timeout, 'tiny').until(lambda d: not d.execute_script(script, skus))
+        return []
+    except TimeoutException:
+        return driver.execute_script(script, skus)
+
+
+# Função excluir produtos em lote - TINY
+def excluir_produtos_lote(driver: webdriver.Chrome,
+                          skus: list[str],
+                          product_url: str = 'https://erp.tiny.com.br/produtos#list',
+                          pesquisa: str | None = None,
+                          max_paginas: int = 20) -> dict[str, str | None]:
+    """Exclui vários produtos com uma confirmação por página da lista, ao invés de uma pesquisa,
+    um carregamento e uma confirmação por produto.
+
+    Os SKUs são agrupados pelo prefixo (`dom.agrupar_por_prefixo()`, ou um único grupo com a `pesquisa`
+    informada) e, para cada grupo, a lista é filtrada pelo prefixo comum e as páginas são percorridas
+    marcando todos os SKUs do grupo encontrados. Os SKUs avulsos e os que não aparecerem nas páginas
+    percorridas são pesquisados individualmente. A seleção é limpa antes de cada lote e depois de cada erro, para que um
+    produto com erro nunca seja excluído junto com o lote seguinte.
+
+    VERIFIQUE O CÓDIGO DESSA FUNÇÃO ANTES DE UTILIZA-LA
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+        skus (list[str]): SKUs dos produtos que serão excluídos
+        product_url (str, optional): URL para acessar a lista de produtos. Default to 'https://erp.tiny.com.br/produtos#list'
+        pesquisa (str | None, optional): Texto usado para filtrar a lista, no lugar dos grupos por prefixo. Defaults to None.
+        max_paginas (int, optional): Quantidade máxima de páginas percorridas em cada grupo. Defaults to 20.
+
+    Returns:
+        dict[str, str | None]: Resultado de cada SKU: `None` se excluído, `NAO_ENCONTRADO` se não
+        existe no Tiny ou a mensagem de erro.
+    """
+    resultados: dict[str, str | None] = {}
+    for resultado in excluir_produtos_lote_por_sku(driver, skus, product_url, pesquisa, max_paginas):
+        resultados.update(resultado)
+    return resultados
+
+
+# Função excluir produtos em lote por SKU - TINY
+def excluir_produtos_lote_por_sku(driver: webdriver.Chrome,
+                                  skus: list[str],
+                                  product_url: str = 'https://erp.tiny.com.br/produtos#list',
+                                  pesquisa: str | None = None,
+                                  max_paginas: int = 20) -> Iterator[dict[str, str | None]]:
+    """Faz a mesma exclusão de `excluir_produtos_lote()`, enviando o resultado de cada SKU assim que
+    ele é conhecido, para que o status seja gravado durante a exclusão e um erro no meio não perca
+    os resultados anteriores.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+        skus (list[str]): SKUs dos produtos que serão excluídos
+        product_url (str, optional): URL para acessar a lista de produtos. Default to 'https://erp.tiny.com.br/produtos#list'
+        pesquisa (str | None, optional): Texto usado para filtrar a lista, no lugar dos grupos por prefixo. Defaults to None.
+        max_paginas (int, optional): Quantidade máxima de páginas percorridas em cada grupo. Defaults to 20.
+
+    Yields:
+        Iterator[dict[str, str | None]]: Resultado de um SKU, no formato de `excluir_produtos_lote()`
+    """
+    pendentes = {str(sku) for sku in skus}
+    if not pendentes:
+        return
+
+    print(f'EXCLUINDO {len(pendentes)} PRODUTOS EM LOTE - TINY')
+    if pesquisa is None:
+        grupos, _ = dom.agrupar_por_prefixo(pendentes)
+    else:
+        grupos = [(pesquisa, sorted(pendentes))] if len(pesquisa) >= 3 else []
+
+    # Uma pesquisa por grupo, excluindo os SKUs do grupo página a página
+    for prefixo, grupo in grupos:
+        try:
+            for resultado in _excluir_paginas(driver, prefixo, set(grupo), product_url, max_paginas):
+                pendentes.difference_update(resultado)
+                yield resultado
+        except Exception as e:
+            print(f'Erro ao excluir o grupo {prefixo}, os SKUs restantes serão pesquisados individualmente - {str(e)}')
+            limpar_selecao(driver)
+
+    # SKUs avulsos e fora das páginas percorridas: pesquisa e exclusão individual
+    for sku in sorted(pendentes):
+        try:
+            resultado = pesquisar_produto(driver, sku, product_url)
+            if resultado == dom.DESCONHECIDO:
+                yield {sku: f'Erro ao pesquisar o produto {sku}: a lista não respondeu a tempo'}
+                continue
+            if resultado == dom.NAO_ENCONTRADO:
+                yield {sku: NAO_ENCONTRADO}
+                continue
+            if not selecionar_produtos_pagina(driver, {sku}):
+                yield {sku: NAO_ENCONTRADO}
+                continue
+            excluir_selecionados(driver)
+            restantes = _aguardar_exclusao(driver, [sku])
+            yield {sku: f'Erro ao excluir o produto {sku}: O produto continua na lista após a exclusão' if restantes else None}
+            if restantes:
+                limpar_selecao(driver)
+        except Exception as e:
+            yield {sku: f'Erro ao excluir o produto {sku}: {str(e)}'}
+            limpar_selecao(driver)
+
+
+# Função excluir páginas - TINY
+def _excluir_paginas(driver: webdriver.Chrome,
+                     pesquisa: str,
+                     pendentes: set[str],
+                     product_url: str,
+                     max_paginas: int) -> Iterator[dict[str, str | None]]:
+    """Filtra a lista pela `pesquisa` e percorre as páginas excluindo, com uma confirmação por página,
+    os `pendentes` encontrados. Os SKUs que não aparecerem ficam para a pesquisa individual."""
+    wait = EsperaAdaptativa(driver, 10, 'tiny')
+    driver.get(product_url)
+    try:
+        busca = wait.until(EC.visibility_of_element_located((By.ID, "pesquisa-mini")))
+        resultado = _recarregar_lista(driver, lambda: (busca.clear(), busca.send_keys(pesquisa, Keys.ENTER)))
+    except TimeoutException:
+        return  # Lista indisponível, os SKUs vão para a pesquisa individual
+    if resultado != dom.ENCONTRADO:
+        return  # Nenhum produto com o prefixo ou lista indisponível
+
+    driver.execute_script("document.body.style.zoom = '75%'")
+    paginas = 0
+    while pendentes and paginas < max_paginas:
+        try:
+            selecionados = selecionar_produtos_pagina(driver, pendentes)
+        except RuntimeError as e:
+            print(e)
+            limpar_selecao(driver)
+            return  # Seleção incerta, os SKUs restantes vão para a pesquisa individual
+        if selecionados:
+            # Exclui todos os selecionados com uma única confirmação e verifica o resultado de cada um
+            pendentes.difference_update(selecionados)
+            try:
+                excluir_selecionados(driver)
+                restantes = set(_aguardar_exclusao(driver, selecionados))
+            except RuntimeError as e:
+                restantes, erro = set(selecionados), str(e)
+            else:
+                erro = 'O produto continua na lista após a exclusão'
+            for sku in selecionados:
+                yield {sku: f'Erro ao excluir o produto {sku}: {erro}' if sku in restantes else None}
+            if restantes:
+                limpar_selecao(driver)
+            continue  # A página é recarregada após a exclusão, verifica a mesma página novamente
+
+        # Nenhum SKU nesta página, avançando para a próxima
+        try:
+            driver.find_element(*PAGINA_SEGUINTE).click()
+            wait.until(EC.staleness_of(driver.find_element(*LINHA_PRODUTO)))
+        except Exception:
+            return
+        paginas += 1
+
+
+# Função recarregar lista
+def _recarregar_lista(driver: webdriver.Chrome, acao: Callable) -> str:
+    """Executa a `acao` que recarrega a lista de produtos (pesquisa, filtro, paginação) e aguarda a nova lista,
+    ignorando as linhas da lista anterior. Retorna o resultado de `dom.aguardar_resultado()`."""
+    # Etapas separadas na espera adaptativa: a lista já aberta responde bem antes da nova pesquisa
+    dom.aguardar_resultado(driver, LINHA_PRODUTO, LISTA_VAZIA, 5, 'tiny', 'lista_anterior')
+    dom.marcar_antigos(driver, LINHA_PRODUTO, LISTA_VAZIA)
+    acao()
+    return dom.aguardar_resultado(driver, LINHA_PRODUTO, LISTA_VAZIA, 10, 'tiny', 'lista_recarregada')
+
+
+# Função listar produtos - TINY
+def listar_produtos_tiny(driver: webdriver.Chrome,
+                         product_url: str = 'https://erp.tiny.com.br/produtos#list',
+                         max_paginas: int = 1000) -> Iterator[list[str]]:
+    """Percorre todas as páginas da lista de produtos, lendo cada página com uma única chamada ao navegador.
+    Antes de listar, limpa a pesquisa e os filtros salvos da lista e escolhe o maior número de itens por página.
+    Usada para montar o catálogo local (`catalogo.obter_catalogo()`).
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+        product_url (str, optional): URL para acessar a lista de produtos. Default to 'https://erp.tiny.com.br/produtos#list'
+        max_paginas (int, optional): Quantidade máxima de páginas percorridas. Defaults to 1000.
+
+    Raises:
+        RuntimeError: A lista não carregou ou tem mais páginas que `max_paginas` (catálogo incompleto)
+
+    Yields:
+        Iterator[list[str]]: SKUs de cada página
+    """
+    print('LISTANDO OS PRODUTOS - TINY')
+    wait = EsperaAdaptativa(driver, 10, 'tiny')
+    driver.get(product_url)
+
+    try:
+        busca = wait.until(EC.visibility_of_element_located((By.ID, "pesquisa-mini")))
+    except TimeoutException as e:
+        raise RuntimeError('A lista de produtos não carregou') from e
+    # A lista abre com a última pesquisa e os filtros salvos, que deixariam produtos fora do catálogo
+    resultado = _recarregar_lista(driver, lambda: (busca.clear(), busca.send_keys(Keys.ENTER)))
+    limpar = driver.find_elements(*LIMPAR_FILTROS)
+    if limpar:
+        resultado = _recarregar_lista(driver, limpar[0].click)
+    itens = driver.find_elements(*ITENS_POR_PAGINA)
+    if itens:
+        seletor = Select(itens[0])
+        maior = max(seletor.options, key=lambda opcao: int(opcao.get_attribute('value') or 0)
+                    if (opcao.get_attribute('value') or '').isdigit() else 0)
+        if not maior.is_selected():
+            resultado = _recarregar_lista(driver, lambda: seletor.select_by_value(maior.get_attribute('value')))
+    else:
+        print('Seletor de itens por página não encontrado, listando com o tamanho padrão')
+
+    if resultado == dom.DESCONHECIDO:
+        raise RuntimeError('A lista de produtos não carregou')
+    if resultado == dom.NAO_ENCONTRADO:
+        return
+
+    for _ in range(max_paginas):
+        yield driver.execute_script(_JS_LISTAR_PRODUTOS)
+        proxima = driver.find_elements(*PAGINA_SEGUINTE)
+        if not proxima:
+            return
+        primeira = driver.find_element(*LINHA_PRODUTO)
+        proxima[0].click()
+        try:
+            wait.until(EC.staleness_of(primeira))
+            wait.until(EC.presence_of_element_located(LINHA_PRODUTO))
+        except TimeoutException as e:
+            raise RuntimeError('A página seguinte da lista de produtos não carregou') from e
+    raise RuntimeError(f'A lista de produtos tem mais de {max_paginas} páginas')
 
 
 # Função acessar produto - TINY
@@ -333,23 +690,14 @@ def atualizar_preco(driver: webdriver.Chrome, product_price: str, promocional=Fa
         product_price (str): Preço do produto que será atualizado
         promocional (bool, optional): True para atualizar o preco promocional. Defaults to False
     """
-    wait = WebDriverWait(driver, 10)
     print('ATUALIZANDO PREÇO DO PRODUTO - TINY')
     try:
-        if promocional:
-            preco_elem = wait.until(
-            EC.presence_of_element_located((By.ID, 'precoPromocional')))
-        else:
-            preco_elem = wait.until(
-                EC.presence_of_element_located((By.ID, 'preco')))
-
-        valor_preco_elem = str(preco_elem.get_attribute('value')).replace('.', '').replace(',', '.') # Valor vem do TINY
+        campo = {'preco': (By.ID, 'precoPromocional' if promocional else 'preco')}
+        valor_preco_elem = str(dom.aguardar_campos(driver, campo, 10, 'tiny')['preco']).replace('.', '').replace(',', '.') # Valor vem do TINY
 
         # Verifica se os preços são iguas
         if valor_preco_elem != str(product_price):
-            preco_elem.clear()
-            preco_elem.send_keys(Keys.BACK_SPACE * 4,
-                                str(product_price).replace('.', ','))
+            dom.escrever_campos(driver, campo, {'preco': str(product_price).replace('.', ',')}, comparar=_mesmo_preco)
             print(f'Preço antigo: {valor_preco_elem}\nNovo preço: {product_price}')
     except Exception as e:
         raise RuntimeError(f"Erro ao atualizar o preco no Tiny - {str(e)}") from e
@@ -433,6 +781,128 @@ def atualizar_preco_revenda(driver: webdriver.Chrome, revenda_price: str, promoc
         raise RuntimeError(f"Erro ao atualizar o preco da revenda - {str(e)}") from e    
 
 
+# Função converter preço - TINY
+def _converter_preco(valor) -> float | None:
+    """Converte o preço do Tiny (`1.234,56`) ou da planilha para float, `None` quando vazio."""
+    if valor is None:
+        return None
+    if isinstance(valor, str):
+        valor = valor.strip()
+        if not valor:
+            return None
+        if ',' in valor:
+            valor = valor.replace('.', '').replace(',', '.')
+    try:
+        valor = round(float(valor), 2)
+    except ValueError:
+        return None
+    return None if valor != valor else valor  # NaN
+
+
+def _mesmo_preco(esperado, lido) -> bool:
+    """Compara o preço escrito com o lido do campo, que a máscara do Tiny pode formatar (`1234,5` vira `1.234,50`)."""
+    return _converter_preco(esperado) == _converter_preco(lido)
+
+
+# Função resolver listas de preço - TINY
+def resolver_listas_preco(driver: webdriver.Chrome, listas: list[str]) -> dict[str, str]:
+    """Retorna o ID (`idListaPreco`) de cada lista de preço, aceitando o ID ou o nome da lista.
+    As opções do select de listas são lidas uma única vez por sessão.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+        listas (list[str]): IDs ou nomes das listas de preço
+
+    Raises:
+        RuntimeError: Lista de preço não encontrada pelo nome
+
+    Returns:
+        dict[str, str]: ID de cada lista informada
+    """
+    if not _ids_listas_preco and any(not str(lista).isdigit() for lista in listas):
+        opcoes = driver.execute_script(
+            "return Array.from(document.querySelectorAll('#idListaPreco option'))"
+            ".map(opcao => [opcao.textContent.trim(), opcao.value]);")
+        _ids_listas_preco.update({nome: valor for nome, valor in opcoes or [] if valor})
+
+    ids = {}
+    for lista in listas:
+        lista = str(lista)
+        if lista.isdigit() or lista in _ids_listas_preco.values():
+            ids[lista] = lista
+        elif lista in _ids_listas_preco:
+            ids[lista] = _ids_listas_preco[lista]
+        else:
+            raise RuntimeError(f"Lista de preço não encontrada: {lista}")
+    return ids
+
+
+# Função atualizar tabela de preços - TINY
+def atualizar_tabela_precos(driver: webdriver.Chrome, precos: dict[str, dict[str, float | str | None]]) -> dict[str, tuple]:
+    """Atualiza os preços de todas as listas de preço de uma vez. VERIFIQUE O CÓDIGO DESSA FUNÇÃO ANTES DE UTILIZA-LA\n
+    A tabela é lida em uma única chamada ao navegador, as listas que faltam são adicionadas ao produto
+    e somente os preços diferentes são escritos, também em uma única chamada.
+
+    Obs:  Importante estar no modo edição do produto para funcionar.
+
+    Args:
+        driver (webdriver.Chrome): Objeto de controle do Selenium
+        precos (dict[str, dict[str, float | str | None]]): Preço de cada coluna (`COLUNA_PRECO`,
+        `COLUNA_PRECO_PROMOCIONAL`) por ID ou nome da lista. Preços vazios não são alterados.
+
+    Raises:
+        RuntimeError: Erro ao atualizar os preços, verifique as colunas e os IDs das listas.
+
+    Returns:
+        dict[str, tuple]: Preço antigo e novo de cada célula alterada (`lista|coluna`)
+    """
+    print("ATUALIZANDO AS LISTAS DE PREÇO - TINY")
+    try:
+        clicar_aba_precos(driver)
+        ids = resolver_listas_preco(driver, list(precos))
+
+        # Uma célula por lista e coluna, mais a linha de cada lista para saber se ela já está no produto
+        linhas, celulas = {}, {}
+        for lista, colunas in precos.items():
+            lista_id = ids[lista]
+            linhas[f'lista|{lista_id}'] = (By.CSS_SELECTOR, f'table > tbody > tr > td > input[value="{lista_id}"]')
+            for coluna in colunas:
+                celulas[f'{lista_id}|{coluna}'] = (
+                    By.XPATH, f'//input[@value="{lista_id}"]/ancestor::tr//input[contains(@name, "[{coluna}]")]')
+        tabela = dom.ler_campos(driver, {**linhas, **celulas})
+
+        # Adicionando as listas que faltam e lendo novamente somente as células delas
+        faltando = [chave.split('|', 1)[1] for chave in linhas if tabela[chave] is None]
+        for lista_id in faltando:
+            configurar_lista_precos(driver, lista_id)
+        if faltando:
+            novas = {chave: localizador for chave, localizador in celulas.items() if chave.split('|', 1)[0] in faltando}
+            tabela.update(dom.aguardar_campos(driver, novas, 5, 'tiny'))
+
+        # Escrevendo somente os preços diferentes
+        alterados, novos_valores = {}, {}
+        for lista, colunas in precos.items():
+            for coluna, preco in colunas.items():
+                chave = f'{ids[lista]}|{coluna}'
+                novo = _converter_preco(preco)
+                if tabela[chave] is None:
+                    raise RuntimeError(f"Coluna {coluna} não encontrada na lista {lista}")
+                antigo = _converter_preco(tabela[chave])
+                if novo is not None and novo != antigo:
+                    alterados[chave] = (antigo, novo)
+                    novos_valores[chave] = f'{novo:.2f}'.replace('.', ',')
+        if novos_valores:
+            dom.escrever_campos(driver, celulas, novos_valores, comparar=_mesmo_preco)
+
+        for chave, (antigo, novo) in alterados.items():
+            print(f"{chave} - Preço antigo: {antigo}\nNovo preço: {novo}")
+        if not alterados:
+            print("Os preços já estão atualizados.")
+        return alterados
+    except Exception as e:
+        raise RuntimeError(f"Erro ao atualizar as listas de preço: {str(e)}") from e
+
+
 def verificar_alerta_de_envio(driver: webdriver.Chrome):
     """Verifica se há um alerta após enviar o produto para as plataformas de venda,
     dando a opção de confirmar o envio ou não
@@ -444,9 +914,9 @@ def verificar_alerta_de_envio(driver: webdriver.Chrome):
         RuntimeError: Ocorre quando não é possível clicar no botão de confirmar o envio ou cancelar
     """
     try:
-        botao_confirmar = WebDriverWait(driver, 2).until(EC.element_to_be_clickable(
+        botao_confirmar = EsperaAdaptativa(driver, 2, 'tiny').until(EC.element_to_be_clickable(
             (By.CSS_SELECTOR, '.btn.btn-sm.btn-primary')))
-        botao_cancelar =  WebDriverWait(driver, 2).until(EC.element_to_be_clickable(
+        botao_cancelar =  EsperaAdaptativa(driver, 2, 'tiny').until(EC.element_to_be_clickable(
             (By.CSS_SELECTOR, '.btn.btn-sm.btn-default')))
     except Exception:
         print('Alerta de envio não encontrado')
@@ -482,7 +952,7 @@ def enviar_precos(driver: webdriver.Chrome):
         RuntimeError: Ocorre quando o verificar_alerta_de_envio dá um erro
         RuntimeError: Quando o produto é enviado, mas a confirmação de envio fica na tela e não consegue ser fechada
     """
-    wait = WebDriverWait(driver, 10)
+    wait = EsperaAdaptativa(driver, 10, 'tiny')
     try:
         wait.until(EC.element_to_be_clickable(
             (By.XPATH, '//*[@id="page-wrapper"]/div[5]/div[1]/div/div[2]/button'))).click() # Clicando no menu ações
@@ -529,7 +999,7 @@ def sincronizar_mkp_ml(driver: webdriver.Chrome):
     Raises:
         RuntimeError: Ocorreu um erro ao interagir com algum elemento
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'tiny')
     try:
         clicar_elemento(wait, By.CSS_SELECTOR, 'button.featured-action[original-title=" Enviar para o e-commerce"]', "Enviar para o e-commerce")
 
@@ -584,7 +1054,7 @@ def sincronizar_mkp_ml_full(driver: webdriver.Chrome):
     Raises:
         RuntimeError: Ocorreu um erro ao interagir com algum elemento
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'tiny')
     try:
         clicar_elemento(wait, By.CSS_SELECTOR, 'button.featured-action[original-title=" Enviar para o e-commerce"]', "Enviar para o e-commerce")
 
@@ -635,7 +1105,7 @@ def sincronizar_mkp_magalu(driver: webdriver.Chrome):
     Raises:
         RuntimeError: Ocorreu um erro ao interagir com algum elemento
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'tiny')
     try:
         clicar_elemento(wait, By.CSS_SELECTOR, 'button.featured-action[original-title=" Enviar para o e-commerce"]', "Enviar para o e-commerce")
 
@@ -672,7 +1142,7 @@ def sincronizar_produtos_sites(driver: webdriver.Chrome,
         opencart (bool, optional): Seleciona o opencart. Defaults to False.
         woocommerce (bool, optional): Seleciona o woocommercer. Defaults to False.
     """
-    wait = WebDriverWait(driver, 20)
+    wait = EsperaAdaptativa(driver, 20, 'tiny')
     plataformas = {
         "opencart": (opencart, "7673"),
         "woocommerce": (woocommerce, "7689"),
@@ -702,3 +1172,8 @@ def sincronizar_produtos_sites(driver: webdriver.Chrome,
                 driver.refresh()
             except Exception as e:
                 raise RuntimeError(f"Erro ao sincronizar com {nome_plataforma}: {str(e)}") from e
+
+
+# Tempo de cada função pública gravado em tempos.jsonl (relatório: python relatorio_desempenho.py)
+navegadores.liberar_etapas(sys.modules[__name__], 'tiny')  # Etapas em ETAPAS_SEM_BLOQUEIO
+desempenho.instrumentar_modulo(sys.modules[__name__], 'tiny')
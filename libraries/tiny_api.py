@@ -0,0 +1,336 @@
+# Importações
+import json
+import time
+import threading
+from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+# Endpoints da API v2 do Tiny - VERIFIQUE OS ENDPOINTS ANTES DE UTILIZA-LOS
+URL_API = 'https://api.tiny.com.br/api2/'
+ENDPOINT_PRECOS = 'produto.atualizar.precos.php'
+ENDPOINT_LISTA_PRECOS = 'listas.precos.excecoes.atualizar.php'
+ENDPOINT_PESQUISA_PRODUTOS = 'produtos.pesquisa.php'
+ENDPOINT_EXCECOES_LISTA = 'listas.precos.excecoes.php'
+CODIGO_SEM_REGISTROS = '20'  # A consulta não retornou registros
+# Respostas em que a API não processou a requisição e ela pode ser enviada de novo
+STATUS_TEMPORARIOS = (429, 502, 503, 504)
+
+
+# Limitador de requisições
+class LimitadorRequisicoes:
+    """Garante um intervalo mínimo entre as requisições, respeitando o limite por minuto da API,
+    mesmo com várias threads fazendo requisições ao mesmo tempo.
+
+    Args:
+        requisicoes_por_minuto (int): Limite de requisições por minuto do plano da API.
+    """
+    def __init__(self, requisicoes_por_minuto: int):
+        self.intervalo = 60 / requisicoes_por_minuto
+        self.proxima = time.monotonic()
+        self.lock = threading.Lock()
+
+    def aguardar(self):
+        """Bloqueia a thread até que a próxima requisição seja permitida."""
+        with self.lock:
+            agora = time.monotonic()
+            espera = self.proxima - agora
+            self.proxima = max(agora, self.proxima) + self.intervalo
+        if espera > 0:
+            time.sleep(espera)
+
+
+# Cliente da API do Tiny
+class TinyAPI:
+    """Alternativa ao navegador para atualizar os preços no Tiny pela API HTTP.
+
+    Faz as mesmas operações de `tiny.atualizar_preco()` e `tiny.atualizar_lista_preco()`,
+    usando uma sessão com conexões reaproveitadas e requisições em paralelo dentro do limite da API.
+
+    Args:
+        token (str): Token da API do Tiny.
+        url_api (str, optional): URL base da API, altere para testar com um servidor local. Defaults to URL_API.
+        requisicoes_por_minuto (int, optional): Limite de requisições por minuto do plano. Defaults to 30.
+        workers (int, optional): Quantidade de requisições simultâneas. Defaults to 4.
+        tamanho_lote (int, optional): Quantidade de produtos enviados em cada requisição. Defaults to 20.
+        timeout (float, optional): Tempo máximo de cada requisição em segundos. Defaults to 30.
+        tentativas (int, optional): Novas tentativas para erros temporários (`STATUS_TEMPORARIOS` e falha
+        de conexão). Defaults to 3.
+        espera_tentativa (float, optional): Espera, em segundos, antes da primeira nova tentativa,
+        dobrando a cada tentativa. Defaults to 1.
+    """
+    def __init__(self,
+                 token: str,
+                 url_api: str = URL_API,
+                 requisicoes_por_minuto: int = 30,
+                 workers: int = 4,
+                 tamanho_lote: int = 20,
+                 timeout: float = 30,
+                 tentativas: int = 3,
+                 espera_tentativa: float = 1):
+        self.token = token
+        self.url_api = url_api.rstrip('/') + '/'
+        self.workers = workers
+        self.tamanho_lote = tamanho_lote
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera_tentativa = espera_tentativa
+        self.limitador = LimitadorRequisicoes(requisicoes_por_minuto)
+
+        # Sessão com conexões reaproveitadas. As novas tentativas ficam em `_postar()`, passando pelo
+        # limitador, e não no urllib3, que repetiria os POSTs sem respeitar o limite da API
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _postar(self, endpoint: str, campos: dict) -> dict:
+        """Faz uma requisição POST para a API e retorna o conteúdo de `retorno`, sem verificar o status.
+        Repete a requisição, sempre pelo limitador, quando a API não a processou (`STATUS_TEMPORARIOS`)
+        ou a conexão falhou, mas não quando a resposta não chegou (timeout de leitura), já que a
+        alteração pode ter sido feita."""
+        for tentativa in range(self.tentativas + 1):
+            self.limitador.aguardar()
+            espera = self.espera_tentativa * 2 ** tentativa
+            try:
+                resposta = self.session.post(
+                    self.url_api + endpoint,
+                    data={'token': self.token, 'formato': 'json', **campos},
+                    timeout=self.timeout)
+                if resposta.status_code in STATUS_TEMPORARIOS and tentativa < self.tentativas:
+                    time.sleep(espera_servidor(resposta, espera))
+                    continue
+                resposta.raise_for_status()
+                return resposta.json()['retorno']
+            except requests.ConnectionError as e:
+                if tentativa < self.tentativas:
+                    time.sleep(espera)
+                    continue
+                raise RuntimeError(f"Erro na requisição {endpoint} - {str(e)}") from e
+            except (requests.RequestException, ValueError, KeyError) as e:
+                raise RuntimeError(f"Erro na requisição {endpoint} - {str(e)}") from e
+
+    def requisitar(self, endpoint: str, dados: dict) -> dict:
+        """Faz uma requisição POST para a API e retorna o conteúdo de `retorno`.
+
+        Args:
+            endpoint (str): Endpoint da API, por exemplo `produto.atualizar.precos.php`.
+            dados (dict): Dados que serão enviados como JSON no campo `data`.
+
+        Raises:
+            RuntimeError: Erro de conexão ou a API retornou um erro.
+
+        Returns:
+            dict: Conteúdo de `retorno` da resposta.
+        """
+        retorno = self._postar(endpoint, {'data': json.dumps(dados)})
+
+        if retorno.get('status') != 'OK' and not retorno.get('registros'):
+            raise RuntimeError(f"Erro na API do Tiny {endpoint} - {_mensagem_erros(retorno)}")
+
+        return retorno
+
+    def paginar(self, endpoint: str, chave: str, parametros: dict | None = None,
+                max_paginas: int = 1000) -> Iterator[list[dict]]:
+        """Percorre todas as páginas de uma pesquisa da API (`pagina` e `numero_paginas`).
+
+        Args:
+            endpoint (str): Endpoint da pesquisa, por exemplo `produtos.pesquisa.php`.
+            chave (str): Lista de itens do `retorno`, por exemplo `produtos`.
+            parametros (dict | None, optional): Parâmetros da pesquisa. Defaults to None.
+            max_paginas (int, optional): Quantidade máxima de páginas percorridas. Defaults to 1000.
+
+        Raises:
+            RuntimeError: Erro na API ou mais páginas que `max_paginas` (resultado incompleto).
+
+        Yields:
+            Iterator[list[dict]]: Itens de cada página, já sem o envelope (`{'produto': {...}}`).
+        """
+        for pagina in range(1, max_paginas + 1):
+            retorno = self._postar(endpoint, {**(parametros or {}), 'pagina': pagina})
+            if retorno.get('status') != 'OK':
+                if str(retorno.get('codigo_erro')) == CODIGO_SEM_REGISTROS:
+                    return
+                raise RuntimeError(f"Erro na API do Tiny {endpoint} - {_mensagem_erros(retorno)}")
+
+            yield [_desembrulhar(item) for item in retorno.get(chave) or []]
+            if pagina >= int(retorno.get('numero_paginas') or 1):
+                return
+        raise RuntimeError(f"A pesquisa {endpoint} tem mais de {max_paginas} páginas")
+
+    def atualizar_precos(self, precos: list[dict]) -> dict[str, str | None]:
+        """Atualiza o preço e o preço promocional da aba principal de vários produtos de uma vez.
+
+        Args:
+            precos (list[dict]): Lista com `id`, `preco` e `preco_promocional` de cada produto.
+
+        Returns:
+            dict[str, str | None]: Erro de cada produto pelo ID, `None` quando atualizado.
+        """
+        retorno = self.requisitar(ENDPOINT_PRECOS, {'precos': precos})
+        return _resultados_por_id(retorno, [preco['id'] for preco in precos])
+
+    def atualizar_lista_precos(self, lista_id: str, precos: list[dict]) -> dict[str, str | None]:
+        """Atualiza os preços de vários produtos em uma lista de preços (inclui o produto se não estiver na lista).
+
+        Args:
+            lista_id (str): ID da lista de preço.
+            precos (list[dict]): Lista com `id`, `preco` e `preco_promocional` de cada produto.
+
+        Returns:
+            dict[str, str | None]: Erro de cada produto pelo ID, `None` quando atualizado.
+        """
+        retorno = self.requisitar(ENDPOINT_LISTA_PRECOS, {'idListaPreco': lista_id, 'excecoes': precos})
+        return _resultados_por_id(retorno, [preco['id'] for preco in precos])
+
+    def atualizar_precos_df(self,
+                            df: pd.DataFrame,
+                            listas: list[tuple[str, str, str]] = (),
+                            coluna_preco: str = 'Preço',
+                            coluna_promocional: str = 'Preço promocional') -> dict[str, str | None]:
+        """Atualiza os preços de todos os produtos da planilha, em lotes e em paralelo.
+
+        Args:
+            df (pd.DataFrame): Planilha com as colunas `ID`, `SKU` e as colunas de preço.
+            listas (list[tuple[str, str, str]], optional): Listas de preço no formato
+            `(lista_id, coluna_preco, coluna_promocional)`. Defaults to ().
+            coluna_preco (str, optional): Coluna do preço da aba principal. Defaults to 'Preço'.
+            coluna_promocional (str, optional): Coluna do preço promocional da aba principal. Defaults to 'Preço promocional'.
+
+        Returns:
+            dict[str, str | None]: Erros de cada produto pelo SKU, `None` quando todos os preços foram atualizados.
+            Os produtos sem o preço da aba principal não são enviados (nem nas listas) e voltam com erro.
+        """
+        sku_por_id = dict(zip(df['ID'].astype(str), df['SKU'].astype(str)))
+        resultados: dict[str, str | None] = {sku: None for sku in sku_por_id.values()}
+        for sku in df.loc[df[coluna_preco].isna(), 'SKU'].astype(str):
+            resultados[sku] = f"Preço vazio na coluna {coluna_preco}"
+        df = df[df[coluna_preco].notna()]
+
+        # Montando as tarefas: (lista_id, lote), lista_id None é a aba principal
+        tarefas = []
+        for lista_id, col_preco, col_promocional in [(None, coluna_preco, coluna_promocional), *listas]:
+            precos = _precos_da_planilha(df, col_preco, col_promocional)
+            for inicio in range(0, len(precos), self.tamanho_lote):
+                tarefas.append((lista_id, precos[inicio:inicio + self.tamanho_lote]))
+
+        def executar(tarefa):
+            lista_id, lote = tarefa
+            try:
+                if lista_id is None:
+                    return self.atualizar_precos(lote)
+                return self.atualizar_lista_precos(lista_id, lote)
+            except RuntimeError as e:
+                return {preco['id']: str(e) for preco in lote}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for resultado in executor.map(executar, tarefas):
+                for product_id, erro in resultado.items():
+                    sku = sku_por_id.get(str(product_id))
+                    if erro and sku is not None:
+                        anterior = resultados[sku]
+                        resultados[sku] = f"{anterior}; {erro}" if anterior else erro
+
+        return resultados
+
+    def exportar_precos_df(self,
+                           listas: list[tuple[str, str, str]] = (),
+                           coluna_preco: str = 'Preço',
+                           coluna_promocional: str = 'Preço promocional') -> pd.DataFrame:
+        """Lê de uma vez os preços atuais de todos os produtos e das listas de preço, no formato da planilha.
+        VERIFIQUE OS CAMPOS DAS EXCEÇÕES DAS LISTAS ANTES DE UTILIZA-LOS
+
+        Args:
+            listas (list[tuple[str, str, str]], optional): Listas de preço no formato
+            `(lista_id, coluna_preco, coluna_promocional)`. Defaults to ().
+            coluna_preco (str, optional): Coluna do preço da aba principal. Defaults to 'Preço'.
+            coluna_promocional (str, optional): Coluna do preço promocional da aba principal. Defaults to 'Preço promocional'.
+
+        Raises:
+            RuntimeError: Erro na API, os preços atuais ficariam incompletos.
+
+        Returns:
+            pd.DataFrame: Colunas `ID`, `SKU` e as colunas de preço, vazias quando o produto não está na lista.
+        """
+        produtos = [produto for pagina in self.paginar(ENDPOINT_PESQUISA_PRODUTOS, 'produtos') for produto in pagina]
+        atuais = pd.DataFrame({
+            'ID': [str(produto.get('id')) for produto in produtos],
+            'SKU': [str(produto.get('codigo') or '') for produto in produtos],
+            coluna_preco: [produto.get('preco') for produto in produtos],
+            coluna_promocional: [produto.get('preco_promocional') for produto in produtos],
+        })
+
+        for lista_id, col_preco, col_promocional in listas:
+            excecoes = [excecao for pagina in self.paginar(ENDPOINT_EXCECOES_LISTA, 'excecoes', {'idListaPreco': lista_id})
+                        for excecao in pagina]
+            lista_df = pd.DataFrame({
+                'ID': [str(excecao.get('idProduto', excecao.get('id'))) for excecao in excecoes],
+                col_preco: [excecao.get('preco') for excecao in excecoes],
+                col_promocional: [excecao.get('preco_promocional') for excecao in excecoes],
+            }).drop_duplicates('ID')
+            atuais = atuais.merge(lista_df, on='ID', how='left')
+
+        colunas = atuais.columns.drop(['ID', 'SKU'])
+        atuais[colunas] = atuais[colunas].apply(pd.to_numeric, errors='coerce').round(2)
+        return atuais
+
+
+# Funções auxiliares
+def _precos_da_planilha(df: pd.DataFrame, coluna_preco: str, coluna_promocional: str) -> list[dict]:
+    """Monta a lista de preços no formato da API a partir das colunas da planilha, ignorando preços vazios."""
+    precos = []
+    for product_id, preco, promocional in zip(df['ID'], df[coluna_preco], df[coluna_promocional]):
+        if pd.isna(preco):
+            continue
+        item = {'id': str(product_id), 'preco': round(float(preco), 2)}
+        if not pd.isna(promocional):
+            item['preco_promocional'] = round(float(promocional), 2)
+        precos.append(item)
+    return precos
+
+
+def espera_servidor(resposta: requests.Response, espera: float) -> float:
+    """Retorna a espera pedida pelo servidor no cabeçalho `Retry-After` (em segundos), ou a `espera` informada."""
+    try:
+        return max(float(resposta.headers.get('Retry-After', '')), espera)
+    except ValueError:
+        return espera
+
+
+def _desembrulhar(item: dict) -> dict:
+    """Remove o envelope dos itens das pesquisas (`{'produto': {...}}` vira `{...}`)."""
+    if len(item) == 1:
+        valor = next(iter(item.values()))
+        if isinstance(valor, dict):
+            return valor
+    return item
+
+
+def _mensagem_erros(retorno: dict) -> str:
+    """Junta as mensagens de erro retornadas pela API."""
+    erros = retorno.get('erros') or []
+    return ', '.join(str(erro.get('erro', erro)) if isinstance(erro, dict) else str(erro) for erro in erros) or 'erro desconhecido'
+
+
+def _resultados_por_id(retorno: dict, ids: list[str]) -> dict[str, str | None]:
+    """Separa o resultado de cada produto do lote, usando os `registros` quando a API os retorna."""
+    if not retorno.get('registros'):
+        return {product_id: None for product_id in ids}
+
+    resultados = {}
+    for posicao, item in enumerate(retorno['registros']):
+        registro = item.get('registro', item)
+        if registro.get('id') is not None:
+            product_id = str(registro['id'])
+        elif posicao < len(ids):
+            product_id = ids[posicao]
+        else:
+            continue
+        resultados[product_id] = None if registro.get('status') == 'OK' else _mensagem_erros(registro)
+
+    # Produtos que não voltaram nos registros seguem o status geral
+    for product_id in ids:
+        resultados.setdefault(product_id, None if retorno.get('status') == 'OK' else _mensagem_erros(retorno))
+    return resultados
@@ -0,0 +1,27 @@
+# Importações
+import argparse
+from libraries import desempenho
+
+# Função principal
+def main(arquivo: str = desempenho.ARQUIVO_TEMPOS, execucao: str | None = None):
+    """Mostra os tempos (p50, p95 e máximo) de cada etapa por plataforma e os produtos por hora de cada execução.
+
+    Args:
+        arquivo (str, optional): Arquivo dos tempos gravado pelas automações. Defaults to 'tempos.jsonl'.
+        execucao (str | None, optional): Somente uma execução, `ultima` para a mais recente. Defaults to None.
+    """
+    etapas, execucoes = desempenho.relatorio(arquivo, execucao)
+    print("TEMPOS POR ETAPA (segundos)")
+    print(etapas.to_string())
+    print("\nPRODUTOS POR HORA")
+    print(execucoes.to_string())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Relatório de desempenho das automações por etapa e plataforma.")
+    parser.add_argument("--arquivo", default=desempenho.ARQUIVO_TEMPOS,
+                        help="Arquivo dos tempos. Defaults to tempos.jsonl.")
+    parser.add_argument("--execucao", default=None,
+                        help="Somente uma execução (use 'ultima' para a mais recente). Defaults to todas.")
+    args = parser.parse_args()
+    main(args.arquivo, args.execucao)
@@ -0,0 +1,67 @@
+# Importações
+import os
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+# Os testes importam os scripts e a pasta libraries a partir da raiz do repositório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ServidorFalso:
+    """Servidor HTTP local no lugar das APIs e painéis das plataformas. Cada requisição é respondida pela
+    função `responder(metodo, caminho, corpo)`, que retorna o status e o conteúdo da resposta (JSON, ou HTML
+    quando é texto), e fica guardada em `requisicoes` como `(metodo, caminho, corpo)`."""
+    def __init__(self, responder):
+        self.requisicoes = []
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _responder(self):
+                corpo = self.rfile.read(int(self.headers.get('Content-Length') or 0)).decode('utf-8')
+                servidor.requisicoes.append((self.command, self.path, corpo))
+                status, dados = responder(self.command, self.path, corpo)
+                tipo = 'text/html; charset=utf-8' if isinstance(dados, str) else 'application/json'
+                conteudo = (dados if isinstance(dados, str) else json.dumps(dados)).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', tipo)
+                self.send_header('Content-Length', str(len(conteudo)))
+                self.end_headers()
+                self.wfile.write(conteudo)
+
+            do_GET = do_POST = do_PUT = do_PATCH = _responder
+
+            def log_message(self, *args):
+                pass
+
+        self.http = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.http.server_port}/'
+        threading.Thread(target=self.http.serve_forever, daemon=True).start()
+
+    def fechar(self):
+        self.http.shutdown()
+        self.http.server_close()
+
+
+@pytest.fixture
+def servidor_http():
+    """Cria servidores locais (`ServidorFalso`) e os fecha no fim do teste."""
+    servidores = []
+
+    def criar(responder):
+        servidores.append(ServidorFalso(responder))
+        return servidores[-1]
+
+    yield criar
+    for servidor in servidores:
+        servidor.fechar()
+
+
+def contar_limitador(api) -> list:
+    """Conta as passagens pelo limitador de requisições do cliente da API."""
+    chamadas = []
+    aguardar = api.limitador.aguardar
+    api.limitador.aguardar = lambda: (chamadas.append(1), aguardar())
+    return chamadas
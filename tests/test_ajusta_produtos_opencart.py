@@ -0,0 +1,63 @@
+# Importações
+import sqlite3
+import pandas as pd
+import pytest
+import ajusta_produtos_opencart as script
+from libraries import historico
+from libraries import opencart_db
+
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    caminho = str(tmp_path / 'opencart.db')
+    conexao = sqlite3.connect(caminho)
+    opencart_db.criar_tabelas_sqlite(conexao)
+    conexao.executemany("INSERT INTO oc_product_description (product_id, language_id, name, meta_title) VALUES (?, 2, ?, ?)",
+                        [(123, 'Produto A', 'Antigo'), (456, 'Produto B', 'Antigo')])
+    conexao.commit()
+    conexao.close()
+    return caminho
+
+
+def usar_planilha(monkeypatch, **colunas):
+    df = pd.DataFrame({coluna: [None] * len(colunas['ID']) for coluna in script.COLUNAS.values()}, dtype=object)
+    for coluna, valores in colunas.items():
+        df[coluna] = valores
+    df['status'] = '-'
+    monkeypatch.setattr(script, 'setup', lambda navegador=True, planilha=True: (None, df, None))
+
+
+def titulos(caminho):
+    with sqlite3.connect(caminho) as conexao:
+        return dict(conexao.execute("SELECT product_id, meta_title FROM oc_product_description").fetchall())
+
+
+def test_modo_banco_registra_os_ajustados_e_pula_na_execucao_seguinte(banco, monkeypatch):
+    usar_planilha(monkeypatch, **{'ID': ['123', '999', 'abc'], 'Meta titulo': ['Novo', 'X', 'Y']})
+
+    script.main_banco(sqlite=banco)
+
+    operacoes = historico.HistoricoOperacoes()
+    assert {sku for _, sku, _, _ in operacoes.feitas} == {'123'}  # Produto não encontrado e ID inválido ficam de fora
+    operacoes.fechar()
+
+    # Alterado fora da planilha: a planilha não mudou, então o produto não é comparado de novo
+    with sqlite3.connect(banco) as conexao:
+        conexao.execute("UPDATE oc_product_description SET meta_title = 'Manual' WHERE product_id = 123")
+    script.main_banco(sqlite=banco)
+    assert titulos(banco)[123] == 'Manual'
+
+    script.main_banco(sqlite=banco, refazer=True)
+    assert titulos(banco)[123] == 'Novo'
+
+
+def test_modo_banco_em_dry_run_nao_registra_no_historico(banco, monkeypatch):
+    usar_planilha(monkeypatch, **{'ID': ['456'], 'Meta titulo': ['Novo']})
+
+    script.main_banco(dry_run=True, sqlite=banco)
+
+    operacoes = historico.HistoricoOperacoes()
+    assert not operacoes.feitas
+    operacoes.fechar()
+    assert titulos(banco)[456] == 'Antigo'
@@ -0,0 +1,98 @@
+# Importações
+import pandas as pd
+import pytest
+import atualizar_precos_tiny as script
+from libraries import historico
+from libraries import tiny_api
+
+
+class DiarioFalso:
+    """Guarda os status registrados no lugar do `planilhas.DiarioStatus`."""
+    def __init__(self):
+        self.registros = []
+
+    def registrar(self, sku, coluna, status, linha=None):
+        self.registros.append((sku, coluna, status, linha))
+
+
+def produto(linha, sku, preco, promocional=0.0, mkp=None, revenda=None, product_id=None):
+    return script.Produto(linha, product_id or str(100 + linha), sku, preco, promocional,
+                          mkp, None, revenda, None)
+
+
+def precos_atuais(*linhas):
+    colunas = ['ID', 'SKU', *script.COLUNAS_PRECO]
+    return pd.DataFrame([dict(zip(colunas, linha)) for linha in linhas], columns=colunas)
+
+
+@pytest.fixture
+def operacoes(tmp_path):
+    historico_operacoes = historico.HistoricoOperacoes(str(tmp_path / 'historico.db'))
+    yield historico_operacoes
+    historico_operacoes.fechar()
+
+
+def test_produtos_com_os_mesmos_precos_sao_marcados_como_feitos(operacoes):
+    pendentes = [produto(0, 'A', 10.0, mkp=11.0), produto(1, 'B', 5.0), produto(2, 'C', 7.5)]
+    produtos_df = pd.DataFrame({'status': ['-', '-', '-']})
+    atuais_df = precos_atuais(('100', 'A', 10.0, 0.0, 11.0, 10.0, None, None),
+                              ('101', 'B', 5.01, 0.0, None, None, None, None),
+                              ('102', 'C', 7.5, 0.0, None, None, None, None))
+    diario = DiarioFalso()
+
+    restantes = script.filtrar_inalterados(produtos_df, pendentes, atuais_df, diario, operacoes)
+
+    assert [p.sku for p in restantes] == ['B']
+    assert diario.registros == [('A', 'status', 'FEITO', 0), ('C', 'status', 'FEITO', 2)]
+    assert operacoes.ja_feito('tiny', 'A', 'atualizar_precos', script.dados_precos(pendentes[0]))
+    assert not operacoes.ja_feito('tiny', 'B', 'atualizar_precos', script.dados_precos(pendentes[1]))
+
+
+def test_produtos_com_erro_continuam_pendentes_mesmo_com_os_precos_iguais(operacoes):
+    pendentes = [produto(0, 'A', 10.0), produto(1, 'B', 5.0)]
+    produtos_df = pd.DataFrame({'status': ['ERRO', None]})
+    atuais_df = precos_atuais(('100', 'A', 10.0, 0.0, None, None, None, None),
+                              ('101', 'B', 5.0, 0.0, None, None, None, None))
+    diario = DiarioFalso()
+
+    restantes = script.filtrar_inalterados(produtos_df, pendentes, atuais_df, diario, operacoes)
+
+    assert [p.sku for p in restantes] == ['A']
+    assert diario.registros == [('B', 'status', 'FEITO', 1)]
+    assert not operacoes.ja_feito('tiny', 'A', 'atualizar_precos', script.dados_precos(pendentes[0]))
+
+
+def test_produtos_fora_dos_precos_atuais_ou_de_uma_lista_continuam_pendentes(operacoes):
+    pendentes = [produto(0, 'A', 10.0), produto(1, 'B', 5.0, revenda=3.0)]
+    produtos_df = pd.DataFrame({'status': ['-', '-']})
+    atuais_df = precos_atuais(('101', 'B', 5.0, 0.0, None, None, None, None))
+
+    restantes = script.filtrar_inalterados(produtos_df, pendentes, atuais_df, DiarioFalso(), operacoes)
+
+    assert [p.sku for p in restantes] == ['A', 'B']
+
+
+def test_exportar_precos_percorre_as_paginas_e_junta_as_listas(monkeypatch):
+    paginas = {
+        (tiny_api.ENDPOINT_PESQUISA_PRODUTOS, 1): {'status': 'OK', 'numero_paginas': 2, 'produtos': [
+            {'produto': {'id': '10', 'codigo': 'A', 'preco': '10.00', 'preco_promocional': '9.00'}}]},
+        (tiny_api.ENDPOINT_PESQUISA_PRODUTOS, 2): {'status': 'OK', 'numero_paginas': 2, 'produtos': [
+            {'produto': {'id': '11', 'codigo': 'B', 'preco': '5.00', 'preco_promocional': '0'}}]},
+        (tiny_api.ENDPOINT_EXCECOES_LISTA, 1): {'status': 'OK', 'numero_paginas': 1, 'excecoes': [
+            {'excecao': {'idProduto': '10', 'preco': '11.00', 'preco_promocional': '10.50'}}]},
+    }
+
+    def postar(self, endpoint, campos):
+        if campos.get('idListaPreco') == 'vazia':
+            return {'status': 'Erro', 'codigo_erro': tiny_api.CODIGO_SEM_REGISTROS}
+        return paginas[(endpoint, campos['pagina'])]
+
+    monkeypatch.setattr(tiny_api.TinyAPI, '_postar', postar)
+    atuais_df = tiny_api.TinyAPI('token').exportar_precos_df(
+        [('1', 'Lp-Mkp', 'Lp-Mkp Promocional'), ('vazia', 'Revenda', 'Revenda Promocional')])
+
+    assert atuais_df['ID'].tolist() == ['10', '11']
+    assert atuais_df['Preço'].tolist() == [10.0, 5.0]
+    assert atuais_df.loc[0, 'Lp-Mkp Promocional'] == 10.5
+    assert pd.isna(atuais_df.loc[1, 'Lp-Mkp'])
+    assert atuais_df['Revenda'].isna().all()
@@ -0,0 +1,42 @@
+# Importações
+import time
+import pytest
+from libraries import desempenho
+
+
+@pytest.fixture
+def registro(tmp_path, monkeypatch):
+    registro = desempenho.RegistroTempos(str(tmp_path / 'tempos.jsonl'), a_cada=1000)
+    monkeypatch.setattr(desempenho, 'REGISTRO', registro)
+    return registro
+
+
+def test_etapas_aninhadas_nao_contam_o_mesmo_tempo_duas_vezes(registro):
+    @desempenho.cronometrar('tiny')
+    def interna():
+        time.sleep(0.05)
+
+    @desempenho.cronometrar('tiny')
+    def externa():
+        time.sleep(0.02)
+        interna()
+
+    desempenho.definir_sku('A')
+    externa()
+    registro.gravar()
+
+    etapas, _ = desempenho.relatorio(registro.caminho)
+    total = etapas['total'].sum()
+    assert total == pytest.approx(0.07, abs=0.03)
+    assert etapas.loc[('tiny', 'externa'), 'total'] < 0.05
+    assert etapas.loc[('tiny', 'externa'), 'maximo'] >= 0.07
+
+
+def test_relatorio_aceita_registros_sem_tempo_exclusivo(tmp_path):
+    caminho = tmp_path / 'tempos.jsonl'
+    caminho.write_text('{"execucao": "1", "inicio": 0, "plataforma": "tiny", "etapa": "a", '
+                       '"sku": "A", "duracao": 2.0, "ok": true}\n', encoding='utf-8')
+
+    etapas, _ = desempenho.relatorio(str(caminho))
+
+    assert etapas.loc[('tiny', 'a'), 'total'] == 2.0
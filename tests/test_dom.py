@@ -0,0 +1,48 @@
+# Importações
+import pytest
+from selenium.webdriver.common.by import By
+from libraries import dom, tiny
+
+
+class NavegadorFalso:
+    """Devolve, no lugar do navegador, os valores lidos de volta após a escrita."""
+    def __init__(self, lidos):
+        self.lidos = lidos
+
+    def execute_script(self, script, localizadores, valores):
+        return {nome: {'antes': '', 'depois': self.lidos[nome]} for nome in localizadores}, []
+
+
+CAMPOS = {'titulo': (By.ID, 'titulo'), 'ativo': (By.ID, 'ativo'), 'descricao': (By.ID, 'descricao')}
+
+
+def test_escrever_campos_gera_erro_quando_o_valor_lido_e_diferente():
+    driver = NavegadorFalso({'titulo': 'Furadei', 'ativo': True, 'descricao': 'a\nb'})
+
+    with pytest.raises(RuntimeError, match='titulo'):
+        dom.escrever_campos(driver, CAMPOS, {'titulo': 'Furadeira', 'ativo': 1, 'descricao': 'a\r\nb'})
+
+
+def test_escrever_campos_aceita_os_valores_iguais_e_a_comparacao_informada():
+    driver = NavegadorFalso({'titulo': '1.234,50', 'ativo': False, 'descricao': 'a\nb'})
+
+    dom.escrever_campos(driver, {'ativo': CAMPOS['ativo'], 'descricao': CAMPOS['descricao']},
+                        {'ativo': False, 'descricao': 'a\r\nb'})
+    dom.escrever_campos(driver, {'titulo': CAMPOS['titulo']}, {'titulo': '1234,5'},
+                        comparar=tiny._mesmo_preco)
+
+
+def test_divergentes_sem_conferir():
+    driver = NavegadorFalso({'titulo': '', 'ativo': True, 'descricao': 'x'})
+    valores = {'titulo': 'Novo', 'ativo': True, 'descricao': 'x'}
+
+    resultado = dom.escrever_campos(driver, CAMPOS, valores, conferir=False)
+
+    assert dom.divergentes(resultado, valores) == {'titulo': ('Novo', '')}
+
+
+def test_agrupar_por_prefixo_separa_os_grupos_e_os_avulsos():
+    grupos, avulsos = dom.agrupar_por_prefixo(['ABC10', 'ABC11', 'ABC2', 'ABD1', 'X1', 'ZZZ9', 'ZZZ91'])
+
+    assert grupos == [('ABC', ['ABC10', 'ABC11', 'ABC2']), ('ZZZ9', ['ZZZ9', 'ZZZ91'])]
+    assert avulsos == ['ABD1', 'X1']
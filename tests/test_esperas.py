@@ -0,0 +1,44 @@
+# Importações
+import pytest
+from libraries import esperas
+
+
+@pytest.fixture
+def histogramas(tmp_path):
+    return esperas.HistogramasEspera(str(tmp_path / 'esperas.json'))
+
+
+def test_etapa_com_amostras_usa_o_timeout_aprendido(histogramas):
+    for _ in range(esperas.MIN_AMOSTRAS):
+        histogramas.registrar('tiny|lista', 0.4)
+
+    timeout, poll = histogramas.parametros('tiny|lista', 10)
+
+    assert timeout == 0.5 * esperas.MARGEM + esperas.FOLGA
+    assert poll == 0.1
+
+
+def test_timeouts_recentes_voltam_ao_timeout_padrao_ate_a_taxa_baixar(histogramas):
+    for _ in range(esperas.MIN_AMOSTRAS):
+        histogramas.registrar('tiny|lista', 0.4)
+    for _ in range(esperas.MIN_TIMEOUTS):
+        histogramas.registrar_timeout('tiny|lista')
+
+    assert histogramas.parametros('tiny|lista', 10)[0] == 10
+    assert histogramas.parametros('tiny|outra', 10)[0] == 10  # Sem amostras
+
+    for _ in range(10):
+        histogramas.registrar('tiny|lista', 0.4)
+    assert histogramas.parametros('tiny|lista', 10)[0] == 0.5 * esperas.MARGEM + esperas.FOLGA
+
+
+def test_etapa_informada_separa_as_esperas_da_mesma_funcao(histogramas, monkeypatch):
+    monkeypatch.setattr(esperas, 'HISTOGRAMAS', histogramas)
+
+    def esperar_duas_vezes(driver):
+        esperas.EsperaAdaptativa(driver, 5, 'tiny', 'lista_anterior').until(lambda d: True)
+        esperas.EsperaAdaptativa(driver, 10, 'tiny').until(lambda d: True)
+
+    esperar_duas_vezes(object())
+
+    assert set(histogramas.novas) == {'tiny|lista_anterior', 'tiny|esperar_duas_vezes'}
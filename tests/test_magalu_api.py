@@ -0,0 +1,63 @@
+# Importações
+import json
+from urllib.parse import parse_qs, urlparse
+from conftest import contar_limitador
+from libraries import magalu_api
+
+# Portfólio do vendedor: 5 SKUs, lidos em páginas de 2
+PORTFOLIO = [{'sku': 'A', 'status': 'active'}, {'sku': 'B', 'status': 'active'}, {'sku': 'C', 'status': 'inactive'},
+             {'sku': 'D', 'status': 'active'}, {'sku': 'E', 'status': 'active'}]
+
+
+def portal(status_patch=200, erros=None):
+    """Responde o portfólio paginado e a inativação, com os `erros` de cada SKU informados."""
+    def responder(metodo, caminho, corpo):
+        if metodo == 'GET':
+            params = parse_qs(urlparse(caminho).query)
+            inicio, limite = int(params['_offset'][0]), int(params['_limit'][0])
+            return 200, {'results': PORTFOLIO[inicio:inicio + limite]}
+        status = status_patch.pop(0) if isinstance(status_patch, list) else status_patch
+        return status, {'results': [{'sku': item['sku'], 'error': (erros or {}).get(item['sku'])}
+                                    for item in json.loads(corpo)]}
+    return responder
+
+
+def criar_api(servidor, **kwargs):
+    return magalu_api.MagaluAPI('token', url_api=servidor.url, requisicoes_por_minuto=6000,
+                                tamanho_pagina=2, espera_tentativa=0, **kwargs)
+
+
+def test_listar_skus_percorre_todas_as_paginas(servidor_http):
+    servidor = servidor_http(portal())
+
+    assert list(criar_api(servidor).listar_skus()) == ['A', 'B', 'C', 'D', 'E']
+    assert len(servidor.requisicoes) == 3
+
+
+def test_inativar_skus_separa_os_nao_encontrados_e_os_erros_do_lote(servidor_http):
+    servidor = servidor_http(portal(erros={'B': 'SKU bloqueado'}))
+
+    resultados = criar_api(servidor, tamanho_lote=2).inativar_skus(['A', 'B', 'C', 'D', 'X'])
+
+    assert resultados['A'] is None and resultados['D'] is None
+    assert 'SKU bloqueado' in resultados['B']
+    assert resultados['C'] is None  # Já estava inativo, não é enviado
+    assert resultados['X'] == magalu_api.NAO_ENCONTRADO
+    enviados = sorted(item['sku'] for metodo, _, corpo in servidor.requisicoes if metodo == 'PATCH'
+                      for item in json.loads(corpo))
+    assert enviados == ['A', 'B', 'D']
+
+
+def test_inativacao_repete_somente_os_erros_temporarios_pelo_limitador(servidor_http):
+    servidor = servidor_http(portal(status_patch=[429, 200]))
+    api = criar_api(servidor)
+    chamadas = contar_limitador(api)
+
+    assert api.inativar_lote(['A']) == {'A': None}
+    assert [metodo for metodo, _, _ in servidor.requisicoes] == ['PATCH', 'PATCH']
+    assert len(chamadas) == 2
+
+    servidor_erro = servidor_http(portal(status_patch=500))
+    resultado = criar_api(servidor_erro).inativar_lote(['A'])
+    assert '500' in resultado['A']
+    assert len(servidor_erro.requisicoes) == 1
@@ -0,0 +1,44 @@
+# Importações
+import pytest
+from conftest import contar_limitador
+from libraries import mercado_livre_api
+
+
+def criar_api(servidor):
+    return mercado_livre_api.MercadoLivreAPI('token', seller_id='1', url_api=servidor.url,
+                                             requisicoes_por_minuto=6000, espera_tentativa=0)
+
+
+def test_consultas_com_erro_temporario_sao_repetidas_pelo_limitador(servidor_http):
+    fila = [429, 500, 200]
+
+    def responder(metodo, caminho, corpo):
+        return fila.pop(0), {'results': ['MLB1'], 'paging': {'total': 1}}
+
+    servidor = servidor_http(responder)
+    api = criar_api(servidor)
+    chamadas = contar_limitador(api)
+
+    assert api.buscar_itens('A') == ['MLB1']
+    assert len(servidor.requisicoes) == 3
+    assert len(chamadas) == 3
+
+
+def test_alteracao_com_erro_do_servidor_nao_e_repetida(servidor_http):
+    servidor = servidor_http(lambda metodo, caminho, corpo: (500, {'message': 'erro'}))
+    api = criar_api(servidor)
+
+    with pytest.raises(RuntimeError, match='500'):
+        api.alterar_status('MLB1', 'paused')
+    assert len(servidor.requisicoes) == 1
+
+
+def test_alteracao_recusada_pelo_limite_e_repetida(servidor_http):
+    fila = [503, 200]
+    servidor = servidor_http(lambda metodo, caminho, corpo: (fila.pop(0), {}))
+    api = criar_api(servidor)
+    chamadas = contar_limitador(api)
+
+    api.alterar_status('MLB1', 'paused')
+    assert [metodo for metodo, _, _ in servidor.requisicoes] == ['PUT', 'PUT']
+    assert len(chamadas) == 2
@@ -0,0 +1,81 @@
+# Importações
+import sqlite3
+import pandas as pd
+import pytest
+from libraries import opencart_db
+
+
+@pytest.fixture
+def conexao():
+    conexao = sqlite3.connect(':memory:')
+    opencart_db.criar_tabelas_sqlite(conexao)
+    conexao.executemany("INSERT INTO oc_product_description (product_id, language_id, name, meta_title) VALUES (?, 2, ?, ?)",
+                        [(123, 'Produto A', 'Antigo'), (456, 'Produto B', '')])
+    conexao.executemany(
+        "INSERT INTO oc_product_special (product_id, customer_group_id, priority, price, date_start, date_end) VALUES (?, ?, ?, ?, ?, ?)",
+        [(123, 1, 1, 90.0, '0000-00-00', '0000-00-00'),
+         (123, 4, 1, 70.0, '2026-01-01', '2026-12-31'),  # Promoção de outro grupo, com data
+         (123, 2, 5, 60.0, '0000-00-00', '0000-00-00')])  # Promoção com outra prioridade
+    conexao.commit()
+    yield conexao
+    conexao.close()
+
+
+def planilha(**colunas):
+    return pd.DataFrame({coluna: pd.Series(valores, dtype='string') for coluna, valores in colunas.items()})
+
+
+def promocoes(conexao, product_id):
+    return sorted(conexao.execute("SELECT customer_group_id, priority, price, date_end FROM oc_product_special "
+                                  "WHERE product_id = ?", (product_id,)).fetchall())
+
+
+def test_aplicar_substitui_somente_as_promocoes_da_planilha(conexao):
+    df = planilha(**{'ID': ['123'], 'pessoa fisica': ['80,5'], 'pessoa juridica': ['75']})
+
+    opencart_db.OpencartDB(conexao).aplicar(df)
+
+    assert promocoes(conexao, 123) == [(1, 1, 80.5, '0000-00-00'),
+                                      (2, 1, 75.0, '0000-00-00'),
+                                      (2, 5, 60.0, '0000-00-00'),
+                                      (4, 1, 70.0, '2026-12-31')]
+
+
+def test_promocoes_iguais_nao_geram_alteracao(conexao):
+    df = planilha(**{'ID': ['123'], 'pessoa fisica': ['90']})
+
+    alteracoes = opencart_db.OpencartDB(conexao).planejar(df)
+
+    assert alteracoes.empty
+
+
+def test_ids_com_casa_decimal_e_invalidos_nao_interrompem_a_execucao(conexao):
+    df = planilha(**{'ID': ['123.0', None, 'abc', '456'], 'Meta titulo': ['Novo', 'X', 'Y', 'Outro']})
+
+    alteracoes = opencart_db.OpencartDB(conexao).aplicar(df)
+
+    assert alteracoes[alteracoes['campo'] == 'aviso']['novo'].tolist() == ['ID inválido']
+    titulos = dict(conexao.execute("SELECT product_id, meta_title FROM oc_product_description").fetchall())
+    assert titulos == {123: 'Novo', 456: 'Outro'}
+
+
+def test_dry_run_nao_grava(conexao):
+    df = planilha(**{'ID': ['456'], 'Meta titulo': ['Novo'], 'Padrão': ['produto-b']})
+
+    alteracoes = opencart_db.OpencartDB(conexao).aplicar(df, dry_run=True)
+
+    assert sorted(alteracoes['campo']) == ['keyword', 'meta_title']
+    assert conexao.execute("SELECT COUNT(*) FROM oc_seo_url").fetchone() == (0,)
+
+
+def test_precos_com_milhar_e_moeda_sao_convertidos_e_invalidos_viram_aviso(conexao):
+    df = planilha(**{'ID': ['123', '456'], 'pessoa fisica': ['1.234,56', 'abc'],
+                     'pessoa juridica': ['R$ 10,00', '20'], 'Meta titulo': [None, 'Novo']})
+
+    alteracoes = opencart_db.OpencartDB(conexao).aplicar(df)
+
+    avisos = alteracoes[alteracoes['campo'] == 'aviso']
+    assert avisos[['ID', 'novo']].values.tolist() == [[456, 'preço inválido: abc']]
+    assert promocoes(conexao, 123)[:2] == [(1, 1, 1234.56, '0000-00-00'), (2, 1, 10.0, '0000-00-00')]
+    assert promocoes(conexao, 456) == [(2, 1, 20.0, '0000-00-00')]
+    assert conexao.execute("SELECT meta_title FROM oc_product_description WHERE product_id = 456").fetchone() == ('Novo',)
@@ -0,0 +1,61 @@
+# Importações
+from urllib.parse import parse_qs, urlparse
+from libraries import opencart_http
+
+FORMULARIO = """
+<form id="form-product" action="index.php?route=catalog/product/edit&amp;product_id=42" method="post">
+  <input type="text" name="product_description[2][name]" value="Furadeira" />
+  <input type="text" name="product_description[2][meta_title]" value="Antigo" />
+  <textarea name="product_description[2][description]">Texto &amp; mais</textarea>
+  <select name="status"><option value="0">Não</option><option value="1" selected>Sim</option></select>
+  <input type="checkbox" name="product_category[]" value="7" checked />
+  <input type="checkbox" name="product_category[]" value="8" />
+  <input type="hidden" name="product_related[]" value="5" />
+</form>
+"""
+
+
+def painel(produtos_autocompletar):
+    """Responde o formulário do produto, o autocompletar e o salvamento do painel."""
+    def responder(metodo, caminho, corpo):
+        rota = parse_qs(urlparse(caminho).query).get('route', [''])[0]
+        if rota == 'catalog/product/autocomplete':
+            return 200, produtos_autocompletar
+        if metodo == 'GET' and rota == 'catalog/product/edit':
+            return 200, FORMULARIO
+        return 200, '<div class="alert alert-success">Sucesso</div>'
+    return responder
+
+
+def criar_cliente(servidor):
+    cliente = opencart_http.OpencartHTTP(url_admin=f'{servidor.url}index.php')
+    cliente.token = 'abc'
+    return cliente
+
+
+def test_busca_aceita_somente_o_nome_igual(servidor_http):
+    servidor = servidor_http(painel([{'product_id': '10', 'name': 'Furadeira 500W Bivolt'},
+                                     {'product_id': '11', 'name': 'Furadeira 500W'}]))
+    cliente = criar_cliente(servidor)
+
+    assert cliente.buscar_produto_id('furadeira 500w') == '11'
+    assert cliente.buscar_produto_id('Furadeira') is None
+
+
+def test_atualizar_produto_envia_o_formulario_com_somente_os_campos_alterados(servidor_http):
+    servidor = servidor_http(painel([{'product_id': '9', 'name': 'Serra Circular 1200W'}]))
+    cliente = criar_cliente(servidor)
+
+    cliente.atualizar_produto('42', meta_titulo='Novo', meta_descricao='nan',
+                              produtos_relacionados='1-Serra Circular 1200W\n2-Serra')
+
+    metodo, caminho, corpo = servidor.requisicoes[-1]
+    campos = parse_qs(corpo, keep_blank_values=True)
+    assert metodo == 'POST' and 'product_id=42' in caminho
+    assert campos['product_description[2][meta_title]'] == ['Novo']
+    assert campos['product_description[2][name]'] == ['Furadeira']
+    assert campos['product_description[2][description]'] == ['Texto & mais']
+    assert campos['status'] == ['1']
+    assert campos['product_category[]'] == ['7']
+    assert campos['product_related[]'] == ['5', '9']
+    assert 'product_description[2][meta_description]' not in campos
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from libraries.planilhas import ler_planilha, ler_planilha_em_lotes
+
+
+def _planilha(tmp_path):
+    """Planilha com uma linha vazia no meio, IDs só inteiros no primeiro lote e com célula vazia no segundo."""
+    caminho = tmp_path / 'produtos.xlsx'
+    pd.DataFrame({
+        'ID': [123, 456, None, 789, None],
+        'sku': ['A1', 'A2', None, 'A3', 'A4'],
+    }).to_excel(caminho, index=False)
+    return str(caminho)
+
+
+def test_lotes_tem_o_mesmo_texto_nas_colunas_de_texto(tmp_path):
+    caminho = _planilha(tmp_path)
+    lotes = list(ler_planilha_em_lotes(caminho, tipos={'ID': 'string'}, tamanho_lote=2, cache=False))
+
+    ids = pd.concat(lotes)['ID']
+    assert list(ids.dropna()) == ['123', '456', '789']
+
+
+def test_linhas_vazias_do_meio_sao_mantidas(tmp_path):
+    caminho = _planilha(tmp_path)
+    df = ler_planilha(caminho, cache=False)
+
+    esperado = pd.read_excel(caminho)
+    assert len(df) == len(esperado) == 5
+    assert df['sku'].isna().tolist() == esperado['sku'].isna().tolist()
+
+
+def test_linhas_vazias_do_final_sao_descartadas(tmp_path):
+    from openpyxl import load_workbook
+
+    caminho = _planilha(tmp_path)
+    livro = load_workbook(caminho)
+    livro.active.cell(row=10, column=1).number_format = '0'  # Linha formatada, mas sem valor
+    livro.save(caminho)
+
+    assert len(ler_planilha(caminho, cache=False)) == len(pd.read_excel(caminho)) == 5
+
+
+def test_compactar_mantem_a_planilha_original_se_a_gravacao_falhar(tmp_path, monkeypatch):
+    from libraries.planilhas import DiarioStatus
+
+    caminho = _planilha(tmp_path)
+    original = (tmp_path / 'produtos.xlsx').read_bytes()
+    df = ler_planilha(caminho, cache=False)
+    diario = DiarioStatus(df, caminho)
+
+    def falhar(self, destino, **kwargs):
+        open(destino, 'wb').write(b'incompleto')
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(pd.DataFrame, 'to_excel', falhar)
+    with pytest.raises(KeyboardInterrupt):
+        diario.compactar()
+    monkeypatch.undo()
+
+    assert (tmp_path / 'produtos.xlsx').read_bytes() == original
+    assert sorted(arquivo.name for arquivo in tmp_path.iterdir()) == ['produtos.xlsx', 'produtos.xlsx.diario']
+    diario.arquivo.close()
@@ -0,0 +1,54 @@
+# Importações
+import json
+from urllib.parse import parse_qs
+import pandas as pd
+import pytest
+from conftest import contar_limitador
+from libraries import tiny_api
+
+
+def respostas(*status):
+    """Responde, em ordem, os `status` informados (o último se repete) com o retorno OK da API."""
+    fila = list(status)
+
+    def responder(metodo, caminho, corpo):
+        return (fila.pop(0) if len(fila) > 1 else fila[0]), {'retorno': {'status': 'OK'}}
+    return responder
+
+
+def criar_api(servidor):
+    return tiny_api.TinyAPI('token', url_api=servidor.url, requisicoes_por_minuto=6000, espera_tentativa=0)
+
+
+def test_erros_temporarios_sao_repetidos_pelo_limitador(servidor_http):
+    servidor = servidor_http(respostas(503, 429, 200))
+    api = criar_api(servidor)
+    chamadas = contar_limitador(api)
+
+    assert api.requisitar(tiny_api.ENDPOINT_PRECOS, {'precos': []}) == {'status': 'OK'}
+    assert len(servidor.requisicoes) == 3
+    assert len(chamadas) == 3
+
+
+def test_erro_do_servidor_nao_repete_a_alteracao(servidor_http):
+    servidor = servidor_http(respostas(500, 200))
+    api = criar_api(servidor)
+
+    with pytest.raises(RuntimeError):
+        api.requisitar(tiny_api.ENDPOINT_PRECOS, {'precos': []})
+    assert len(servidor.requisicoes) == 1
+
+
+def test_produtos_sem_preco_nao_sao_enviados_e_voltam_com_erro(servidor_http):
+    servidor = servidor_http(respostas(200))
+    api = criar_api(servidor)
+    df = pd.DataFrame({'ID': ['1', '2'], 'SKU': ['A', 'B'],
+                       'Preço': [10.0, None], 'Preço promocional': [None, None]})
+
+    resultados = api.atualizar_precos_df(df)
+
+    assert resultados['A'] is None
+    assert 'Preço vazio' in resultados['B']
+    enviados = [preco['id'] for _, _, corpo in servidor.requisicoes
+                for preco in json.loads(parse_qs(corpo)['data'][0])['precos']]
+    assert enviados == ['1']